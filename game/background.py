@@ -41,7 +41,9 @@ class ParallaxBackground:
                 return None
                 
             try:
-                img = pygame.image.load(path).convert_alpha()
+                img = pygame.image.load(path)
+                if pygame.display.get_surface(): # No display surface with the texture backend
+                    img = img.convert_alpha()
                 return img  # Return original, don't scale yet
             except Exception as e:
                 print(f"Error loading {path}: {e}")
@@ -105,8 +107,10 @@ class ParallaxBackground:
             scaled.set_alpha(60)
             self._composited_clouds.blit(scaled, (0, 0))
         
-        # Convert to non-alpha surface for faster blitting during gameplay
-        self._composited_clouds = self._composited_clouds.convert()
+        # Copy to a non-alpha surface (display format when there is one) for faster blitting during gameplay
+        opaque = pygame.Surface((target_w, target_h))
+        opaque.blit(self._composited_clouds, (0, 0))
+        self._composited_clouds = opaque
 
     def update(self, velocity_x):
         """
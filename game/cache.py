@@ -0,0 +1,83 @@
+import pygame
+import random
+import zlib
+from collections import OrderedDict
+from contextlib import contextmanager
+from .settings import SPRITE_COLORKEY
+
+# Randomness for drawing only (shake, shiver, variant picks), apart from the global random the
+# game plays with, so drawing never changes how play goes (replays reseed it, see replay.play)
+draw_random = random.Random()
+
+@contextmanager
+def baking(key):
+    """draw_random rolls from a stream seeded by key inside (a cache entry bakes the same whenever
+    it's first drawn) and carries on where it was after"""
+    state = draw_random.getstate()
+    draw_random.seed(zlib.crc32(repr(key).encode()))
+    try:
+        yield
+    finally:
+        draw_random.setstate(state)
+
+def surface_bytes(surf):
+    """Approximate pixel memory held by a surface"""
+    return surf.get_width() * surf.get_height() * surf.get_bytesize()
+
+def display_format(surf):
+    """surf converted to the display's pixel format for fast blits (keeping per-pixel alpha if it has it)"""
+    # Converting needs a display, headless callers keep the plain surface
+    if pygame.display.get_surface():
+        return surf.convert_alpha() if surf.get_flags() & pygame.SRCALPHA else surf.convert()
+    return surf
+
+def make_sprite_surface(width, height):
+    """Creates a transparent (colorkeyed) surface for baking static visuals"""
+    surf = pygame.Surface((max(1, width), max(1, height)))
+    surf.fill(SPRITE_COLORKEY)
+    surf = display_format(surf)
+    surf.set_colorkey(SPRITE_COLORKEY, pygame.RLEACCEL)
+    return surf
+
+class SurfaceCache:
+    """LRU cache of rendered surfaces, evicting oldest entries past a byte budget"""
+    def __init__(self, budget_bytes):
+        self.budget_bytes = budget_bytes
+        self.entries = OrderedDict() # key -> (surface, bytes)
+        self.used_bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def get(self, key):
+        entry = self.entries.get(key)
+        if entry is None:
+            self.misses += 1
+            return None
+        self.entries.move_to_end(key)
+        self.hits += 1
+        return entry[0]
+
+    def put(self, key, surf):
+        if key in self.entries:
+            self.used_bytes -= self.entries.pop(key)[1]
+        size = surface_bytes(surf)
+        self.entries[key] = (surf, size)
+        self.used_bytes += size
+        self._evict()
+        return surf
+
+    def _evict(self):
+        # Never drop the entry that was just added, even if it alone is over budget
+        while self.used_bytes > self.budget_bytes and len(self.entries) > 1:
+            _, (_, size) = self.entries.popitem(last=False)
+            self.used_bytes -= size
+            self.evictions += 1
+
+    def set_budget(self, budget_bytes):
+        self.budget_bytes = budget_bytes
+        self._evict()
+
+    def clear(self):
+        self.entries.clear()
+        self.used_bytes = 0
@@ -0,0 +1,43 @@
+import pygame
+from .settings import *
+from .cache import SurfaceCache, display_format
+
+# Menu / overlay chrome, keyed by size (see rounded_panel and tint)
+chrome_cache = SurfaceCache(CHROME_CACHE_BUDGET_MB * 1024 * 1024)
+
+def rounded_panel(size, alpha=180, scale=1.0):
+    """Dark semi-transparent panel with soft rounded edges, padded by panel_pad(scale) on every side"""
+    key = ('panel', tuple(size), alpha, scale)
+    panel = chrome_cache.get(key)
+    if panel is None:
+        width, height = size
+        pad = panel_pad(scale)
+        panel = pygame.Surface((width + pad * 2, height + pad * 2), pygame.SRCALPHA)
+
+        # Draw multiple rectangles for soft edge effect
+        for i in range(5):
+            expand = max(1, round((5 - i) * 8 * scale))
+            panel_alpha = alpha // (6 - i)
+            inner_rect = pygame.Rect(pad - expand//2, pad - expand//2, width + expand, height + expand)
+            pygame.draw.rect(panel, (0, 0, 0, panel_alpha), inner_rect, border_radius=max(1, round(15 * scale)))
+
+        # Core solid panel
+        core_rect = pygame.Rect(pad, pad, width, height)
+        pygame.draw.rect(panel, (0, 0, 0, alpha), core_rect, border_radius=max(1, round(10 * scale)))
+        panel = chrome_cache.put(key, display_format(panel))
+    return panel
+
+def panel_pad(scale=1.0):
+    """Soft edge around a rounded_panel"""
+    return max(1, round(20 * scale))
+
+def tint(size, alpha):
+    """Solid black surface of size dimmed to alpha (shared, blit it right away)"""
+    key = ('tint', tuple(size))
+    surf = chrome_cache.get(key)
+    if surf is None:
+        surf = pygame.Surface(size)
+        surf.fill((0, 0, 0))
+        surf = chrome_cache.put(key, display_format(surf))
+    surf.set_alpha(alpha)
+    return surf
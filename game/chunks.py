@@ -0,0 +1,83 @@
+import pygame
+import math
+from .settings import *
+from .cache import SurfaceCache
+from .sprites import make_sprite_surface
+
+class ChunkRenderer:
+    """Streams the static level layers (platforms, spikes) as cached world chunks"""
+    def __init__(self, level_index):
+        self.level_index = level_index
+        self.size = CHUNK_SIZE
+        self.cache = SurfaceCache(CHUNK_BUDGET_MB * 1024 * 1024)
+        self.empty = set() # Chunks known to hold nothing for a mode
+        self.rendered = 0 # Chunks rendered so far (debug line)
+
+    def _objects(self, layer, rect, is_white_mode):
+        """Static objects of a layer touching rect that are visible in this mode"""
+        if layer == 'platforms':
+            objs = [p for p in self.level_index.platforms.query(rect) if not p.is_slider]
+        else:
+            objs = self.level_index.spikes.query(rect)
+        return [o for o in objs if o.is_active(is_white_mode)]
+
+    def _render_chunk(self, key):
+        layer, cx, cy, is_white_mode = key
+        rect = pygame.Rect(cx * self.size, cy * self.size, self.size, self.size)
+        objs = self._objects(layer, rect, is_white_mode)
+        if not objs:
+            self.empty.add(key)
+            return None
+
+        # Everything static is already a baked sprite, so composing is exact
+        chunk = make_sprite_surface(self.size, self.size)
+        for obj in objs:
+            obj.draw(chunk, is_white_mode, offset=rect.topleft)
+        self.rendered += 1
+        return self.cache.put(key, chunk)
+
+    def _chunk_range(self, rect):
+        return (range(math.floor(rect.top / self.size), math.floor((rect.bottom - 1) / self.size) + 1),
+                range(math.floor(rect.left / self.size), math.floor((rect.right - 1) / self.size) + 1))
+
+    def ensure_budget(self, view_w, view_h):
+        """Keeps the budget above what one screen (plus the prefetch ring) needs"""
+        cols = math.ceil(view_w / self.size) + 3
+        rows = math.ceil(view_h / self.size) + 3
+        needed = cols * rows * self.size * self.size * 4
+        if needed > self.cache.budget_bytes:
+            self.cache.set_budget(needed)
+
+    def draw(self, surface, layer, is_white_mode, view_x, view_y):
+        """Blits the chunks of a layer covering the surface, returns the count drawn"""
+        view = pygame.Rect(view_x, view_y, surface.get_width(), surface.get_height())
+        self.ensure_budget(view.width, view.height)
+
+        drawn = 0
+        rows, cols = self._chunk_range(view)
+        for cy in rows:
+            for cx in cols:
+                key = (layer, cx, cy, is_white_mode)
+                if key in self.empty:
+                    continue
+                chunk = self.cache.get(key)
+                if chunk is None:
+                    chunk = self._render_chunk(key)
+                    if chunk is None:
+                        continue
+                surface.blit(chunk, (cx * self.size - view_x, cy * self.size - view_y))
+                drawn += 1
+
+        # Warm up to a few chunks just outside the view so scrolling doesn't hitch
+        budget = CHUNK_PREFETCH_PER_FRAME
+        rows, cols = self._chunk_range(view.inflate(self.size * 2, self.size * 2))
+        for cy in rows:
+            for cx in cols:
+                if budget <= 0:
+                    return drawn
+                key = (layer, cx, cy, is_white_mode)
+                if key in self.empty or key in self.cache.entries:
+                    continue
+                self._render_chunk(key)
+                budget -= 1
+        return drawn
@@ -1,8 +1,94 @@
 import pygame
 import math
-import random
+import numpy as np
 from .settings import *
-from .sprites import Projectile
+from .sprites import make_sprite_surface
+from .cache import SurfaceCache, draw_random, baking
+from .particles import ParticleSystem, CUSTOM
+
+# Baked ShadowSelf robe/head frames (see ShadowSelf._body_frame)
+shadow_frame_cache = SurfaceCache(SHADOW_ATLAS_BUDGET_MB * 1024 * 1024)
+_shadow_hats = {} # (mode, variant) -> (sprite, anchor_x, anchor_y)
+_flame_stamps = {} # (kind, mode, size, variant) -> (sprite, anchor_x, anchor_y)
+_eye_glow_surface = None
+_EYE_GLOW_RADIUS = 35 # Outermost glow ring of the boss eye
+
+def _boss_shiver_point(x, y, intensity=0.8):
+    """Shiver Effect (like protagonist), a bit stronger on the boss"""
+    shake_amp = 4.0 * intensity
+    dx = (draw_random.random() - 0.5) * shake_amp
+    dy = (draw_random.random() - 0.5) * shake_amp
+    return (x + dx, y + dy)
+
+def _draw_flame(target, kind, px, py, size, flame_color, flame_glow):
+    """One boss flame tongue based at (px, py): 'back' ones have an inner glow, 'front' ones are smaller"""
+    if kind == 'back':
+        # Draw flame shape (triangle pointing up)
+        flame_pts = [
+            (px, py - size),
+            (px - size * 0.6, py + size * 0.5),
+            (px + size * 0.6, py + size * 0.5)
+        ]
+        flame_pts = [_boss_shiver_point(pt[0], pt[1], 0.5) for pt in flame_pts]
+        pygame.draw.polygon(target, flame_color, flame_pts)
+        # Inner glow
+        inner_pts = [
+            (px, py - size * 0.6),
+            (px - size * 0.3, py + size * 0.3),
+            (px + size * 0.3, py + size * 0.3)
+        ]
+        pygame.draw.polygon(target, flame_glow, inner_pts)
+    else:
+        flame_pts = [
+            (px, py - size),
+            (px - size * 0.5, py + size * 0.4),
+            (px + size * 0.5, py + size * 0.4)
+        ]
+        flame_pts = [_boss_shiver_point(pt[0], pt[1], 0.3) for pt in flame_pts]
+        pygame.draw.polygon(target, flame_color, flame_pts)
+
+def _flame_stamp(kind, is_white_mode, size, flame_color, flame_glow):
+    """Returns (sprite, anchor_x, anchor_y) of a pre-rendered flame, sizes rounded to whole pixels"""
+    size = int(round(size))
+    key = (kind, is_white_mode, size, draw_random.randrange(SHADOW_ATLAS_VARIANTS))
+    entry = _flame_stamps.get(key)
+    if entry is None:
+        # Room for the triangle plus its shiver
+        anchor_x = math.ceil(size * 0.6) + 3
+        anchor_y = size + 3
+        sprite = make_sprite_surface(anchor_x * 2, anchor_y + math.ceil(size * 0.5) + 3)
+        with baking(key):
+            _draw_flame(sprite, kind, anchor_x, anchor_y, size, flame_color, flame_glow)
+        entry = _flame_stamps[key] = (sprite, anchor_x, anchor_y)
+    return entry
+
+def _draw_eye_glow(target, x, y):
+    """The boss's single red eye: stacked glow rings, iris, hot core and glint"""
+    eye_radius = 20  # Large single eye
+    
+    # Outer glow
+    for i in range(5):
+        glow_r = eye_radius + 15 - i * 3
+        glow_alpha = min(255, 60 + i * 40)
+        pygame.draw.circle(target, (glow_alpha, 10, 10), (x, y), glow_r)
+    
+    # Main eye (bright red, always)
+    pygame.draw.circle(target, (255, 50, 50), (x, y), eye_radius)
+    
+    # Inner hot core
+    pygame.draw.circle(target, (255, 150, 80), (x, y), int(eye_radius * 0.5))
+    
+    # White glint
+    pygame.draw.circle(target, (255, 255, 255), (x - 5, y - 5), 4)
+
+def _eye_glow():
+    """The eye glow baked once into a single sprite centered on the eye"""
+    global _eye_glow_surface
+    if _eye_glow_surface is None:
+        size = _EYE_GLOW_RADIUS * 2 + 1
+        _eye_glow_surface = make_sprite_surface(size, size)
+        _draw_eye_glow(_eye_glow_surface, _EYE_GLOW_RADIUS, _EYE_GLOW_RADIUS)
+    return _eye_glow_surface
 
 class MirrorRonin:
     def __init__(self, x, y):
@@ -28,8 +114,6 @@ class MirrorRonin:
         
         # Visual State
         self.anim_timer = 0.0
-        
-        self.pending_projectiles = []
 
     def get_rect(self):
         return pygame.Rect(self.x, self.y, self.width, self.height)
@@ -51,7 +135,9 @@ class MirrorRonin:
         if self.health <= 0:
             self.marked_for_deletion = True
 
-    def update(self, player, platforms, offset=(0,0)):
+    def update(self, player, solids, projectiles, offset=(0,0)):
+        """solids: collision index of the level's platforms (LevelIndex.solids), projectiles: the world's
+        ProjectilePool its shots go into"""
         self.anim_timer += 0.1
         
         # Decrement damage cooldown
@@ -65,12 +151,11 @@ class MirrorRonin:
         
         # Platform Collision (Vertical)
         my_rect = self.get_rect()
-        for platform in platforms:
-            if platform.get_rect().colliderect(my_rect):
-                if self.vel_y > 0:
-                    self.y = platform.get_rect().top - self.height
-                    self.vel_y = 0
-                    self.on_ground = True
+        for platform in solids.query(my_rect):
+            if self.vel_y > 0:
+                self.y = platform.rect.top - self.height
+                self.vel_y = 0
+                self.on_ground = True
         
         # AI Logic - Only activate when player gets close enough
         dist_to_player = abs(self.x - player.x)
@@ -79,7 +164,7 @@ class MirrorRonin:
         
         if self.activated:
             if player.is_white:
-                self.behavior_white(player)
+                self.behavior_white(player, projectiles)
             else:
                 self.behavior_black(player)
         else:
@@ -96,8 +181,10 @@ class MirrorRonin:
             feet_y = self.y + self.height
             center_x = self.x + self.width / 2
             
-            for platform in platforms:
-                p_rect = platform.get_rect()
+            # Candidates around the feet, the checks below pick the exact one
+            near_feet = pygame.Rect(center_x - 12, feet_y - 7, 24, 14)
+            for platform in solids.query(near_feet):
+                p_rect = platform.rect
                 # Check vertical alignment (with small tolerance)
                 if abs(p_rect.top - feet_y) < 5:
                     # Check if we are horizontally within this platform (allowing to be on edge)
@@ -107,7 +194,7 @@ class MirrorRonin:
                         break
             
             if current_platform:
-                p_rect = current_platform.get_rect()
+                p_rect = current_platform.rect
                 
                 if self.vel_x < 0: # Moving Left
                     next_left = self.x + self.vel_x - look_ahead
@@ -132,7 +219,7 @@ class MirrorRonin:
         # Apply Horizontal Move
         self.x += self.vel_x
 
-    def behavior_white(self, player):
+    def behavior_white(self, player, projectiles):
         # DOUBT: Evasive, Ranged
         # Move AWAY from player if close
         dist_x = self.x - player.x
@@ -166,8 +253,7 @@ class MirrorRonin:
             # Enemy projectile
             # is_white_source=True means it spawns as BLACK (Ink), which is what we want for the shadow enemy on white bg.
             # is_player_shot=False ensures it doesn't hurt the enemy.
-            proj = Projectile(cx, cy, vx, vy, is_white_source=True, is_player_shot=False)
-            self.pending_projectiles.append(proj)
+            projectiles.spawn(cx, cy, vx, vy, is_white_source=True, is_player_shot=False)
 
     def behavior_black(self, player):
         # RAGE: Aggressive, Melee
@@ -208,8 +294,8 @@ class MirrorRonin:
             # White Mode: Shadow/Doubt (Glitchy Black Ghost)
             color = (50, 50, 50, 150) # Semi transparent
             # Draw Glitchy Rect
-            off_x = random.randint(-2, 2)
-            off_y = random.randint(-2, 2)
+            off_x = draw_random.randint(-2, 2)
+            off_y = draw_random.randint(-2, 2)
             # Create a rect surface for transparency? or just rect
             # standard rect handles alpha if surface has alpha? No, need surface.
             # Simplified:
@@ -265,30 +351,19 @@ class ShadowSelf:
         self.anim_timer = 0.0
         self.rage_intensity = 1.0  # Always in rage mode
         
-        # Flame particles
-        self.flame_particles = []
-        for _ in range(30):
-            self.flame_particles.append({
-                'x': random.uniform(-self.width/2, self.width/2),
-                'y': random.uniform(-self.height*0.3, self.height*0.5),
-                'vx': random.uniform(-1, 1),
-                'vy': random.uniform(-3, -1),
-                'life': random.uniform(0.5, 1.0),
-                'size': random.uniform(8, 20)
-            })
-        
-        # Ink drip particles
-        self.ink_drips = []
-        for _ in range(15):
-            self.ink_drips.append({
-                'x': random.uniform(-self.width/2, self.width/2),
-                'y': self.height * 0.4,
-                'vy': random.uniform(1, 3),
-                'life': random.uniform(0.5, 1.0),
-                'size': random.uniform(3, 8)
-            })
-        
-        self.pending_projectiles = []
+        # Flame particles, in boss-local coordinates (drawn by ShadowSelf.draw)
+        self.flames = ParticleSystem(30)
+        self._emit_flames(30, -self.height*0.3)
+
+    def _emit_flames(self, count, top_y):
+        """Spawns flames into the free slots, each burning out over its life (size * life shrinks to 0)"""
+        life = np.random.uniform(0.5, 1.0, count)
+        size = np.random.uniform(8, 20, count)
+        self.flames.emit(count, CUSTOM, ttl=np.ceil(life / 0.02) - 1,
+                         x=np.random.uniform(-self.width/2, self.width/2, count),
+                         y=np.random.uniform(top_y, self.height*0.5, count),
+                         vx=np.random.uniform(-1, 1, count), vy=np.random.uniform(-3, -1, count),
+                         size=size * life, shrink=size * 0.02)
 
     def get_rect(self):
         return pygame.Rect(self.x, self.y, self.width, self.height)
@@ -316,7 +391,9 @@ class ShadowSelf:
         if self.health <= 0:
             self.marked_for_deletion = True
 
-    def update(self, player, platforms, offset=(0,0)):
+    def update(self, player, solids, projectiles, offset=(0,0)):
+        """solids: collision index of the level's platforms (LevelIndex.solids), projectiles: the world's
+        ProjectilePool its shots go into"""
         self.anim_timer += 0.1
         
         # Decrement damage cooldown
@@ -324,48 +401,27 @@ class ShadowSelf:
             self.melee_damage_cooldown -= 1
         self.on_ground = False
         
-        # Update flame particles
-        for p in self.flame_particles:
-            p['y'] += p['vy']
-            p['x'] += p['vx'] + math.sin(self.anim_timer * 0.5 + p['x']) * 0.5
-            p['life'] -= 0.02
-            if p['life'] <= 0:
-                # Reset particle
-                p['x'] = random.uniform(-self.width/2, self.width/2)
-                p['y'] = random.uniform(-self.height*0.2, self.height*0.5)
-                p['vx'] = random.uniform(-1, 1)
-                p['vy'] = random.uniform(-3, -1)
-                p['life'] = random.uniform(0.5, 1.0)
-                p['vx'] = random.uniform(-1, 1)
-                p['vy'] = random.uniform(-3, -1)
-                p['life'] = random.uniform(0.5, 1.0)
-                p['size'] = random.uniform(8, 20)
+        # Update flame particles (flicker sideways, then drift), burnt out ones are respawned
+        flames = self.flames
+        flames.x += np.sin(self.anim_timer * 0.5 + flames.x) * 0.5
+        flames.update()
+        burnt_out = flames.capacity - np.count_nonzero(flames.alive)
+        if burnt_out:
+            self._emit_flames(burnt_out, -self.height*0.2)
                 
         # Spawn Logic Removed (User Request)
         
-        # Update ink drips
-        for d in self.ink_drips:
-            d['y'] += d['vy']
-            d['life'] -= 0.01
-            if d['life'] <= 0 or d['y'] > self.height * 0.8:
-                d['x'] = random.uniform(-self.width/2, self.width/2)
-                d['y'] = self.height * 0.3
-                d['vy'] = random.uniform(1, 3)
-                d['life'] = random.uniform(0.5, 1.0)
-                d['size'] = random.uniform(3, 8)
-        
         # Basic Physics (Gravity)
         self.vel_y += self.gravity
         self.y += self.vel_y
         
         # Platform Collision (Vertical)
         my_rect = self.get_rect()
-        for platform in platforms:
-            if platform.get_rect().colliderect(my_rect):
-                if self.vel_y > 0:
-                    self.y = platform.get_rect().top - self.height
-                    self.vel_y = 0
-                    self.on_ground = True
+        for platform in solids.query(my_rect):
+            if self.vel_y > 0:
+                self.y = platform.rect.top - self.height
+                self.vel_y = 0
+                self.on_ground = True
         
         # AI Logic - Only activate when player gets close enough
         dist_to_player = abs(self.x - player.x)
@@ -374,7 +430,7 @@ class ShadowSelf:
         
         if self.activated:
             if player.is_white:
-                self.behavior_white(player)
+                self.behavior_white(player, projectiles)
             else:
                 self.behavior_black(player)
         else:
@@ -391,8 +447,9 @@ class ShadowSelf:
             check_point = (check_x, self.y + self.height + 2)
             
             ground_found = False
-            for platform in platforms:
-                if platform.get_rect().collidepoint(check_point):
+            probe = pygame.Rect(check_point[0] - 1, check_point[1] - 1, 3, 3)
+            for platform in solids.query(probe):
+                if platform.rect.collidepoint(check_point):
                     ground_found = True
                     break
             
@@ -401,7 +458,7 @@ class ShadowSelf:
             
         self.x += self.vel_x
 
-    def behavior_white(self, player):
+    def behavior_white(self, player, projectiles):
         # Slow menacing approach + ranged attacks
         dist_x = self.x - player.x
         
@@ -429,8 +486,7 @@ class ShadowSelf:
                 speed = 12
                 vx = math.cos(a) * speed
                 vy = math.sin(a) * speed
-                proj = Projectile(cx, cy, vx, vy, is_white_source=True, is_player_shot=False, visual_type="SHURIKEN")
-                self.pending_projectiles.append(proj)
+                projectiles.spawn(cx, cy, vx, vy, is_white_source=True, is_player_shot=False, visual_type="SHURIKEN")
 
     def behavior_black(self, player):
         # Aggressive chase
@@ -446,62 +502,11 @@ class ShadowSelf:
             
         self.facing = -1 if dist_x > 0 else 1
 
-    def draw(self, screen, is_white_mode, camera=None, offset=(0,0), scale=1.0):
-        ox, oy = offset
-        
-        cx = (self.x - ox) + self.width / 2
-        cy = (self.y - oy) + self.height / 2
-        
-        t = self.anim_timer
-        
-        # Colors based on player mode (inverted for contrast)
-        if is_white_mode:
-            fill_color = (20, 20, 20)  # Dark body
-            border_color = (240, 240, 230)  # Cream border
-            flame_color = (40, 40, 40)  # Black flames
-            flame_glow = (60, 60, 60)
-        else:
-            fill_color = (240, 240, 230)  # Cream body
-            border_color = (20, 20, 20)  # Dark border
-            flame_color = (255, 255, 250)  # White flames
-            flame_glow = (200, 200, 190)
-        
-        eye_color = (255, 50, 50)  # Red eye always
-        
-        # --- Helper: Shiver Effect (like protagonist) ---
-        def shiver_point(x, y, intensity=0.8):
-            shake_amp = 4.0 * intensity
-            dx = (random.random() - 0.5) * shake_amp
-            dy = (random.random() - 0.5) * shake_amp
-            return (x + dx, y + dy)
-        
-        # --- DRAW BURNING FLAMES (Behind character) ---
-        for p in self.flame_particles:
-            px = cx + p['x']
-            py = cy + p['y'] - self.height * 0.2
-            size = p['size'] * p['life']
-            
-            # Draw flame shape (triangle pointing up)
-            flame_pts = [
-                (px, py - size),
-                (px - size * 0.6, py + size * 0.5),
-                (px + size * 0.6, py + size * 0.5)
-            ]
-            flame_pts = [shiver_point(pt[0], pt[1], 0.5) for pt in flame_pts]
-            pygame.draw.polygon(screen, flame_color, flame_pts)
-            # Inner glow
-            inner_pts = [
-                (px, py - size * 0.6),
-                (px - size * 0.3, py + size * 0.3),
-                (px + size * 0.3, py + size * 0.3)
-            ]
-            pygame.draw.polygon(screen, flame_glow, inner_pts)
-        
-        # --- BODY (Floating Robes - EXACTLY like protagonist) ---
-        hover_y = math.sin(t * 0.1) * 5
-        
-        shoulder_y = cy - self.height * 0.25 + hover_y
-        feet_y = cy + self.height * 0.4 + hover_y
+    def _draw_body(self, target, cx, cy, t, tilt, fill_color):
+        """Robe and head around (cx, cy), cy already includes the hover"""
+        shiver_point = _boss_shiver_point
+        shoulder_y = cy - self.height * 0.25
+        feet_y = cy + self.height * 0.4
         
         body_top_w = self.width * 0.3
         body_bottom_w = self.width * 0.7
@@ -522,7 +527,7 @@ class ShadowSelf:
             wave_y = ripple * 0.5 + tatter * 0.5
             
             # Tilt based on movement
-            tilt_x = -self.vel_x * 2 * prog
+            tilt_x = -tilt * 2 * prog
             
             pt_x = base_x + tilt_x
             pt_y = feet_y + wave_y
@@ -531,36 +536,32 @@ class ShadowSelf:
         
         robe_pts.append(shiver_point(cx - body_top_w/2, shoulder_y))
         
-        pygame.draw.polygon(screen, fill_color, robe_pts)
+        pygame.draw.polygon(target, fill_color, robe_pts)
         
         # --- HEAD (same as protagonist) ---
         head_radius = self.width * 0.22
         head_cy = shoulder_y - head_radius * 0.6
-        head_cx = cx
         
         head_pts = []
         num_head_segments = 24
         for i in range(num_head_segments):
             angle = (i / num_head_segments) * 2 * math.pi
-            px = head_cx + math.cos(angle) * head_radius
+            px = cx + math.cos(angle) * head_radius
             py = head_cy + math.sin(angle) * head_radius
             head_pts.append(shiver_point(px, py))
         
-        pygame.draw.polygon(screen, fill_color, head_pts)
-        
-        # --- HAT (Conical - same as protagonist) ---
+        pygame.draw.polygon(target, fill_color, head_pts)
+
+    def _draw_hat(self, target, cx, hat_base_y, fill_color, border_color):
+        """Conical hat with its band, base centered on (cx, hat_base_y)"""
+        shiver_point = _boss_shiver_point
         hat_w = self.width * 1.3
         hat_h = self.height * 0.18
-        hat_base_y = head_cy
-        
-        # Object shake
-        obj_shake_x = (random.random() - 0.5) * 5
-        obj_shake_y = (random.random() - 0.5) * 2
         
         # Define base points
-        p1 = (cx - hat_w/2 + obj_shake_x, hat_base_y + obj_shake_y)
-        p2 = (cx + hat_w/2 + obj_shake_x, hat_base_y + obj_shake_y)
-        p3 = (cx + obj_shake_x, hat_base_y - hat_h + obj_shake_y)
+        p1 = (cx - hat_w/2, hat_base_y)
+        p2 = (cx + hat_w/2, hat_base_y)
+        p3 = (cx, hat_base_y - hat_h)
         
         hat_pts = []
         # Bottom edge (subdivided)
@@ -574,52 +575,117 @@ class ShadowSelf:
         # Top point
         hat_pts.append(shiver_point(p3[0], p3[1]))
         
-        pygame.draw.polygon(screen, fill_color, hat_pts)
+        pygame.draw.polygon(target, fill_color, hat_pts)
         
         # Hat Detail: Horizontal Band (same as protagonist)
-        band_y = hat_base_y - (hat_h * 0.3) + obj_shake_y
+        band_y = hat_base_y - (hat_h * 0.3)
         band_w = hat_w * 0.6
-        bx1 = cx - band_w/2 + obj_shake_x
-        bx2 = cx + band_w/2 + obj_shake_x
+        bp1 = shiver_point(cx - band_w/2, band_y)
+        bp2 = shiver_point(cx + band_w/2, band_y)
         
-        bp1 = shiver_point(bx1, band_y)
-        bp2 = shiver_point(bx2, band_y)
+        pygame.draw.line(target, border_color, bp1, bp2, 3)
+
+    def _body_frame(self, is_white_mode, fill_color):
+        """Returns (sprite, anchor_x, anchor_y) of the baked robe and head for the current animation state"""
+        # Hover is applied at blit time, so the cycle only has the cloth waves left
+        period = SHADOW_ATLAS_PERIOD
+        phase = int((self.anim_timer % period) / period * SHADOW_ATLAS_PHASES) % SHADOW_ATLAS_PHASES
+        # Chase / flee speeds are multiples of 0.5
+        tilt_step = int(round(self.vel_x * 2))
+        variant = draw_random.randrange(SHADOW_ATLAS_VARIANTS)
+        
+        key = (is_white_mode, tilt_step, phase, variant)
+        frame = shadow_frame_cache.get(key)
+        if frame is None:
+            # Robe hem, tilt and shiver below, head top above
+            anchor_x = self.width * 2 // 5 + abs(tilt_step)
+            anchor_y = self.height * 5 // 8
+            sprite = make_sprite_surface(anchor_x * 2, anchor_y + self.height // 2)
+            t = phase * period / SHADOW_ATLAS_PHASES
+            with baking(key):
+                self._draw_body(sprite, anchor_x, anchor_y, t, tilt_step / 2, fill_color)
+            frame = shadow_frame_cache.put(key, sprite)
+        return frame, frame.get_width() // 2, self.height * 5 // 8
+
+    def _hat_sprite(self, is_white_mode, fill_color, border_color):
+        """Returns (sprite, anchor_x, anchor_y) of a baked hat, anchored on its base center"""
+        key = (is_white_mode, draw_random.randrange(SHADOW_ATLAS_VARIANTS))
+        entry = _shadow_hats.get(key)
+        if entry is None:
+            anchor_x = int(self.width * 0.65) + 4
+            anchor_y = int(self.height * 0.18) + 4
+            sprite = make_sprite_surface(anchor_x * 2, anchor_y + 4)
+            with baking(key):
+                self._draw_hat(sprite, anchor_x, anchor_y, fill_color, border_color)
+            entry = _shadow_hats[key] = (sprite, anchor_x, anchor_y)
+        return entry
+
+    def draw(self, screen, is_white_mode, camera=None, offset=(0,0), scale=1.0):
+        ox, oy = offset
         
-        pygame.draw.line(screen, border_color, bp1, bp2, 3)
+        cx = (self.x - ox) + self.width / 2
+        cy = (self.y - oy) + self.height / 2
         
-        # --- SINGLE RED EYE (Centered, glowing) ---
-        eye_cx = head_cx + obj_shake_x
-        eye_cy = head_cy - head_radius * 0.1 + obj_shake_y
-        eye_radius = 20  # Large single eye
+        t = self.anim_timer
         
-        # Outer glow
-        for i in range(5):
-            glow_r = eye_radius + 15 - i * 3
-            glow_alpha = min(255, 60 + i * 40)
-            pygame.draw.circle(screen, (glow_alpha, 10, 10), 
-                             (int(eye_cx), int(eye_cy)), glow_r)
+        # Colors based on player mode (inverted for contrast)
+        if is_white_mode:
+            fill_color = (20, 20, 20)  # Dark body
+            border_color = (240, 240, 230)  # Cream border
+            flame_color = (40, 40, 40)  # Black flames
+            flame_glow = (60, 60, 60)
+        else:
+            fill_color = (240, 240, 230)  # Cream body
+            border_color = (20, 20, 20)  # Dark border
+            flame_color = (255, 255, 250)  # White flames
+            flame_glow = (200, 200, 190)
         
-        # Main eye (bright red)
-        pygame.draw.circle(screen, eye_color, (int(eye_cx), int(eye_cy)), eye_radius)
+        # --- DRAW BURNING FLAMES (Behind character) ---
+        flames = self.flames
+        stamps = []
+        for px, py, size in zip((cx + flames.x).tolist(), (cy + flames.y - self.height * 0.2).tolist(), flames.size.tolist()):
+            if SHADOW_ATLAS:
+                sprite, ax, ay = _flame_stamp('back', is_white_mode, size, flame_color, flame_glow)
+                stamps.append((sprite, (round(px) - ax, round(py) - ay)))
+            else:
+                _draw_flame(screen, 'back', px, py, size, flame_color, flame_glow)
+        screen.blits(stamps, doreturn=False)
         
-        # Inner hot core
-        pygame.draw.circle(screen, (255, 150, 80), (int(eye_cx), int(eye_cy)), int(eye_radius * 0.5))
+        # --- BODY (Floating Robes - EXACTLY like protagonist) ---
+        hover_y = math.sin(t * 0.1) * 5
         
-        # White glint
-        pygame.draw.circle(screen, (255, 255, 255), (int(eye_cx - 5), int(eye_cy - 5)), 4)
+        head_radius = self.width * 0.22
+        head_cy = cy - self.height * 0.25 + hover_y - head_radius * 0.6
+        
+        # Object shake (hat and eye move together)
+        obj_shake_x = (draw_random.random() - 0.5) * 5
+        obj_shake_y = (draw_random.random() - 0.5) * 2
+        
+        # --- SINGLE RED EYE (Centered, glowing) ---
+        eye_cx = cx + obj_shake_x
+        eye_cy = head_cy - head_radius * 0.1 + obj_shake_y
+        
+        if SHADOW_ATLAS:
+            sprite, ax, ay = self._body_frame(is_white_mode, fill_color)
+            screen.blit(sprite, (round(cx) - ax, round(cy + hover_y) - ay))
+            sprite, ax, ay = self._hat_sprite(is_white_mode, fill_color, border_color)
+            screen.blit(sprite, (round(cx + obj_shake_x) - ax, round(head_cy + obj_shake_y) - ay))
+            glow = _eye_glow()
+            screen.blit(glow, (int(eye_cx) - _EYE_GLOW_RADIUS, int(eye_cy) - _EYE_GLOW_RADIUS))
+        else:
+            self._draw_body(screen, cx, cy + hover_y, t, self.vel_x, fill_color)
+            self._draw_hat(screen, cx + obj_shake_x, head_cy + obj_shake_y, fill_color, border_color)
+            _draw_eye_glow(screen, int(eye_cx), int(eye_cy))
         
         # --- MORE FLAMES (In front, for layering) ---
-        for p in self.flame_particles[:15]:
-            px = cx + p['x'] * 0.7
-            py = cy + p['y'] * 0.4 - self.height * 0.1
-            size = p['size'] * p['life'] * 0.6
-            
+        stamps = []
+        front_x = (cx + flames.x[:15] * 0.7).tolist()
+        front_y = (cy + flames.y[:15] * 0.4 - self.height * 0.1).tolist()
+        for px, py, size in zip(front_x, front_y, (flames.size[:15] * 0.6).tolist()):
             if size > 3:
-                flame_pts = [
-                    (px, py - size),
-                    (px - size * 0.5, py + size * 0.4),
-                    (px + size * 0.5, py + size * 0.4)
-                ]
-                flame_pts = [shiver_point(pt[0], pt[1], 0.3) for pt in flame_pts]
-                pygame.draw.polygon(screen, flame_color, flame_pts)
-
+                if SHADOW_ATLAS:
+                    sprite, ax, ay = _flame_stamp('front', is_white_mode, size, flame_color, None)
+                    stamps.append((sprite, (round(px) - ax, round(py) - ay)))
+                else:
+                    _draw_flame(screen, 'front', px, py, size, flame_color, None)
+        screen.blits(stamps, doreturn=False)
@@ -0,0 +1,26 @@
+import pygame
+from .settings import *
+from .cache import SurfaceCache
+
+# Shared Font objects, keyed by (face, size)
+_fonts = {}
+
+# Rendered text surfaces, keyed by (face, text, size, color, antialias)
+text_cache = SurfaceCache(TEXT_CACHE_BUDGET_MB * 1024 * 1024)
+
+def get_font(face, size):
+    """Returns the shared Font for a face (None = default font) and size"""
+    key = (face, size)
+    font = _fonts.get(key)
+    if font is None:
+        font = pygame.font.Font(face, size)
+        _fonts[key] = font
+    return font
+
+def render_text(text, size, color, antialias=True, face=None):
+    """Renders text through the LRU cache (the surface is shared, copy before mutating it)"""
+    key = (face, text, size, tuple(color), antialias)
+    surf = text_cache.get(key)
+    if surf is None:
+        surf = text_cache.put(key, get_font(face, size).render(text, antialias, color))
+    return surf
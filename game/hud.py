@@ -0,0 +1,177 @@
+import pygame
+from .settings import *
+from .fonts import render_text
+from .enemy import ShadowSelf
+
+class HudLayer:
+    """Cached overlay of screen-space widgets, redrawn only when their inputs change"""
+    def __init__(self, size):
+        self.surface = pygame.Surface(size, pygame.SRCALPHA)
+        self.widgets = {} # name -> [state, rect, draw_fn]
+
+    def resize(self, size):
+        # Everything is redrawn on the next set() calls
+        self.surface = pygame.Surface(size, pygame.SRCALPHA)
+        self.widgets = {}
+
+    def set(self, name, state, draw_fn):
+        """Updates a widget; draw_fn(surface) draws it and returns its bounding rect, state None hides it"""
+        widget = self.widgets.get(name)
+        if widget and widget[0] == state:
+            return
+        if widget is None and state is None:
+            return
+
+        # Clear the old area, plus any neighbour overlapping it (redrawn below)
+        stale = {name}
+        area = widget[1] if widget else None
+        while area:
+            grown = None
+            for other, (_, rect, _) in self.widgets.items():
+                if other not in stale and rect.colliderect(area):
+                    stale.add(other)
+                    grown = (grown or area).union(rect)
+            if grown is None:
+                break
+            area = grown
+
+        for key in stale:
+            if key in self.widgets:
+                self.surface.fill((0, 0, 0, 0), self.widgets[key][1])
+
+        if state is None:
+            self.widgets.pop(name, None)
+        else:
+            self.widgets[name] = [state, None, draw_fn]
+
+        for key in stale:
+            if key in self.widgets:
+                entry = self.widgets[key]
+                entry[1] = entry[2](self.surface).clip(self.surface.get_rect())
+
+    def areas(self):
+        """Rects of the visible widgets (what composite covers)"""
+        return [rect for _, rect, _ in self.widgets.values()]
+
+    def composite(self, target):
+        """Blits every visible widget area onto target in one call"""
+        target.blits([(self.surface, rect.topleft, rect) for rect in self.areas()], doreturn=False)
+
+class GameHud(HudLayer):
+    """The in-game HUD: vitals, boss bar, status, FPS, tutorial hints and rage warning"""
+    def update(self, size, player, enemies, is_white_mode, fps=None, hints=None, rage_timer=0):
+        if size != self.surface.get_size():
+            self.resize(size)
+        sw, sh = size
+
+        # UI CONFIG
+        bar_width = 400
+        bar_height = 25
+        margin = 20
+
+        # INVERTED COLORS for UI
+        # White Mode (Light BG) -> Black UI
+        # Black Mode (Dark BG) -> White UI
+        ui_main_color = (0, 0, 0) if is_white_mode else (255, 255, 255)
+        ui_bg_color = (230, 230, 230) if is_white_mode else (30, 30, 30)
+
+        # 1. PLAYER HEALTH (Top Center)
+        p_pct = max(0, player.health / player.max_health)
+        fill_width = int(bar_width * p_pct)
+
+        def draw_vitals(surf):
+            p_x = sw // 2 - bar_width // 2
+            p_y = 40
+            label = render_text("VITALS", 24, ui_main_color)
+            label_rect = label.get_rect(midbottom=(sw // 2, p_y - 5))
+            surf.blit(label, label_rect)
+
+            # Bar Container (Empty part)
+            bar_rect = pygame.Rect(p_x, p_y, bar_width, bar_height)
+            pygame.draw.rect(surf, ui_bg_color, bar_rect)
+            # Bar Fill (Solid Color) - Shrinks
+            pygame.draw.rect(surf, ui_main_color, (p_x, p_y, fill_width, bar_height))
+            # Border
+            pygame.draw.rect(surf, ui_main_color, bar_rect, 2)
+            return bar_rect.union(label_rect)
+        self.set('vitals', (is_white_mode, fill_width), draw_vitals)
+
+        # 2. BOSS HEALTH (Top Right)
+        boss = None
+        if enemies:
+            for e in enemies:
+                if isinstance(e, ShadowSelf) and not e.marked_for_deletion and e.health > 0:
+                    boss = e
+                    break
+
+        boss_fill = int(bar_width * max(0, boss.health / 200.0)) if boss else None
+
+        def draw_boss(surf):
+            b_x = sw - bar_width - margin
+            b_y = margin
+            # Label "PROJECTION"
+            b_label = render_text("SHADOW", 24, (150, 150, 150))
+            b_rect = b_label.get_rect(topright=(sw - margin, b_y - 15))
+            surf.blit(b_label, b_rect)
+
+            bar_rect = pygame.Rect(b_x, b_y, bar_width, bar_height)
+            # Bar Background
+            pygame.draw.rect(surf, (20, 20, 20), bar_rect)
+            # Bar Fill (Grey)
+            pygame.draw.rect(surf, (180, 180, 180), (b_x, b_y, boss_fill, bar_height))
+            # Border
+            pygame.draw.rect(surf, (255, 255, 255), bar_rect, 1)
+            return bar_rect.union(b_rect)
+        self.set('boss', boss_fill, draw_boss)
+
+        # Mode Info (Bottom Left)
+        # Tiny, inconspicuous
+        mode_str = "PEACE" if is_white_mode else "CHAOS"
+
+        def draw_status(surf):
+            mode_text = render_text(f"STATUS: {mode_str}", 18, (100, 100, 100))
+            return surf.blit(mode_text, (margin, sh - margin - 10))
+        self.set('status', mode_str, draw_status)
+
+        # FPS Counter (Top Right under the boss bar), bucketed so it doesn't redraw every frame
+        fps_bucket = None if fps is None else int(fps) // HUD_FPS_BUCKET * HUD_FPS_BUCKET
+
+        def draw_fps(surf):
+            fps_color = (0, 255, 0) if fps_bucket >= 55 else (255, 255, 0) if fps_bucket >= 30 else (255, 0, 0)
+            fps_text = render_text(f"FPS: {fps_bucket}", 28, fps_color)
+            return surf.blit(fps_text, fps_text.get_rect(topright=(sw - 10, 70)))
+        self.set('fps', fps_bucket, draw_fps)
+
+        # Tutorial key legend (Top Left), rows of (key, label)
+        def draw_hints(surf):
+            bounds = pygame.Rect(15, 15, 0, 0)
+            for i, (key, label) in enumerate(hints):
+                y_pos = 15 + i * 35
+
+                # Key box (dark gray rounded rectangle)
+                key_text_surf = render_text(key, 26, (255, 255, 255))
+                key_width = key_text_surf.get_width() + 16
+                key_height = 26
+                key_rect = pygame.Rect(15, y_pos, key_width, key_height)
+
+                # Draw rounded key box
+                pygame.draw.rect(surf, (70, 70, 70), key_rect, border_radius=4)
+                pygame.draw.rect(surf, (100, 100, 100), key_rect, width=1, border_radius=4)
+
+                # Key text centered (white)
+                surf.blit(key_text_surf, (key_rect.x + 8, key_rect.y + 4))
+
+                # Label text (gray)
+                label_surf = render_text(label, 26, (150, 150, 150))
+                label_rect = surf.blit(label_surf, (key_rect.right + 12, y_pos + 4))
+                bounds.union_ip(key_rect.union(label_rect))
+            return bounds
+        self.set('hints', tuple(hints) if hints else None, draw_hints)
+
+        # UI Overlays (Forced Mode Warning)
+        rage_str = f"LOCKED IN RAGE: {rage_timer:.1f}s" if rage_timer > 0 else None
+
+        def draw_rage(surf):
+            alert = render_text(rage_str, 40, WHITE)
+            return surf.blit(alert, (sw // 2 - 150, 100))
+        self.set('rage', rage_str, draw_rage)
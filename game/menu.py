@@ -1,9 +1,13 @@
 import pygame
-import sys
 import math
-import random
+import itertools
+import numpy as np
 from .settings import *
 from .settings_manager import save_settings
+from .sprites import DotStamps
+from .present import render_scale_label, next_render_scale
+from .fonts import render_text
+from . import chrome
 
 class MainMenu:
     def __init__(self, screen, settings):
@@ -11,25 +15,12 @@ class MainMenu:
         if not pygame.font.get_init():
             pygame.font.init()
             
-        self.screen = screen
         self.settings = settings
-        self.width = SCREEN_WIDTH
-        self.height = SCREEN_HEIGHT
         self.state = "MAIN" # MAIN, OPTIONS
-        
-        # Fonts
-        try:
-            self.title_font = pygame.font.SysFont("Impact", 120)
-            self.menu_font = pygame.font.SysFont("Menlo", 40)
-            self.ui_font = pygame.font.SysFont("Menlo", 30) # Smaller for values
-        except:
-            self.title_font = pygame.font.SysFont(None, 120)
-            self.menu_font = pygame.font.SysFont(None, 40)
-            self.ui_font = pygame.font.SysFont(None, 30)
             
         # Menu Options
         self.options_main = ["NEW GAME", "CONTINUE", "OPTIONS", "QUIT"]
-        self.options_sub = ["FULLSCREEN", "RETICLE SENSITIVITY", "BACK"]
+        self.options_sub = ["FULLSCREEN", "RETICLE SENSITIVITY", "RENDER SCALE", "BACK"]
         
         self.selected_index = 0
         self.button_rects = []
@@ -39,32 +30,64 @@ class MainMenu:
         
         # Animated Dotted Background
         self.anim_time = 0.0
-        self.dot_grid = []
-        self.dot_spacing = 8  # Pixels between dots
         self.scroll_x = 0.0
         self.scroll_y = 0.0
         
-        # Pre-generate dot grid with noise values
-        cols = SCREEN_WIDTH // self.dot_spacing + 4
-        rows = SCREEN_HEIGHT // self.dot_spacing + 4
-        for y in range(rows):
-            row = []
-            for x in range(cols):
-                # Create pseudo-random noise pattern
-                noise = self._noise(x * 0.15, y * 0.15)
-                row.append({
-                    'base_size': 1 + noise * 3,  # Size 1-4
-                    'phase': random.uniform(0, math.pi * 2),
-                    'brightness': 80 + int(noise * 175)  # 80-255
-                })
-            self.dot_grid.append(row)
+        self.screen = None
+        self.resize(screen)
+        
+    def resize(self, screen):
+        """Lays the menu out natively for screen's resolution (call after the display mode changes)"""
+        self.screen = screen
+        self.width, self.height = screen.get_size()
+        # Layout is authored at SCREEN_WIDTH x SCREEN_HEIGHT and scaled uniformly, centered
+        self.ui_scale = min(self.width / SCREEN_WIDTH, self.height / SCREEN_HEIGHT)
+        
+        # Fonts: system faces (None, pygame's default, when missing) at this resolution's sizes;
+        # labels are rendered through fonts.render_text, panels and tints live in chrome.chrome_cache
+        self.title_face = pygame.font.match_font("Impact")
+        self.menu_face = pygame.font.match_font("Menlo")
+        self.title_size = self.px(120)
+        self.menu_size = self.px(40)
+        self.ui_size = self.px(30) # Smaller for values
+        
+        self.dot_spacing = max(8, round(8 * self.ui_scale))  # Pixels between dots
+        
+        # Pre-generate dot grid with noise values, flattened to one array entry per dot
+        cols = self.width // self.dot_spacing + 4
+        rows = self.height // self.dot_spacing + 4
+        grid_y, grid_x = np.mgrid[0:rows, 0:cols]
+        
+        # Only dots near the screen are ever drawn, drop the rest up front (no scroll offset)
+        x = grid_x * self.dot_spacing
+        y = grid_y * self.dot_spacing
+        margin = self.px(10)
+        on_screen = (x >= -margin) & (x <= self.width + margin) & (y >= -margin) & (y <= self.height + margin)
+        
+        # Create pseudo-random noise pattern
+        noise = self._noise(grid_x * 0.15, grid_y * 0.15)[on_screen]
+        self.dot_x = x[on_screen]
+        self.dot_y = y[on_screen]
+        self.dot_base_size = (1 + noise * 3) * self.ui_scale  # Size 1-4 (scaled)
+        self.dot_phase = np.random.uniform(0, math.pi * 2, noise.shape)
+        self.dot_brightness = 80 + (noise * 175).astype(np.int32)  # 80-255
+        self.dot_stamps = DotStamps(lambda b: (b, b, b), self.dot_spacing // 2)
+        
+        # Persistent layer holding the dots as last drawn (see draw_dotted_background)
+        self.dot_layer = None
+        self.dot_drawn_size = None
+        self.dot_cell = pygame.Surface((self.dot_spacing, self.dot_spacing), 0, screen) # Black eraser for one dot
+        
+    def px(self, value):
+        """Scales a length from the authored layout to this resolution"""
+        return max(1, int(round(value * self.ui_scale)))
         
     def _noise(self, x, y):
-        """Simple noise function for procedural generation"""
+        """Simple noise function for procedural generation (works on arrays too)"""
         # Combination of sin waves for organic look
-        n = math.sin(x * 1.5) * math.cos(y * 1.3) * 0.5
-        n += math.sin(x * 0.7 + y * 0.5) * 0.3
-        n += math.sin(x * 2.1 - y * 1.8) * 0.2
+        n = np.sin(x * 1.5) * np.cos(y * 1.3) * 0.5
+        n += np.sin(x * 0.7 + y * 0.5) * 0.3
+        n += np.sin(x * 2.1 - y * 1.8) * 0.2
         return (n + 1) / 2  # Normalize to 0-1
         
     def update(self, dt=1/60):
@@ -74,77 +97,68 @@ class MainMenu:
         
     def draw_dotted_background(self):
         """Draw animated dotted halftone background"""
-        for row_idx, row in enumerate(self.dot_grid):
-            for col_idx, dot in enumerate(row):
-                # Calculate fixed screen position (no scroll offset)
-                x = col_idx * self.dot_spacing
-                y = row_idx * self.dot_spacing
-                
-                # Skip if off screen
-                if x < -10 or x > self.width + 10 or y < -10 or y > self.height + 10:
-                    continue
-                
-                # Animate size with time (pulsing in place)
-                pulse = math.sin(self.anim_time * 0.8 + dot['phase']) * 0.3 + 0.7
-                size = max(1, int(dot['base_size'] * pulse))
-                
-                # Draw dot
-                brightness = dot['brightness']
-                color = (brightness, brightness, brightness)
-                pygame.draw.circle(self.screen, color, (x, y), size)
+        # Animate size with time (pulsing in place)
+        pulse = np.sin(self.anim_time * 0.8 + self.dot_phase) * 0.3 + 0.7
+        size = np.maximum(1, (self.dot_base_size * pulse).astype(np.int32))
+        
+        # Dots own disjoint spacing-sized cells, so only the ones whose size changed are restamped
+        if self.dot_layer is None:
+            self.dot_layer = pygame.Surface(self.screen.get_size(), 0, self.screen)
+            self.dot_layer.fill((0, 0, 0))
+            changed = np.ones(size.shape, dtype=bool)
+        else:
+            changed = size != self.dot_drawn_size
+        self.dot_drawn_size = size
+        
+        if changed.any():
+            x = self.dot_x[changed]
+            y = self.dot_y[changed]
+            half = self.dot_spacing // 2
+            cells = zip((x - half).tolist(), (y - half).tolist())
+            self.dot_layer.blits(zip(itertools.repeat(self.dot_cell), cells), doreturn=False)
+            self.dot_stamps.draw(self.dot_layer, x, y, size[changed], self.dot_brightness[changed])
+        
+        self.screen.blit(self.dot_layer, (0, 0))
     
     def draw_rounded_panel(self, rect, alpha=180):
         """Draw a dark semi-transparent panel with soft edges (Rounded)"""
-        # Create panel surface
-        panel = pygame.Surface((rect.width + 40, rect.height + 40), pygame.SRCALPHA)
-        
-        # Draw multiple rectangles for soft edge effect
-        for i in range(5):
-            expand = (5 - i) * 8
-            panel_alpha = alpha // (6 - i)
-            inner_rect = pygame.Rect(20 - expand//2, 20 - expand//2, 
-                                     rect.width + expand, rect.height + expand)
-            pygame.draw.rect(panel, (0, 0, 0, panel_alpha), inner_rect, border_radius=15)
-        
-        # Core solid panel
-        core_rect = pygame.Rect(20, 20, rect.width, rect.height)
-        pygame.draw.rect(panel, (0, 0, 0, alpha), core_rect, border_radius=10)
+        panel = chrome.rounded_panel(rect.size, alpha, self.ui_scale)
         
         # Blit panel centered on the rect
-        self.screen.blit(panel, (rect.x - 20, rect.y - 20))
+        pad = chrome.panel_pad(self.ui_scale)
+        self.screen.blit(panel, (rect.x - pad, rect.y - pad))
 
     def draw_bottom_tint(self, start_y, alpha=230):
         """Draw a full-width dark tint from start_y to bottom of screen"""
-        tint_surface = pygame.Surface((self.width, self.height - start_y), pygame.SRCALPHA)
-        tint_surface.fill((0, 0, 0, alpha))
-        self.screen.blit(tint_surface, (0, start_y))
+        self.screen.blit(chrome.tint((self.width, self.height - start_y), alpha), (0, start_y))
         
     def draw(self):
-        self.screen.fill((0, 0, 0)) # Pure Black Background
-        
-        # Draw dotted background first
+        if self.screen.get_size() != (self.width, self.height):
+            self.resize(self.screen)
         
+        # Draw dotted background first (it covers the whole screen)
         if self.state == "MAIN":
             self.draw_dotted_background()
             self.draw_list(self.options_main, "MONOMASK")
         elif self.state == "OPTIONS":
+            self.screen.fill((0, 0, 0)) # Pure Black Background
             self.draw_options_menu()
 
     def draw_list(self, options, title):
         # Calculate positions first
-        title_surf = self.title_font.render(title, True, (255, 255, 255))
+        title_surf = render_text(title, self.title_size, (255, 255, 255), face=self.title_face)
         title_rect = title_surf.get_rect(center=(self.width // 2, self.height // 3))
         
-        start_y = self.height // 2 + 50
-        gap = 70
+        start_y = self.height // 2 + self.px(50)
+        gap = self.px(70)
         
         # Calculate buttons area rect
         buttons_height = len(options) * gap
-        buttons_rect = pygame.Rect(self.width // 2 - 200, start_y - 30, 
-                                   400, buttons_height + 20)
+        buttons_rect = pygame.Rect(self.width // 2 - self.px(200), start_y - self.px(30), 
+                                   self.px(400), buttons_height + self.px(20))
         
         # Draw blur panels behind UI elements
-        self.draw_rounded_panel(title_rect.inflate(60, 30))
+        self.draw_rounded_panel(title_rect.inflate(self.px(60), self.px(30)))
         self.draw_rounded_panel(buttons_rect)
         
         # Draw Title
@@ -158,19 +172,19 @@ class MainMenu:
 
     def draw_options_menu(self):
         # Calculate positions first
-        title_surf = self.title_font.render("OPTIONS", True, (255, 255, 255))
+        title_surf = render_text("OPTIONS", self.title_size, (255, 255, 255), face=self.title_face)
         title_rect = title_surf.get_rect(center=(self.width // 2, self.height // 3))
         
-        start_y = self.height // 2 + 50
-        gap = 80 # Larger gap for UI elements
+        start_y = self.height // 2 + self.px(50)
+        gap = self.px(80) # Larger gap for UI elements
         
         # Calculate options area rect (wider for sliders)
         options_height = len(self.options_sub) * gap
-        options_rect = pygame.Rect(self.width // 2 - 450, start_y - 30, 
-                                   900, options_height + 20)
+        options_rect = pygame.Rect(self.width // 2 - self.px(450), start_y - self.px(30), 
+                                   self.px(900), options_height + self.px(20))
         
         # Draw blur panels
-        self.draw_rounded_panel(title_rect.inflate(60, 30))
+        self.draw_rounded_panel(title_rect.inflate(self.px(60), self.px(30)))
         # Use full bottom tint for options instead of rounded panel
         self.draw_bottom_tint(options_rect.top)
         
@@ -191,34 +205,36 @@ class MainMenu:
             # Fullscreen Toggle
             if option == "FULLSCREEN":
                 # Toggle Switch UI
-                switch_w = 60
-                switch_h = 30
-                switch_x = self.width // 2 + 350
+                switch_w = self.px(60)
+                switch_h = self.px(30)
+                switch_x = self.width // 2 + self.px(350)
                 switch_y = y_pos - switch_h // 2
                 
                 switch_rect = pygame.Rect(switch_x, switch_y, switch_w, switch_h)
+                knob_inset = self.px(15)
                 
                 # Draw Background Capsule
                 if self.settings["fullscreen"]:
                     # ON State: Filled White
-                    pygame.draw.rect(self.screen, (255, 255, 255), switch_rect, border_radius=15)
+                    pygame.draw.rect(self.screen, (255, 255, 255), switch_rect, border_radius=self.px(15))
                     # Knob: Black, Right Side
-                    pygame.draw.circle(self.screen, (0, 0, 0), (switch_x + switch_w - 15, switch_y + 15), 12)
+                    pygame.draw.circle(self.screen, (0, 0, 0), (switch_x + switch_w - knob_inset, switch_y + knob_inset), self.px(12))
                 else:
                     # OFF State: Outline White
-                    pygame.draw.rect(self.screen, (255, 255, 255), switch_rect, 2, border_radius=15)
+                    pygame.draw.rect(self.screen, (255, 255, 255), switch_rect, self.px(2), border_radius=self.px(15))
                     # Knob: White, Left Side
-                    pygame.draw.circle(self.screen, (255, 255, 255), (switch_x + 15, switch_y + 15), 10)
+                    pygame.draw.circle(self.screen, (255, 255, 255), (switch_x + knob_inset, switch_y + knob_inset), self.px(10))
             
             # Sensitivity Slider
             elif option == "RETICLE SENSITIVITY":
                 # Draw Slider Bar
-                slider_width = 200
-                slider_x = self.width // 2 + 350
+                slider_width = self.px(200)
+                slider_x = self.width // 2 + self.px(350)
                 slider_y = y_pos
+                bar_h = self.px(4)
                 
                 # Background Line
-                pygame.draw.rect(self.screen, (100, 100, 100), (slider_x, slider_y, slider_width, 4))
+                pygame.draw.rect(self.screen, (100, 100, 100), (slider_x, slider_y, slider_width, bar_h))
                 
                 # Handle Knob
                 # Range 0.2 to 3.0
@@ -226,11 +242,17 @@ class MainMenu:
                 normalized = (val - 0.2) / (3.0 - 0.2)
                 knob_x = slider_x + float(normalized * slider_width)
                 
-                pygame.draw.circle(self.screen, (255, 255, 255), (int(knob_x), int(slider_y + 2)), 10)
+                pygame.draw.circle(self.screen, (255, 255, 255), (int(knob_x), int(slider_y + bar_h // 2)), self.px(10))
                 
                 # Draw Value Text
-                val_surf = self.ui_font.render(f"{val:.1f}", True, (255, 255, 255))
-                self.screen.blit(val_surf, (slider_x + slider_width + 20, slider_y - 10))
+                val_surf = render_text(f"{val:.1f}", self.ui_size, (255, 255, 255), face=self.menu_face)
+                self.screen.blit(val_surf, (slider_x + slider_width + self.px(20), slider_y - self.px(10)))
+
+            # Render Scale (cycled with Enter / Left / Right)
+            elif option == "RENDER SCALE":
+                label = render_scale_label(self.settings.get("render_scale", 1.0))
+                val_surf = render_text(f"< {label} >", self.ui_size, (255, 255, 255), face=self.menu_face)
+                self.screen.blit(val_surf, val_surf.get_rect(midleft=(self.width // 2 + self.px(350), y_pos)))
 
     def draw_button(self, text, y_pos, is_selected, index):
         text_color = (255, 255, 255)
@@ -241,12 +263,12 @@ class MainMenu:
             bg_color = (255, 255, 255)
             
         # Render Text
-        surf = self.menu_font.render(text, True, text_color)
+        surf = render_text(text, self.menu_size, text_color, face=self.menu_face)
         rect = surf.get_rect(center=(self.width // 2, y_pos))
         
         # Draw Background if selected
         if bg_color:
-            bg_rect = rect.inflate(40, 20)
+            bg_rect = rect.inflate(self.px(40), self.px(20))
             pygame.draw.rect(self.screen, bg_color, bg_rect)
         
         # Draw Text
@@ -257,9 +279,7 @@ class MainMenu:
         
         # Grey out CONTINUE if no saved game (TUTORIAL is start)
         if text == "CONTINUE" and self.settings.get("current_level", "TUTORIAL") == "TUTORIAL":
-             s = pygame.Surface(rect.size, pygame.SRCALPHA)
-             s.fill((0,0,0, 180))
-             self.screen.blit(s, rect.topleft)
+             self.screen.blit(chrome.tint(rect.size, 180), rect.topleft)
 
     def handle_input(self, event):
         options = self.options_main if self.state == "MAIN" else self.options_sub
@@ -290,6 +310,10 @@ class MainMenu:
                     elif event.key == pygame.K_RIGHT:
                         self.settings["sensitivity"] = min(3.0, self.settings["sensitivity"] + 0.1)
                         save_settings(self.settings)
+                elif current_opt == "RENDER SCALE" and event.key in (pygame.K_LEFT, pygame.K_RIGHT):
+                    step = -1 if event.key == pygame.K_LEFT else 1
+                    self.settings["render_scale"] = next_render_scale(self.settings.get("render_scale", 1.0), step)
+                    save_settings(self.settings)
                         
         # Mouse input disabled - keyboard only
 
@@ -313,6 +337,11 @@ class MainMenu:
             save_settings(self.settings)
             return "toggle_fullscreen"
             
+        elif action == "RENDER SCALE":
+            self.settings["render_scale"] = next_render_scale(self.settings.get("render_scale", 1.0))
+            save_settings(self.settings)
+            return None
+            
         elif action == "BACK":
             self.state = "MAIN"
             self.selected_index = 0
@@ -0,0 +1,177 @@
+import pygame
+import math
+import numpy as np
+from .settings import *
+from .cache import make_sprite_surface, draw_random, baking
+
+# Particle kinds drawn by ParticleSystem.draw (others are drawn by their emitter)
+DISC = 0
+SHARD = 1
+CUSTOM = 2
+
+def _roll_shard_shape():
+    """Triangle shape offsets of a random shard"""
+    size = draw_random.randint(5, 12)
+    return [(draw_random.uniform(-size, size), draw_random.uniform(-size, size)) for _ in range(3)]
+
+# Random shard triangles, picked per particle instead of rolled per shard
+with baking('shard shapes'):
+    _shard_shapes = [_roll_shard_shape() for _ in range(SHARD_SHAPES)]
+_SHARD_RADIUS = 18 # Farthest a rotated shard vertex gets from its center (12 * sqrt(2), rounded up)
+
+class ParticleSystem:
+    """Fixed-capacity particle pool stored as parallel NumPy arrays, updated in one vectorized pass"""
+    def __init__(self, capacity=PARTICLE_CAPACITY):
+        self.capacity = capacity
+        self.alive = np.zeros(capacity, dtype=bool)
+        self.kind = np.zeros(capacity, dtype=np.int8)
+        self.color = np.zeros(capacity, dtype=np.int32) # Index into palette
+        self.shape = np.zeros(capacity, dtype=np.int32) # Shard triangle
+        self.ttl = np.zeros(capacity, dtype=np.int32) # Updates left, dies below 0
+        self.x = np.zeros(capacity)
+        self.y = np.zeros(capacity)
+        self.prev_x = np.zeros(capacity) # Position before the last update (for interpolated drawing)
+        self.prev_y = np.zeros(capacity)
+        self.vx = np.zeros(capacity)
+        self.vy = np.zeros(capacity)
+        self.drag = np.ones(capacity) # Velocity multiplier per update
+        self.gravity = np.zeros(capacity)
+        self.size = np.zeros(capacity)
+        self.decay = np.ones(capacity) # Size multiplier per update
+        self.shrink = np.zeros(capacity) # Size lost per update
+        self.alpha = np.zeros(capacity)
+        self.fade = np.zeros(capacity) # Alpha lost per update, dies at 0
+        self.angle = np.zeros(capacity)
+        self.spin = np.zeros(capacity)
+
+        self.palette = [] # color index -> RGB
+        self._palette_index = {}
+        self._stamps = {} # int stamp key -> (sprite, anchor) (see _stamp_keys)
+
+    def color_index(self, color):
+        color = tuple(color)
+        index = self._palette_index.get(color)
+        if index is None:
+            index = self._palette_index[color] = len(self.palette)
+            self.palette.append(color)
+        return index
+
+    def emit(self, count, kind=DISC, color=(255, 255, 255), ttl=1 << 30, x=0.0, y=0.0, vx=0.0, vy=0.0,
+             drag=1.0, gravity=0.0, size=1.0, decay=1.0, shrink=0.0, alpha=255.0, fade=0.0,
+             angle=0.0, spin=0.0, shape=0):
+        """Spawns up to count particles into free slots (lowest first), fields are scalars or arrays; returns the slots"""
+        slots = np.flatnonzero(~self.alive)[:count]
+        n = len(slots)
+        if n < count:
+            # Pool is full, drop the rest (rather than growing mid-fight)
+            def fit(value):
+                return value[:n] if isinstance(value, np.ndarray) else value
+            ttl, x, y, vx, vy, drag, gravity, size, decay, shrink, alpha, fade, angle, spin, shape = map(
+                fit, (ttl, x, y, vx, vy, drag, gravity, size, decay, shrink, alpha, fade, angle, spin, shape))
+
+        self.alive[slots] = True
+        self.kind[slots] = kind
+        self.color[slots] = self.color_index(color)
+        self.ttl[slots] = ttl
+        self.x[slots] = x
+        self.y[slots] = y
+        self.prev_x[slots] = self.x[slots]
+        self.prev_y[slots] = self.y[slots]
+        self.vx[slots] = vx
+        self.vy[slots] = vy
+        self.drag[slots] = drag
+        self.gravity[slots] = gravity
+        self.size[slots] = size
+        self.decay[slots] = decay
+        self.shrink[slots] = shrink
+        self.alpha[slots] = alpha
+        self.fade[slots] = fade
+        self.angle[slots] = angle
+        self.spin[slots] = spin
+        self.shape[slots] = shape
+        return slots
+
+    def clear(self):
+        self.alive[:] = False
+
+    def update(self):
+        """Advances every particle one tick (dead slots are updated too, it's cheaper than masking)"""
+        np.copyto(self.prev_x, self.x)
+        np.copyto(self.prev_y, self.y)
+        self.x += self.vx
+        self.y += self.vy
+        self.vx *= self.drag
+        self.vy *= self.drag
+        self.vy += self.gravity
+        self.size *= self.decay
+        self.size -= self.shrink
+        self.alpha -= self.fade
+        np.maximum(self.alpha, 0, out=self.alpha)
+        self.angle += self.spin
+        self.ttl -= 1
+        self.alive &= (self.ttl >= 0) & (self.alpha > 0) & (self.size > 0)
+
+    def _stamp(self, key):
+        """Builds the sprite for a stamp key, returns (sprite, anchor)"""
+        kind, rest = divmod(key, 1 << 40)
+        color, rest = divmod(rest, 1 << 24)
+        rgb = self.palette[color]
+        if kind == DISC:
+            radius = rest
+            sprite = make_sprite_surface(radius * 2 + 1, radius * 2 + 1)
+            pygame.draw.circle(sprite, rgb, (radius, radius), radius)
+            return sprite, radius
+
+        # Shard: triangle rotated to an angle step, faded to an alpha step
+        rest, alpha_step = divmod(rest, SHARD_ALPHA_STEPS)
+        shape, angle_step = divmod(rest, SHARD_ANGLE_STEPS)
+        angle = angle_step * 2 * math.pi / SHARD_ANGLE_STEPS
+        cos_a = math.cos(angle)
+        sin_a = math.sin(angle)
+        anchor = _SHARD_RADIUS
+        points = [(anchor + px * cos_a - py * sin_a, anchor + px * sin_a + py * cos_a) for px, py in _shard_shapes[shape]]
+        sprite = make_sprite_surface(anchor * 2 + 1, anchor * 2 + 1)
+        pygame.draw.polygon(sprite, rgb, points)
+        sprite.set_alpha(int((alpha_step + 1) * 255 / SHARD_ALPHA_STEPS))
+        return sprite, anchor
+
+    def _stamp_keys(self, slots):
+        """One integer per particle naming its pre-rendered stamp (kind, color, then radius or shape/angle/alpha)"""
+        kind = self.kind[slots].astype(np.int64)
+        base = (kind << 40) + (self.color[slots].astype(np.int64) << 24)
+        radius = self.size[slots].astype(np.int64)
+        angle_step = np.round(self.angle[slots] / (2 * math.pi) * SHARD_ANGLE_STEPS).astype(np.int64) % SHARD_ANGLE_STEPS
+        alpha_step = np.clip(np.ceil(self.alpha[slots] * SHARD_ALPHA_STEPS / 255).astype(np.int64) - 1, 0, SHARD_ALPHA_STEPS - 1)
+        shard = (self.shape[slots] * SHARD_ANGLE_STEPS + angle_step) * SHARD_ALPHA_STEPS + alpha_step
+        return base + np.where(kind == DISC, radius, shard)
+
+    def draw(self, surface, offset=(0, 0), tick_alpha=1.0):
+        """Stamps every visible disc and shard onto surface in one blits call, returns the count drawn;
+        tick_alpha below 1 draws them part way through the last update (see timestep.py)"""
+        ox, oy = offset
+        sw, sh = surface.get_size()
+        if tick_alpha < 1.0:
+            x = self.prev_x + (self.x - self.prev_x) * tick_alpha - ox
+            y = self.prev_y + (self.y - self.prev_y) * tick_alpha - oy
+        else:
+            x = self.x - ox
+            y = self.y - oy
+        # Discs under 1px radius are invisible, everything else is culled against the view
+        visible = (self.alive & (self.kind != CUSTOM) & ((self.kind != DISC) | (self.size >= 1))
+                   & (x > -_SHARD_RADIUS) & (x < sw + _SHARD_RADIUS) & (y > -_SHARD_RADIUS) & (y < sh + _SHARD_RADIUS))
+        slots = np.flatnonzero(visible)
+        if not len(slots):
+            return 0
+
+        stamps = self._stamps
+        keys = self._stamp_keys(slots).tolist()
+        for key in set(keys).difference(stamps):
+            stamps[key] = self._stamp(key)
+
+        blits = []
+        for key, px, py in zip(keys, x[slots].astype(int).tolist(), y[slots].astype(int).tolist()):
+            sprite, anchor = stamps[key]
+            blits.append((sprite, (px - anchor, py - anchor)))
+        surface.blits(blits, doreturn=False)
+        return len(slots)
+
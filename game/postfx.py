@@ -0,0 +1,127 @@
+import pygame
+import time
+import numpy as np
+from .settings import *
+from .cache import SurfaceCache, display_format
+
+class TensionPostFX:
+    """Tension distortion as a post-processing pass: scanline jitter and glitch bars (surfarray),
+    a border vignette and film grain, all from noise generated once and cycled"""
+    def __init__(self, seed=None, budget_ms=POSTFX_BUDGET_MS):
+        rng = np.random.default_rng(seed)
+        self.budget_ms = budget_ms # None draws all the grain every frame (same output whatever the timing)
+        size = POSTFX_TABLE_SIZE
+
+        # Scanline bands: vertical position (0-1), height, horizontal shift (-1 to 1)
+        self.band_y = rng.random(size)
+        self.band_h = rng.integers(1, 6, size)
+        self.band_shift = rng.uniform(-1, 1, size)
+
+        # Glitch bars: position (0-1), width, height, dark or light
+        self.bar_x = rng.random(size)
+        self.bar_y = rng.random(size)
+        self.bar_w = rng.integers(5, 51, size)
+        self.bar_h = rng.integers(1, 6, size)
+        self.bar_light = rng.random(size) > 0.5
+
+        # Grain tiles: speck brightness per pixel, baked per intensity level and added to
+        # (or subtracted from) the frame, which is far cheaper than alpha blending
+        noise = [rng.random((POSTFX_GRAIN_TILE, POSTFX_GRAIN_TILE, 1)) ** 4 * 90 for _ in range(POSTFX_GRAIN_FRAMES)]
+        self.grain_tiles = []
+        for level in range(1, POSTFX_GRAIN_STEPS + 1):
+            tiles = []
+            for frame in noise:
+                surf = pygame.Surface((POSTFX_GRAIN_TILE, POSTFX_GRAIN_TILE))
+                pygame.surfarray.pixels3d(surf)[...] = (frame * level / POSTFX_GRAIN_STEPS).astype(np.uint8)
+                tiles.append(display_format(surf))
+            self.grain_tiles.append(tiles)
+
+        self.vignettes = SurfaceCache(POSTFX_VIGNETTE_BUDGET_MB * 1024 * 1024)
+        self.frame = 0
+
+    def _vignette(self, size, step):
+        """Dark border strips (top, bottom, left, right) for an intensity step, built once per size"""
+        key = (size, step)
+        strips = self.vignettes.get(key)
+        if strips is None:
+            width, height = size
+            intensity = step / POSTFX_INTENSITY_STEPS
+            solid = int(20 * intensity) # Same hard border as before
+            band = solid + int(40 * intensity)
+            # Alpha falls off from the edge inwards: opaque for the solid part, then quadratic
+            d = np.arange(band)
+            fade = np.clip(1 - (d - solid) / max(1, band - solid), 0, 1) ** 2
+            profile = np.where(d < solid, 255, fade * 200).astype(np.uint8)
+
+            top = pygame.Surface((width, band), pygame.SRCALPHA)
+            pygame.surfarray.pixels_alpha(top)[...] = profile[np.newaxis, :]
+            left = pygame.Surface((band, height), pygame.SRCALPHA)
+            pygame.surfarray.pixels_alpha(left)[...] = profile[:, np.newaxis]
+            bottom = pygame.transform.flip(top, False, True)
+            right = pygame.transform.flip(left, True, False)
+
+            # One surface holds all four (cache entries are single surfaces)
+            strips = pygame.Surface((width + band * 2, band * 2 + height), pygame.SRCALPHA)
+            strips.blit(top, (0, 0))
+            strips.blit(bottom, (0, band))
+            strips.blit(left, (width, band * 2))
+            strips.blit(right, (width + band, band * 2))
+            strips = self.vignettes.put(key, display_format(strips))
+        return strips
+
+    def apply(self, surface, intensity):
+        """Distorts surface in place for a tension intensity (0.0 to 1.0)"""
+        if intensity <= 0:
+            return
+        start = time.perf_counter()
+        width, height = surface.get_size()
+        size = POSTFX_TABLE_SIZE
+        self.frame += 1
+        base = (self.frame * 7) % size # Walk the tables, a new slice every frame
+
+        # Scanline jitter and glitch bars, straight on the pixels
+        num_bands = int(POSTFX_JITTER_BANDS * intensity)
+        num_bars = int(10 * intensity)
+        pixels = pygame.surfarray.pixels2d(surface)
+        max_shift = int(30 * intensity) + 1
+        for i in range(num_bands):
+            j = (base + i) % size
+            y0 = int(self.band_y[j] * (height - 5))
+            shift = int(self.band_shift[j] * max_shift)
+            band = pixels[:, y0:y0 + self.band_h[j]]
+            band[...] = np.roll(band, shift, axis=0)
+        dark = surface.map_rgb(BLACK)
+        light = surface.map_rgb(WHITE)
+        for i in range(num_bars):
+            j = (base + i) % size
+            x0 = int(self.bar_x[j] * width)
+            y0 = int(self.bar_y[j] * height)
+            pixels[x0:x0 + self.bar_w[j], y0:y0 + self.bar_h[j]] = light if self.bar_light[j] else dark
+        del pixels
+
+        # Border vignette
+        step = max(1, min(POSTFX_INTENSITY_STEPS, round(intensity * POSTFX_INTENSITY_STEPS)))
+        strips = self._vignette((width, height), step)
+        band = (strips.get_height() - height) // 2
+        if band > 0:
+            surface.blits([
+                (strips, (0, 0), (0, 0, width, band)),
+                (strips, (0, height - band), (0, band, width, band)),
+                (strips, (0, 0), (width, band * 2, band, height)),
+                (strips, (width - band, 0), (width + band, band * 2, band, height)),
+            ], doreturn=False)
+
+        # Grain, cycled through the pre-made tiles (light specks one frame, dark the next); rows are
+        # drawn until the frame's budget runs out, starting from a different row each frame so big
+        # canvases still get covered over time
+        level = max(1, min(POSTFX_GRAIN_STEPS, round(intensity * POSTFX_GRAIN_STEPS)))
+        tile = self.grain_tiles[level - 1][self.frame % POSTFX_GRAIN_FRAMES]
+        blend = pygame.BLEND_RGB_ADD if self.frame % 2 else pygame.BLEND_RGB_SUB
+        tw = tile.get_width()
+        rows = list(range(0, height, tw))
+        first = self.frame % len(rows)
+        deadline = start + self.budget_ms / 1000 if self.budget_ms is not None else None
+        for y in rows[first:] + rows[:first]:
+            if deadline is not None and time.perf_counter() > deadline:
+                break
+            surface.blits([(tile, (x, y), None, blend) for x in range(0, width, tw)], doreturn=False)
@@ -0,0 +1,183 @@
+import os
+import pygame
+from .settings import *
+from .fonts import render_text
+
+try:
+    from pygame._sdl2.video import Window, Renderer, Texture
+    from pygame._sdl2.sdl2 import error as SDLError
+except ImportError: # pygame builds without the SDL2 video module only have the display.flip path
+    Window = None
+
+class TextureDisplay:
+    """Game window presented through an SDL renderer: frames are uploaded to streaming textures
+    and stretched over the window by SDL (on the GPU, or by its software renderer without one)"""
+    def __init__(self, title="MonoMask"):
+        self.window = Window(title, (SCREEN_WIDTH, SCREEN_HEIGHT), hidden=True)
+        self.software = False
+        try:
+            self.renderer = Renderer(self.window, accelerated=1)
+        except SDLError:
+            self.renderer = Renderer(self.window, accelerated=0)
+            self.software = True
+        self.screen = None
+        self.textures = {} # (size, smooth) -> streaming texture
+
+    def set_mode(self, size, fullscreen):
+        """Resizes the window (fullscreen = desktop size), returns a fresh off-screen surface of its size"""
+        if fullscreen:
+            self.window.set_fullscreen(desktop=True)
+        else:
+            self.window.set_windowed()
+            self.window.size = size
+        self.window.show()
+        self.screen = pygame.Surface(self.window.size)
+        self.textures.clear()
+        return self.screen
+
+    def _texture(self, size, smooth):
+        texture = self.textures.get((size, smooth))
+        if texture is None:
+            # Filtering is picked up from the scale quality hint when the texture is created
+            os.environ["SDL_RENDER_SCALE_QUALITY"] = "1" if smooth else "0"
+            texture = self.textures[(size, smooth)] = Texture(self.renderer, size, streaming=True)
+        return texture
+
+    def present(self, surface, rects=None, smooth=False):
+        """Uploads surface (or just rects of it) and shows it stretched over the whole window"""
+        texture = self._texture(surface.get_size(), smooth)
+        if rects is None:
+            texture.update(surface)
+        else:
+            bounds = surface.get_rect()
+            for rect in rects:
+                rect = bounds.clip(rect)
+                if rect:
+                    texture.update(surface.subsurface(rect), rect)
+        texture.draw()
+        self.renderer.present()
+
+# Set while the SDL renderer backend is active (see set_mode)
+_texture_display = None
+
+def set_mode(size, flags=0, backend="flip"):
+    """Opens or resizes the game window and returns the surface frames are drawn on; the "texture" backend
+    presents through an SDL renderer and falls back to display.set_mode / flip when none can be created"""
+    global _texture_display
+    if backend == "texture" and Window is not None:
+        try:
+            if _texture_display is None:
+                _texture_display = TextureDisplay()
+            return _texture_display.set_mode(size, flags & pygame.FULLSCREEN)
+        except (pygame.error, SDLError) as e:
+            print(f"SDL renderer unavailable, presenting with display.flip: {e}")
+            _texture_display = None
+    return pygame.display.set_mode(size, flags)
+
+def set_icon(icon):
+    if _texture_display:
+        _texture_display.window.set_icon(icon)
+    else:
+        pygame.display.set_icon(icon)
+
+def flip(rects=None):
+    """Shows the screen surface from set_mode (or just rects of it)"""
+    if _texture_display:
+        _texture_display.present(_texture_display.screen, rects)
+    elif rects is None:
+        pygame.display.flip()
+    else:
+        pygame.display.update(rects)
+
+class Presenter:
+    """Pushes finished frames to the display, updating only the changed rects of static scenes"""
+    def __init__(self):
+        self.scene = None # Scene shown by the last present(), None = unknown / full frame
+
+    def invalidate(self):
+        # Display was recreated or drawn elsewhere, next present is a full flip
+        self.scene = None
+
+    def present(self, rects=None, scene=None):
+        """Flips the whole frame, or just rects when the same scene is still on screen"""
+        if rects is None or scene is None or scene != self.scene:
+            flip()
+        elif rects:
+            flip(rects)
+        self.scene = scene
+
+    def present_canvas(self, screen, canvas, smooth=False):
+        """Shows a finished canvas frame upscaled to the screen (by SDL with the texture backend,
+        in which case screen keeps its old contents)"""
+        if _texture_display:
+            _texture_display.present(canvas, smooth=smooth)
+        else:
+            scale_canvas(screen, canvas, smooth)
+            pygame.display.flip()
+        self.scene = None
+
+def render_size(screen_size, render_scale=1.0):
+    """Canvas size for a display: native above the base resolution, shrunk by render_scale
+    ("pixel" = the largest integer divisor), but never below SCREEN_WIDTH x SCREEN_HEIGHT"""
+    screen_w, screen_h = screen_size
+    if screen_w <= SCREEN_WIDTH and screen_h <= SCREEN_HEIGHT:
+        return SCREEN_WIDTH, SCREEN_HEIGHT
+    # The world is drawn 1:1 into the canvas, so a smaller canvas also narrows the view (down to the base one)
+    floor = max(SCREEN_WIDTH / screen_w, SCREEN_HEIGHT / screen_h)
+    if render_scale == "pixel":
+        divisor = max(1, min(screen_w // SCREEN_WIDTH, screen_h // SCREEN_HEIGHT))
+        return screen_w // divisor, screen_h // divisor
+    scale = min(1.0, max(float(render_scale), floor))
+    return round(screen_w * scale), round(screen_h * scale)
+
+def render_scale_label(render_scale):
+    return "PIXEL" if render_scale == "pixel" else f"{round(float(render_scale) * 100)}%"
+
+def next_render_scale(render_scale, step=1):
+    """Cycles through RENDER_SCALES (unknown values start from the first)"""
+    index = RENDER_SCALES.index(render_scale) if render_scale in RENDER_SCALES else -step
+    return RENDER_SCALES[(index + step) % len(RENDER_SCALES)]
+
+def scale_canvas(screen, canvas, smooth=False):
+    """Copies the canvas to the display, upscaling it when the sizes differ
+    (integer ratios are scaled pixel-perfect, others are smoothed unless smooth is off; downscales always are)"""
+    size = screen.get_size()
+    canvas_w, canvas_h = canvas.get_size()
+    if (canvas_w, canvas_h) == size:
+        screen.blit(canvas, (0, 0))
+    elif (smooth or canvas_w > size[0]) and (size[0] % canvas_w or size[1] % canvas_h):
+        pygame.transform.smoothscale(canvas, size, screen)
+    else:
+        pygame.transform.scale(canvas, size, screen)
+
+def play_title_card(screen, clock, presenter, title):
+    """Fades a chapter title in, holds it for 2s and fades it out again"""
+    sw, sh = screen.get_size()
+    text_surf = render_text(title, 60, (255, 255, 255)).copy() # Faded below, keep the cached one intact
+    text_rect = text_surf.get_rect(center=(sw//2, sh//2))
+    scene = ('title', title)
+    screen.fill((0, 0, 0))
+
+    # --- FADE IN ---
+    for alpha in range(0, 256, 4):
+        screen.fill((0, 0, 0), text_rect)
+        text_surf.set_alpha(alpha)
+        screen.blit(text_surf, text_rect)
+        presenter.present([text_rect], scene)
+        clock.tick(60)
+        pygame.event.pump()
+
+    # --- HOLD (2s) --- Nothing changes on screen, so just idle
+    hold_until = pygame.time.get_ticks() + 2000
+    while pygame.time.get_ticks() < hold_until:
+        clock.tick(IDLE_FPS)
+        pygame.event.pump()
+
+    # --- FADE OUT ---
+    for alpha in range(255, -1, -4):
+        screen.fill((0, 0, 0), text_rect)
+        text_surf.set_alpha(alpha)
+        screen.blit(text_surf, text_rect)
+        presenter.present([text_rect], scene)
+        clock.tick(60)
+        pygame.event.pump()
@@ -0,0 +1,189 @@
+import pygame
+import atexit
+import struct
+import time
+import zlib
+from .settings import *
+from .world import GameWorld, Inputs, HeldKeys
+from .postfx import TensionPostFX
+from .cache import draw_random
+
+# Keys the game reads each tick, one bit each in a recorded tick (see Player.update)
+REPLAY_KEYS = (pygame.K_LEFT, pygame.K_a, pygame.K_RIGHT, pygame.K_d, pygame.K_UP, pygame.K_w,
+               pygame.K_DOWN, pygame.K_s, pygame.K_SPACE)
+# This tick's presses, above the key bits
+SWAP_BIT = 1 << 13
+SHOOT_BIT = 1 << 14
+CLICK_BIT = 1 << 15
+
+# File layout: header, then a zlib stream of ops (opcode byte + payload)
+MAGIC = b"MMRP"
+VERSION = 1
+HEADER = struct.Struct("<4sHQdHH16s") # magic, version, seed, aim sensitivity, view width/height, first level
+TICK = 0 # Input for one step(): key/press bits, mouse x, mouse y
+LOAD = 1 # load(level)
+VIEW = 2 # Canvas resized
+AIM = 3 # Aim sensitivity changed
+CHECK = 4 # state_checksum() before the next tick
+PAYLOADS = {
+    TICK: struct.Struct("<Hhh"),
+    LOAD: struct.Struct("<16s"),
+    VIEW: struct.Struct("<HH"),
+    AIM: struct.Struct("<d"),
+    CHECK: struct.Struct("<I"),
+}
+
+class ReplayError(Exception):
+    pass
+
+def pack_inputs(inputs):
+    """Inputs -> (bits, mouse x, mouse y) as stored in a TICK"""
+    bits = 0
+    for i, key in enumerate(REPLAY_KEYS):
+        if inputs.keys[key]:
+            bits |= 1 << i
+    if inputs.swap:
+        bits |= SWAP_BIT
+    if inputs.shoot:
+        bits |= SHOOT_BIT
+    if inputs.click:
+        bits |= CLICK_BIT
+    mx, my = inputs.mouse_pos
+    return bits, max(-32768, min(32767, int(mx))), max(-32768, min(32767, int(my)))
+
+def unpack_inputs(bits, mx, my):
+    keys = HeldKeys(key for i, key in enumerate(REPLAY_KEYS) if bits & (1 << i))
+    return Inputs(keys, (mx, my), swap=bool(bits & SWAP_BIT), shoot=bool(bits & SHOOT_BIT), click=bool(bits & CLICK_BIT))
+
+def state_checksum(world):
+    """CRC of the state that matters for play (player, tension, camera, enemies, projectiles, particles),
+    a replay that drifts from its recording fails the next check"""
+    player = world.player
+    values = [player.x, player.y, player.vel_x, player.vel_y, player.health, player.is_white,
+              world.tension, world.overload_timer, world.forced_black_mode_timer, world.scroll_x, world.scroll_y]
+    for enemy in world.enemies:
+        values += [enemy.x, enemy.y, getattr(enemy, 'health', 0)]
+    for proj in world.projectiles:
+        values += [proj.x, proj.y]
+    crc = zlib.crc32(struct.pack(f"<{len(values)}d", *values))
+    particles = world.particles
+    return zlib.crc32(particles.x[particles.alive].tobytes(), crc)
+
+def _level_name(level):
+    return level.encode()[:16]
+
+class ReplayRecorder:
+    """Writes everything fed to a seeded GameWorld (loads, ticks, view and aim changes) to path as it
+    happens, plus a state checksum every REPLAY_CHECK_INTERVAL ticks; play() feeds it back"""
+    def __init__(self, path, world):
+        if world.seed is None:
+            raise ReplayError("Recording needs a seeded GameWorld (its random streams are part of the replay)")
+        self.file = open(path, "wb")
+        self.file.write(HEADER.pack(MAGIC, VERSION, world.seed, world.aim_sensitivity,
+                                    *world.view_size, _level_name(world.level)))
+        self.compressor = zlib.compressobj()
+        self.view_size = tuple(world.view_size)
+        self.aim_sensitivity = world.aim_sensitivity
+        self.ticks = 0
+        self.world = world
+        world.recorder = self
+        atexit.register(self.close) # Sessions often end in sys.exit()
+
+    def _write(self, op, *payload):
+        if self.file is not None:
+            self.file.write(self.compressor.compress(bytes((op,)) + PAYLOADS[op].pack(*payload)))
+
+    def record_load(self, level):
+        self._write(LOAD, _level_name(level))
+
+    def record_tick(self, world, inputs):
+        """Takes down a tick about to run, returns inputs as the replay will see them"""
+        if tuple(world.view_size) != self.view_size:
+            self.view_size = tuple(world.view_size)
+            self._write(VIEW, *self.view_size)
+        if world.aim_sensitivity != self.aim_sensitivity:
+            self.aim_sensitivity = world.aim_sensitivity
+            self._write(AIM, self.aim_sensitivity)
+        if self.ticks % REPLAY_CHECK_INTERVAL == 0:
+            self._write(CHECK, state_checksum(world))
+        self.ticks += 1
+        packed = pack_inputs(inputs)
+        self._write(TICK, *packed)
+        return unpack_inputs(*packed)
+
+    def close(self):
+        if self.file is not None:
+            self.file.write(self.compressor.flush())
+            self.file.close()
+            self.file = None
+            # Let go of the world (levels, caches) and the exit hook holding this recorder
+            self.world.recorder = None
+            self.world = None
+            atexit.unregister(self.close)
+
+class Replay:
+    """A recorded session read back: the header fields and its ops as (opcode, payload) pairs"""
+    def __init__(self, path):
+        with open(path, "rb") as f:
+            data = f.read()
+        if len(data) < HEADER.size:
+            raise ReplayError(f"{path}: not a replay")
+        magic, version, self.seed, self.aim_sensitivity, width, height, level = HEADER.unpack_from(data)
+        if magic != MAGIC or version != VERSION:
+            raise ReplayError(f"{path}: not a version {VERSION} replay")
+        self.view_size = (width, height)
+        self.level = level.rstrip(b"\0").decode()
+        # A session killed mid-write leaves an unfinished stream, play what made it to disk
+        self.ops = []
+        pos = 0
+        try:
+            stream = zlib.decompressobj().decompress(data[HEADER.size:])
+            while pos < len(stream):
+                op = stream[pos]
+                payload = PAYLOADS[op]
+                if pos + 1 + payload.size > len(stream):
+                    break
+                self.ops.append((op, payload.unpack_from(stream, pos + 1)))
+                pos += 1 + payload.size
+        except (KeyError, zlib.error):
+            raise ReplayError(f"{path}: corrupt replay at byte {pos}") from None
+
+def play(path, render=False):
+    """Feeds a replay back into a fresh world as fast as it goes, checking it plays out the same;
+    with render every tick is drawn too and the frames are hashed (same file, same digest).
+    Returns (ticks, sim seconds, render seconds, frame digest)"""
+    replay = Replay(path)
+    # Drawing rolls its own stream (shake, shiver, variant picks), reseeded so frames match run to run
+    draw_random.seed(replay.seed)
+    world = GameWorld(replay.level, replay.view_size, replay.aim_sensitivity, seed=replay.seed)
+    if POSTFX:
+        # No time budget, the grain drawn can't depend on how fast the machine is
+        world.distort = TensionPostFX(replay.seed, budget_ms=None).apply
+    surface = pygame.Surface(replay.view_size) if render else None
+    digest = 0
+    ticks = 0
+    sim_time = 0.0
+    render_time = 0.0
+    for op, payload in replay.ops:
+        if op == TICK:
+            start = time.perf_counter()
+            world.step(unpack_inputs(*payload))
+            sim_time += time.perf_counter() - start
+            ticks += 1
+            if render:
+                start = time.perf_counter()
+                world.render(surface)
+                render_time += time.perf_counter() - start
+                digest = zlib.crc32(pygame.image.tobytes(surface, "RGB"), digest)
+        elif op == LOAD:
+            world.load(payload[0].rstrip(b"\0").decode())
+        elif op == VIEW:
+            world.view_size = payload
+            if render:
+                surface = pygame.Surface(payload)
+        elif op == AIM:
+            world.aim_sensitivity = payload[0]
+        elif op == CHECK:
+            if state_checksum(world) != payload[0]:
+                raise ReplayError(f"{path}: replay drifted from the recording at tick {ticks}")
+    return ticks, sim_time, render_time, digest
@@ -5,6 +5,7 @@ SCREEN_HEIGHT = 720
 FPS = 60
 DEV_NO_GRAVITY = False # Disable gravity for testing
 DEV_START_LEVEL = 0 # Start directly at level 2 for testing
+CULL_PADDING = 64 # Extra margin (px) around the viewport before objects are skipped
 
 # Colors
 WHITE = (240, 240, 230) # Cream/Off-White
@@ -13,3 +14,79 @@ RED = (255, 60, 60)     # Soft Red
 GRAY = (128, 128, 128)  # Neutral Gray
 CREAM = (240, 240, 230) # Soft White/Peace
 BLACK_MATTE = (5, 5, 5) # Deep Black/Tension
+
+# Transparent key for baked sprites (never used as a drawing color)
+SPRITE_COLORKEY = (255, 0, 255)
+
+# Mystical cave hatching is rendered into tiles of this size (px)
+CAVE_TILE_SIZE = 256
+CAVE_TILE_BUDGET_MB = 24 # Memory budget for cached cave tiles before LRU eviction
+CAVE_TILE_MARGIN = 24 # Overdraw around each tile, longer than any hatch line
+
+# Static level geometry is streamed as cached chunks of this size (px)
+CHUNK_SIZE = 512
+CHUNK_BUDGET_MB = 64 # Raised automatically if one screen of chunks needs more
+CHUNK_PREFETCH_PER_FRAME = 1 # Off-screen chunks rendered ahead of the camera each frame
+
+# Rendered text surfaces kept around for reuse (see fonts.render_text)
+TEXT_CACHE_BUDGET_MB = 4
+
+# HUD FPS counter granularity (the widget only redraws when the bucket changes)
+HUD_FPS_BUCKET = 5
+
+# Frame rate for screens where nothing moves (ending, idle pause menu, title holds)
+IDLE_FPS = 15
+
+# Fixed-timestep simulation (see timestep.py): gameplay ticks at SIM_TICK_RATE, frames are drawn
+# up to RENDER_FPS with moving objects interpolated between the last two ticks
+SIM_TICK_RATE = FPS # Everything is tuned per tick at 60
+SIM_MAX_CATCHUP = 5 # Most ticks run in one frame, longer stalls slow the game down instead
+SIM_MAX_INTERP_JUMP = 200 # Moves longer than this in one tick (px) are teleports, drawn unblended
+RENDER_FPS = 120
+
+# Input recording and replay (see replay.py)
+REPLAY_DIR = "replays" # Recorded sessions land here when the record_replay setting is on
+REPLAY_CHECK_INTERVAL = 60 # Ticks between recorded state checksums
+
+# Player body atlas: frames are baked lazily per (mode, tilt, tension step, phase, jitter variant)
+PLAYER_ATLAS = True # False draws the body polygons every frame
+PLAYER_ATLAS_PERIOD = 10 * 3.141592653589793 # anim_timer cycle of the robe ripple and tatter waves
+PLAYER_ATLAS_PHASES = 96
+PLAYER_ATLAS_TENSION_STEPS = 8
+PLAYER_ATLAS_VARIANTS = 3
+PLAYER_ATLAS_BUDGET_MB = 24 # ~900 frames, covers both modes while moving
+
+# ShadowSelf boss atlas: robe/head frames per (mode, tilt, phase, jitter variant), plus hat, eye and flame sprites
+SHADOW_ATLAS = True # False draws the boss polygons every frame
+SHADOW_ATLAS_PERIOD = PLAYER_ATLAS_PERIOD # Same cloth waves as the protagonist
+SHADOW_ATLAS_PHASES = 64
+SHADOW_ATLAS_VARIANTS = 2
+SHADOW_ATLAS_BUDGET_MB = 48 # ~1 MB per 7 frames, covers a mode with a few tilts
+
+# Menu panels and full-screen tints shared by the main menu and in-game overlays (see chrome.py)
+CHROME_CACHE_BUDGET_MB = 48
+
+# Pooled particles (see particles.py)
+PARTICLE_CAPACITY = 2048 # World pool size, emits past this are dropped
+SHARD_SHAPES = 16 # Pre-rolled shard triangles
+SHARD_ANGLE_STEPS = 32 # Rotations baked per shard triangle
+SHARD_ALPHA_STEPS = 16 # Fade levels baked per shard rotation
+
+# Pooled projectiles (see sprites.ProjectilePool)
+PROJECTILE_CAPACITY = 512 # Shots past this many live ones are dropped
+PROJECTILE_WOBBLE_PHASES = 32 # Baked orb wobble frames per color
+SHURIKEN_ROTATION_STEPS = 16 # Baked shuriken rotations per quarter turn
+
+# Tension distortion post-processing (see postfx.py)
+POSTFX = False # Opt-in: costs more than the old random bars and hard border (grain is a full-frame blend) and adds a vignette and grain
+POSTFX_TABLE_SIZE = 256 # Pre-rolled scanline bands / glitch bars, cycled
+POSTFX_JITTER_BANDS = 12 # Shifted scanline bands at full tension
+POSTFX_GRAIN_FRAMES = 8 # Pre-generated grain tiles, cycled
+POSTFX_GRAIN_TILE = 256
+POSTFX_GRAIN_STEPS = 4 # Grain strengths baked per tile
+POSTFX_INTENSITY_STEPS = 16 # Vignette strips baked per canvas size
+POSTFX_VIGNETTE_BUDGET_MB = 16
+POSTFX_BUDGET_MS = 2.0 # Grain rows stop once the pass has taken this long
+
+# Internal render scale above the base resolution (see present.render_size), "pixel" = integer upscale
+RENDER_SCALES = [1.0, 0.75, 0.5, "pixel"]
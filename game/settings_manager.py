@@ -6,7 +6,11 @@ SETTINGS_FILE = "user_settings.json"
 DEFAULT_SETTINGS = {
     "fullscreen": False,
     "sensitivity": 1.0,
-    "master_volume": 0.5
+    "master_volume": 0.5,
+    "render_scale": 1.0, # 1.0, 0.75, 0.5 or "pixel"
+    "smooth_upscale": False, # Smoothed fractional upscales cost more than rendering natively
+    "present_backend": "flip", # "texture" presents through an SDL renderer (see present.set_mode)
+    "record_replay": False # Record every session's input to REPLAY_DIR (see replay.py)
 }
 
 def load_settings():
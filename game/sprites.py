@@ -1,7 +1,59 @@
 import pygame
 import math
 import random
+import itertools
+import numpy as np
 from .settings import *
+from .cache import SurfaceCache, make_sprite_surface, draw_random, baking
+from .particles import DISC, SHARD
+
+# Shared LRU for mystical cave hatching tiles (see Platform._draw_cave_tiles)
+cave_tile_cache = SurfaceCache(CAVE_TILE_BUDGET_MB * 1024 * 1024)
+_platform_serials = itertools.count() # Unique cache keys per platform instance
+
+# Baked projectile looks, keyed by (visual type, color, phase/rotation step) (see _projectile_frame)
+_projectile_frames = {}
+
+# Baked Player body frames (see Player._body_frame)
+player_frame_cache = SurfaceCache(PLAYER_ATLAS_BUDGET_MB * 1024 * 1024)
+
+def _shiver_point(x, y, intensity):
+    """Tiny random fluctuation of a vertex, scaled by tension"""
+    if intensity <= 0.01:
+        return (x, y)
+    # "Tiny fluctuations"
+    shake_amp = 3.0 * intensity
+    dx = (draw_random.random() - 0.5) * shake_amp
+    dy = (draw_random.random() - 0.5) * shake_amp
+    return (x + dx, y + dy)
+
+class DotStamps:
+    """Pre-rendered filled circles per (radius, brightness), for stamping whole dot fields with one blits call"""
+    def __init__(self, color_fn, max_radius):
+        self.color_fn = color_fn # brightness -> RGB
+        self.table = np.full((max_radius + 1) * 256, None, dtype=object) # radius * 256 + brightness -> sprite
+
+    def lookup(self, radius, brightness):
+        """Object array of the stamps for integer arrays of radii and brightnesses (0-255)"""
+        index = radius * 256 + brightness
+        table = self.table
+        for key in np.unique(index[table[index] == None]).tolist():
+            r, b = divmod(key, 256)
+            dot = make_sprite_surface(r * 2 + 1, r * 2 + 1)
+            pygame.draw.circle(dot, self.color_fn(b), (r, r), r)
+            table[key] = dot
+        return table[index]
+
+    def draw(self, target, x, y, radius, brightness):
+        """Draws one dot per array entry centered on (x, y), in array order"""
+        dots = self.lookup(radius, brightness).tolist()
+        target.blits(zip(dots, zip((x - radius).tolist(), (y - radius).tolist())), doreturn=False)
+
+# BlackHole dots per mode (see BlackHole.draw)
+_portal_dots = {
+    True: DotStamps(lambda b: (b, b, b + 10), 3),
+    False: DotStamps(lambda b: (b, b, min(255, b + 20)), 3),
+}
 
 class Player:
     def __init__(self, x, y):
@@ -54,7 +106,9 @@ class Player:
         return (self.is_white and platform.is_white) or (not self.is_white and not platform.is_white)
     
     
-    def update(self, platforms, offset=(0,0), mouse_pos=None, aim_sensitivity=1.0):
+    def update(self, solids, offset=(0,0), mouse_pos=None, aim_sensitivity=1.0, keys=None):
+        """solids: collision index of the level's platforms (LevelIndex.solids);
+        keys: held keys indexed like pygame.key.get_pressed() (read live when None)"""
         ox, oy = offset
         # Update animation timer
         self.anim_timer += 0.1
@@ -124,7 +178,8 @@ class Player:
             self.facing = -1
 
         # Horizontal movement
-        keys = pygame.key.get_pressed()
+        if keys is None:
+            keys = pygame.key.get_pressed()
         self.vel_x = 0
         if keys[pygame.K_LEFT] or keys[pygame.K_a]:
             self.vel_x = -self.speed
@@ -159,15 +214,15 @@ class Player:
         # Move horizontally
         self.x += self.vel_x
         
-        # Horizontal collision check
+        # Horizontal collision check (only platforms overlapping the player come back)
         player_rect = self.get_rect()
-        for platform in platforms:
+        for platform in solids.query(player_rect):
             # Check if this platform should collide
             # Interaction Mode: Like lands on Like OR Neutral lands on everything
             should_collide = self.is_neutral_collision(platform)
             
             if should_collide:
-                platform_rect = platform.get_rect()
+                platform_rect = platform.rect
                 if player_rect.colliderect(platform_rect):
                     # Moving right
                     if self.vel_x > 0:
@@ -183,12 +238,12 @@ class Player:
         self.on_ground = False
         player_rect = self.get_rect()
         
-        for platform in platforms:
+        for platform in solids.query(player_rect):
             # Check if this platform should collide
             should_collide = self.is_neutral_collision(platform)
             
             if should_collide:
-                platform_rect = platform.get_rect()
+                platform_rect = platform.rect
                 
                 if player_rect.colliderect(platform_rect):
                     # Falling down (landing on platform)
@@ -210,9 +265,9 @@ class Player:
              ground_check_rect = self.get_rect()
              self.y -= 2
              
-             for platform in platforms:
+             for platform in solids.query(ground_check_rect):
                  if self.is_neutral_collision(platform):
-                     if ground_check_rect.colliderect(platform.get_rect()):
+                     if ground_check_rect.colliderect(platform.rect):
                          self.on_ground = True
                          break
         
@@ -232,54 +287,17 @@ class Player:
         self.invulnerable_timer = 60 # 1 second invulnerability
         self.shake_intensity = 10.0
         
-    def draw(self, screen, camera=None, offset=(0,0), scale=1.0):
-        # Visual Config: Samurai Prototype (Standard Resolution)
-        ox, oy = offset
-        
-        # Colors:
-        fill_color = BLACK_MATTE if self.is_white else CREAM
-        border_color = CREAM if self.is_white else BLACK_MATTE
-        sword_color = GRAY
+    def _draw_body(self, target, cx, cy, t, tension, vel_x, fill_color, border_color):
+        """Robe, head and hat around (cx, cy); cy already includes the hover bob"""
+        shiver_point = _shiver_point
         
-        # Calculate Screen Position
-        # If camera exists, offset coordinates
-        if camera:
-            draw_pos = camera.apply_point(self.x, self.y)
-            draw_x, draw_y = draw_pos
-        else:
-            # FIX: Use manual offset if camera is not used
-            draw_x = self.x - ox
-            draw_y = self.y - oy
-        
-        # Update center coordinates based on DRAW position
-        cx = draw_x + self.width / 2
-        cy = draw_y + self.height / 2
-        
-        t = self.anim_timer
-        tension = self.tension_value
-        
-        # --- Helper: Shiver Effect ---
-        def shiver_point(x, y, intensity):
-            if intensity <= 0.01:
-                return (x, y)
-            # "Tiny fluctuations"
-            shake_amp = 3.0 * intensity
-            dx = (random.random() - 0.5) * shake_amp
-            dy = (random.random() - 0.5) * shake_amp
-            return (x + dx, y + dy)
-
         # --- BODY (Floating Robes) ---
-        hover_y = math.sin(t * 0.1) * 3
-        
-        shoulder_y = cy - self.height * 0.25 + hover_y
-        feet_y = cy + self.height * 0.4 + hover_y
+        shoulder_y = cy - self.height * 0.25
+        feet_y = cy + self.height * 0.4
         
         body_top_w = self.width * 0.3
         body_bottom_w = self.width * 0.7 
         
-        # Facing direction
-        dir_x = self.facing
-        
         # Robe construction
         robe_pts = []
         robe_pts.append(shiver_point(cx + body_top_w/2, shoulder_y, tension)) 
@@ -299,7 +317,7 @@ class Player:
             wave_y = ripple * (1.0 - tension) + tatter * tension
             
             # Tilt based on movement
-            tilt_x = -self.vel_x * 2 * prog
+            tilt_x = -vel_x * 2 * prog
             
             pt_x = base_x + tilt_x
             pt_y = feet_y + wave_y
@@ -308,7 +326,7 @@ class Player:
             
         robe_pts.append(shiver_point(cx - body_top_w/2, shoulder_y, tension))
         
-        pygame.draw.polygon(screen, fill_color, robe_pts)
+        pygame.draw.polygon(target, fill_color, robe_pts)
         
         # --- HEAD ---
         # To make the border shiver, we draw the circle as a polygon
@@ -324,7 +342,7 @@ class Player:
             py = head_cy + math.sin(angle) * head_radius
             head_pts.append(shiver_point(px, py, tension))
             
-        pygame.draw.polygon(screen, fill_color, head_pts)
+        pygame.draw.polygon(target, fill_color, head_pts)
         
         # --- HAT (Conical) ---
         hat_w = self.width * 1.3
@@ -332,8 +350,8 @@ class Player:
         hat_base_y = head_cy
         
         # Main shaking of the hat object
-        obj_shake_x = (random.random() - 0.5) * 5 * tension
-        obj_shake_y = (random.random() - 0.5) * 2 * tension
+        obj_shake_x = (draw_random.random() - 0.5) * 5 * tension
+        obj_shake_y = (draw_random.random() - 0.5) * 2 * tension
         
         # Define base points
         p1 = (cx - hat_w/2 + obj_shake_x, hat_base_y + obj_shake_y)
@@ -352,7 +370,7 @@ class Player:
         # Top point
         hat_pts.append(shiver_point(p3[0], p3[1], tension))
         
-        pygame.draw.polygon(screen, fill_color, hat_pts)
+        pygame.draw.polygon(target, fill_color, hat_pts)
         
         # Hat Detail: Horizontal Band
         # Just a line
@@ -365,7 +383,71 @@ class Player:
         bp1 = shiver_point(bx1, band_y, tension)
         bp2 = shiver_point(bx2, band_y, tension)
         
-        pygame.draw.line(screen, border_color, bp1, bp2, 2)
+        pygame.draw.line(target, border_color, bp1, bp2, 2)
+
+    def _body_frame(self, fill_color, border_color):
+        """Returns (sprite, anchor_x, anchor_y) of the baked body for the current animation state"""
+        # Hover is applied at blit time, so the cycle only has the cloth waves left
+        period = PLAYER_ATLAS_PERIOD
+        phase = int((self.anim_timer % period) / period * PLAYER_ATLAS_PHASES) % PLAYER_ATLAS_PHASES
+        tension_step = int(round(self.tension_value * (PLAYER_ATLAS_TENSION_STEPS - 1)))
+        tilt = int(round(self.vel_x))
+        # Shiver comes from a few pre-rolled variants instead of fresh jitter
+        variant = draw_random.randrange(PLAYER_ATLAS_VARIANTS) if tension_step > 0 else 0
+        
+        key = (self.is_white, tilt, tension_step, phase, variant)
+        frame = player_frame_cache.get(key)
+        if frame is None:
+            # Room for robe tilt, hat brim and shiver around the center
+            anchor_x = 40 + 2 * abs(tilt)
+            anchor_y = 40
+            sprite = make_sprite_surface(anchor_x * 2, anchor_y * 2)
+            t = phase * period / PLAYER_ATLAS_PHASES
+            tension = tension_step / (PLAYER_ATLAS_TENSION_STEPS - 1)
+            with baking(key):
+                self._draw_body(sprite, anchor_x, anchor_y, t, tension, tilt, fill_color, border_color)
+            frame = player_frame_cache.put(key, sprite)
+        return frame, frame.get_width() // 2, frame.get_height() // 2
+
+    def draw(self, screen, camera=None, offset=(0,0), scale=1.0):
+        # Visual Config: Samurai Prototype (Standard Resolution)
+        ox, oy = offset
+        
+        # Colors:
+        fill_color = BLACK_MATTE if self.is_white else CREAM
+        border_color = CREAM if self.is_white else BLACK_MATTE
+        sword_color = GRAY
+        
+        # Calculate Screen Position
+        # If camera exists, offset coordinates
+        if camera:
+            draw_pos = camera.apply_point(self.x, self.y)
+            draw_x, draw_y = draw_pos
+        else:
+            # FIX: Use manual offset if camera is not used
+            draw_x = self.x - ox
+            draw_y = self.y - oy
+        
+        # Update center coordinates based on DRAW position
+        cx = draw_x + self.width / 2
+        cy = draw_y + self.height / 2
+        
+        t = self.anim_timer
+        tension = self.tension_value
+        shiver_point = _shiver_point
+        
+        # Hover bob shared by body and katana
+        hover_y = math.sin(t * 0.1) * 3
+        shoulder_y = cy - self.height * 0.25 + hover_y
+        
+        # Facing direction
+        dir_x = self.facing
+        
+        if PLAYER_ATLAS:
+            sprite, anchor_x, anchor_y = self._body_frame(fill_color, border_color)
+            screen.blit(sprite, (round(cx) - anchor_x, round(cy + hover_y) - anchor_y))
+        else:
+            self._draw_body(screen, cx, cy + hover_y, t, tension, self.vel_x, fill_color, border_color)
         
         # --- AIM RETICLE ---
         # Always draw reticle (needed since system cursor is hidden)
@@ -411,7 +493,7 @@ class Player:
                      prog = i / num_seg
                      ang = start_angle + (end_angle - start_angle) * prog
                      # Jagged rage shake
-                     r_offset = (random.random() - 0.5) * 5
+                     r_offset = (draw_random.random() - 0.5) * 5
                      ax = cx + math.cos(ang) * (slash_dist + r_offset)
                      ay = cy + math.sin(ang) * (slash_dist + r_offset)
                      arc_points.append((ax, ay))
@@ -465,8 +547,8 @@ class Player:
         
         return waves
 
-    def shoot(self):
-        """Creates a projectile moving in the facing direction"""
+    def shoot(self, projectiles):
+        """Spawns a projectile into projectiles (a ProjectilePool) moving in the facing direction"""
         if not self.is_white: # Only in Peace Mode
             return None
             
@@ -502,7 +584,7 @@ class Player:
         
         # Spawn at BODY CENTER (cx, cy), not at reticle position
         # This prevents spawning inside the ground.
-        return Projectile(cx, cy, vel_x, vel_y, self.is_white)
+        return projectiles.spawn(cx, cy, vel_x, vel_y, self.is_white)
 
 class Platform:
     def __init__(self, x, y, width, height, is_white=True, is_neutral=False, is_slider=False, is_mystical=False, slider_range=1000, is_pillar=False):
@@ -510,6 +592,7 @@ class Platform:
         self.y = y
         self.width = width
         self.height = height
+        self.rect = pygame.Rect(x, y, width, height) # Collision rect, moved along by update
         self.is_white = is_white
         self.is_neutral = is_neutral
         self.is_pillar = is_pillar
@@ -531,6 +614,13 @@ class Platform:
         self.hatch_lines = []
         self.crystals = [] # New list for crystal shards
         
+        # Baked sprites per palette (see draw); sliders only move them
+        self._sprite_cache = {}
+        self._bounds_cache = None
+        self._visual_shift_y = 0
+        self._serial = next(_platform_serials)
+        self._cave_grid = None # Cave hatch lines bucketed per tile, built on first draw
+        
         self._generate_island_shape()
         
         if self.is_mystical:
@@ -568,9 +658,13 @@ class Platform:
                 if self.y > self.base_y: 
                     self.y = self.base_y
         
+        self.rect.y = self.y
         return dy  # Return movement delta for player sync
 
     def _shift_visuals(self, dy):
+        # Baked sprites follow the shift, no re-render needed
+        self._visual_shift_y += dy
+        
         # Shift all absolute coordinate structures
         self.island_points = [(p[0], p[1] + dy) for p in self.island_points]
         
@@ -899,6 +993,8 @@ class Platform:
     def _generate_island_shape(self):
         """Generates the jagged bottom for the floating island look"""
         self.island_points = []
+        self._sprite_cache = {} # Geometry changed, re-bake on next draw
+        self._bounds_cache = None
         
         # Top surface (flat)
         # self.island_points.append((self.x, self.y)) # Top-Left
@@ -942,6 +1038,17 @@ class Platform:
     def get_rect(self):
         return pygame.Rect(self.x, self.y, self.width, self.height)
 
+    def crystal_hitboxes(self):
+        """(left, top, width, height, is_white, is_neutral, owner) of each floor crystal, as
+        check_spike_collision builds them (the top is kept unrounded, it moves with the slide)"""
+        boxes = []
+        for crystal in self.crystals:
+            xs = [p[0] for p in crystal['points']]
+            ys = [p[1] for p in crystal['points']]
+            min_x, min_y = min(xs), min(ys)
+            boxes.append((int(min_x), min_y, int(max(xs) - min_x), int(max(ys) - min_y), self.is_white, self.is_neutral, self))
+        return boxes
+
     def check_spike_collision(self, player_rect):
         """Checks if player rect collides with any mystical floor spikes"""
         if not self.is_mystical: return False
@@ -967,188 +1074,113 @@ class Platform:
                 return True
         return False
 
-    def draw(self, screen, is_white_mode, camera=None, offset=(0,0)):
-        # SKETCH STYLE DRAWING
-        
-        # Visibility check
-        should_be_active = self.is_neutral or (self.is_white and is_white_mode) or (not self.is_white and not is_white_mode)
-        
-        # For Sketch style:
-        # If NOT active, maybe we draw it faint/dotted? 
-        # Or stick to invisible. Let's stick to invisible for clarity.
-        if not should_be_active:
-            return
+    def is_active(self, is_white_mode):
+        """Neutral platforms always show, others only in their own mode"""
+        return self.is_neutral or (self.is_white and is_white_mode) or (not self.is_white and not is_white_mode)
 
-        # Colors
+    def _palette(self, is_white_mode):
+        """Returns (cache key, ink color, fill color) for the current mode"""
         # Neutral platforms: Always GRAY (safe zones)
         # Regular platforms: Black on White (Peace) or White on Black (Tension)
-        ox, oy = offset
-        rect = self.get_rect()
-        rect.x -= ox
-        rect.y -= oy
-        
         if self.is_mystical:
-            # Mystical Cave Theme
-            ink_color = (80, 70, 100) # Dark Slate
-            fill_color = (20, 15, 25) # Very Dark Cave Rock
+            # Mystical Cave Theme (Spikes still flip with the mode)
+            return ('mystical', is_white_mode), (80, 70, 100), (20, 15, 25)
         elif self.is_neutral:
-            ink_color = (100, 100, 100)  # Dark gray outline
-            fill_color = (180, 180, 180)  # Light gray fill
+            return 'neutral', (100, 100, 100), (180, 180, 180)
         elif is_white_mode:
-            ink_color = BLACK_MATTE
-            fill_color = CREAM # Paper color
+            return 'white', BLACK_MATTE, CREAM
         else:
-            ink_color = CREAM
-            fill_color = BLACK_MATTE
-            
-        # Helper for camera apply
-        def apply_pt(pt):
-            if camera: return camera.apply_point(pt[0], pt[1])
-            # FIX: Apply manual offset
-            return (pt[0] - ox, pt[1] - oy)
-            
-        # 1. Define Visual Polygon (Top + Jagged Bottom)
-        # Top-Left, Top-Right
-        tl = (self.x, self.y)
-        tr = (self.x + self.width, self.y)
-        
-        # Combine into closed loop
-        raw_poly = [tl, tr] + self.island_points
-        
-        # Apply Camera
-        poly_points = [apply_pt(p) for p in raw_poly]
-        
-        if self.is_mystical:
-            # Mystical Cave Theme
-            ink_color = (80, 70, 100) # Dark Slate
-            fill_color = (20, 15, 25) # Very Dark Cave Rock
-        elif self.is_neutral:
-            ink_color = (100, 100, 100)  # Dark gray outline
-            fill_color = (180, 180, 180)  # Light gray fill
-        elif is_white_mode:
-            ink_color = BLACK_MATTE
-            fill_color = CREAM # Paper color
-        else:
-            ink_color = CREAM
-            fill_color = BLACK_MATTE
-            
-        # Helper for camera apply
-        def apply_pt(pt):
-            if camera: return camera.apply_point(pt[0], pt[1])
-            # FIX: Apply manual offset
-            return (pt[0] - ox, pt[1] - oy)
-            
+            return 'black', CREAM, BLACK_MATTE
+
+    def _layer_specs(self, is_white_mode, ink_color, fill_color):
+        """Lists the static visual layers as (bounding points, draw function) in draw order"""
+        island = [(self.x, self.y), (self.x + self.width, self.y)] + self.island_points
+
+        if not self.is_mystical:
+            pts = island + [p for g in self.grass_lines for p in g]
+            pts += [p for h in self.hatch_lines for p in h]
+            pts += [p for tree_parts in self.trees for b in tree_parts for p in (b['p1'], b['p2'])]
+
+            def draw_island_and_details(target, apply_pt):
+                self._draw_island(target, ink_color, fill_color, apply_pt)
+                self._draw_details(target, ink_color, apply_pt)
+            return [(pts, draw_island_and_details)]
+
+        # Mystical platforms are split so the empty cave interior is not baked
+        # (the cave hatching itself is tiled separately, see _draw_cave_tiles)
+        specs = [(island, lambda target, apply_pt: self._draw_island(target, ink_color, fill_color, apply_pt))]
+        if self.ceiling_points:
+            specs.append((self._ceiling_polygon(),
+                          lambda target, apply_pt: self._draw_ceiling(target, ink_color, fill_color, apply_pt)))
+        if self.crystals:
+            specs.append(([p for c in self.crystals for p in c['points']],
+                          lambda target, apply_pt: self._draw_crystals(target, is_white_mode, apply_pt)))
+        return specs
+
+    def get_visual_rect(self):
+        """World-space bounds of everything draw() can touch (used for culling)"""
+        if self._bounds_cache is None:
+            points = [p for pts, _ in self._layer_specs(True, None, None) for p in pts]
+            if self.is_mystical:
+                points += [p for l in self.cave_bg_lines for p in (l['p1'], l['p2'])]
+            pad = 4
+            min_x = math.floor(min(p[0] for p in points)) - pad
+            min_y = math.floor(min(p[1] for p in points)) - pad
+            max_x = math.ceil(max(p[0] for p in points)) + pad
+            max_y = math.ceil(max(p[1] for p in points)) + pad
+            self._bounds_cache = (pygame.Rect(min_x, min_y, max_x - min_x, max_y - min_y), self._visual_shift_y)
+
+        rect, baked_shift_y = self._bounds_cache
+        return rect.move(0, self._visual_shift_y - baked_shift_y)
+
+    def _bake_layers(self, is_white_mode):
+        """Renders the static visuals once into display-format sprites"""
+        _, ink_color, fill_color = self._palette(is_white_mode)
+        layers = []
+        pad = 4 # Outline / leaf overhang
+
+        for points, draw_fn in self._layer_specs(is_white_mode, ink_color, fill_color):
+            min_x = math.floor(min(p[0] for p in points)) - pad
+            min_y = math.floor(min(p[1] for p in points)) - pad
+            max_x = math.ceil(max(p[0] for p in points)) + pad
+            max_y = math.ceil(max(p[1] for p in points)) + pad
+
+            sprite = make_sprite_surface(max_x - min_x, max_y - min_y)
+            # Integer translation keeps rasterization identical to immediate mode
+            draw_fn(sprite, lambda pt, mx=min_x, my=min_y: (pt[0] - mx, pt[1] - my))
+            layers.append((sprite, min_x, min_y))
+
+        # Remember where the geometry was when baked (sliders shift it later)
+        return (layers, self._visual_shift_y)
+
+    def _draw_island(self, target, ink_color, fill_color, apply_pt):
         # 1. Define Visual Polygon (Top + Jagged Bottom)
         # Top-Left, Top-Right
         tl = (self.x, self.y)
         tr = (self.x + self.width, self.y)
-        
+
         # Combine into closed loop
-        raw_poly = [tl, tr] + self.island_points
-        
-        # Apply Camera
-        poly_points = [apply_pt(p) for p in raw_poly]
-        
+        poly_points = [apply_pt(p) for p in [tl, tr] + self.island_points]
+
         # 2. Draw Fill (Opaque background)
-        pygame.draw.polygon(screen, fill_color, poly_points)
-        
+        pygame.draw.polygon(target, fill_color, poly_points)
+
         # 3. Draw Outline (Ink)
-        pygame.draw.polygon(screen, ink_color, poly_points, 3) 
-        
-        # 4. Mystical Elements
-        if self.is_mystical:
-            time_val = pygame.time.get_ticks() / 1000.0
-            
-            # --- CEILING & BACKDROP ---
-            # 1. Background Fill (Darkness behind)
-            
-            # Let's draw the "Cave Wall" (Background)
-            # A dark rect covering the whole area? NO - SKETCH STYLE
-            # Draw faint background lines
-            for line in self.cave_bg_lines:
-                p1 = apply_pt(line['p1'])
-                p2 = apply_pt(line['p2'])
-                l_col = line['color']
-                pygame.draw.line(screen, l_col, p1, p2, 1)
-            
-            # Border lines REMOVED as per user request ("dont make a rectangle outline")
-            
-            
-            # Render Ceiling (Restored as per user request "similar to platform sketch")
-            # We want a rock mass hanging from the top.
-            # Ceiling points are the "bottom edge" of the ceiling mass.
-            # We need to close the loop by going up to the "roof" of the world (or some upper bound).
-            
-            # Use 'ceil_base_y' from generation logic (y - cave_height)
-            # Actually, _generate_cave_background uses logic: ceil_base_y = self.y - cave_height
-            # But we don't store cave_height on self. Let's assume consistent?
-            # Better: Find min Y of ceiling points and go up from there?
-            # Or just use the min Y from points as the "top"?
-            # Wait, ceiling_points ARE the jagged edge.
-            # To look like a platform, it needs thickness upwards.
-            
-            if hasattr(self, 'ceiling_points') and self.ceiling_points:
-                # Find the 'flat top' of this hanging rock (visually above visible area)
-                # Let's say 100px thick above the highest point
-                # FIX: Use 50px buffer above min_y
-                min_y = min([p[1] for p in self.ceiling_points])
-                roof_y = min_y - 50 
-                
-                # Create closed polygon:
-                # 1. Roof Top-Left
-                # 2. Roof Top-Right
-                # 3. Ceiling Points (Right to Left reversed? No, points are L->R)
-                # So: TL -> TR -> Points(R->L) -> Close
-                
-                c_tl = (self.x, roof_y)
-                c_tr = (self.x + self.width, roof_y)
-                
-                # Reverse points to trace back to left
-                jagged_bottom = list(reversed(self.ceiling_points))
-                
-                raw_ceil_poly = [c_tl, c_tr] + jagged_bottom
-                ceil_poly_pts = [apply_pt(p) for p in raw_ceil_poly]
-                
-                pygame.draw.polygon(screen, fill_color, ceil_poly_pts)
-                pygame.draw.polygon(screen, ink_color, ceil_poly_pts, 3)
-            
-            # Stalactites REMOVED
-            
-            # Draw Floor Spikes (Dynamic Colors)
-            for crystal in self.crystals:
-                 pts = [apply_pt(p) for p in crystal['points']]
-                 
-                 # Logic: If White Mode -> Black Spikes (Contrast)
-                 #        If Black Mode -> White Spikes (Contrast)
-                 if is_white_mode:
-                     s_fill = (0, 0, 0)
-                     s_outline = (255, 255, 255) # Optional: White outline for style? Or just Black
-                     # User said "make thode spikes black in color".
-                     # Let's keep it simple: Black fill, maybe no outline or White outline?
-                     # Let's do Black Fill, White Outline for visibility against potentially grey elements
-                     pygame.draw.polygon(screen, (0, 0, 0), pts) 
-                     pygame.draw.polygon(screen, (255, 255, 255), pts, 1)
-                 else:
-                     # Black Mode / Dark Cave -> White Spikes
-                     pygame.draw.polygon(screen, (255, 255, 255), pts)
-                     pygame.draw.polygon(screen, (0, 0, 0), pts, 2)
-            
-            return # Skip trees/grass for mystical
-            
+        pygame.draw.polygon(target, ink_color, poly_points, 3)
+
+    def _draw_details(self, target, ink_color, apply_pt):
         # 4. Draw Details (Grass)
         for g in self.grass_lines:
             gp1 = apply_pt(g[0])
             gp2 = apply_pt(g[1])
-            pygame.draw.line(screen, ink_color, gp1, gp2, 2)
-            
+            pygame.draw.line(target, ink_color, gp1, gp2, 2)
+
         # 5. Draw Texture (Hatching)
         # Only draw if inside polygon? simple check: y > self.y
         for h in self.hatch_lines:
-            hp1 = apply_pt(h[0])
-            hp2 = apply_pt(h[1])
             # Simple Y check to keep "under" surface
             if h[0][1] >= self.y and h[1][1] >= self.y:
-                pygame.draw.line(screen, ink_color, hp1, hp2, 1)
+                pygame.draw.line(target, ink_color, apply_pt(h[0]), apply_pt(h[1]), 1)
 
         # 6. Draw Trees
         # Trees should match ink color
@@ -1158,12 +1190,122 @@ class Platform:
                 p2 = apply_pt(branch['p2'])
                 # Tree style: varying width
                 w = branch['w']
-                pygame.draw.line(screen, ink_color, p1, p2, w)
-                
+                pygame.draw.line(target, ink_color, p1, p2, w)
+
                 # Leaf/Bush details at ends?
-                if 'w' in branch and branch['w'] <= 1:
+                if w <= 1:
                      # Draw little sketchy circle/leaves
-                     pygame.draw.circle(screen, ink_color, (int(p2[0]), int(p2[1])), 2)
+                     pygame.draw.circle(target, ink_color, (int(p2[0]), int(p2[1])), 2)
+
+    def _build_cave_grid(self):
+        """Buckets cave hatch lines by the tiles they touch"""
+        size = CAVE_TILE_SIZE
+        buckets = {}
+        for line in self.cave_bg_lines:
+            (x1, y1), (x2, y2) = line['p1'], line['p2']
+            for tx in range(math.floor((min(x1, x2) - 1) / size), math.floor((max(x1, x2) + 1) / size) + 1):
+                for ty in range(math.floor((min(y1, y2) - 1) / size), math.floor((max(y1, y2) + 1) / size) + 1):
+                    buckets.setdefault((tx, ty), []).append(line)
+        return (buckets, self._visual_shift_y)
+
+    def _bake_cave_tile(self, tx, ty, lines):
+        """Renders one tile of hatching (plus a margin so lines crossing its edge stay whole)"""
+        size, margin = CAVE_TILE_SIZE, CAVE_TILE_MARGIN
+        tile = make_sprite_surface(size + margin * 2, size + margin * 2)
+        # Integer translation keeps rasterization identical to immediate mode
+        origin_x = tx * size - margin
+        origin_y = ty * size - margin
+        for line in lines:
+            p1 = (line['p1'][0] - origin_x, line['p1'][1] - origin_y)
+            p2 = (line['p2'][0] - origin_x, line['p2'][1] - origin_y)
+            pygame.draw.line(tile, line['color'], p1, p2, 1)
+        return tile
+
+    def _draw_cave_tiles(self, screen, ox, oy):
+        """Blits the cached hatching tiles overlapping the viewport"""
+        if self._cave_grid is None:
+            self._cave_grid = self._build_cave_grid()
+        buckets, baked_shift_y = self._cave_grid
+        shift_y = self._visual_shift_y - baked_shift_y
+
+        size, margin = CAVE_TILE_SIZE, CAVE_TILE_MARGIN
+        view_w, view_h = screen.get_size()
+        # Viewport in the grid's (baked) coordinates
+        view_x = ox
+        view_y = oy - shift_y
+        area = pygame.Rect(margin, margin, size, size)
+
+        for ty in range(math.floor(view_y / size), math.floor((view_y + view_h) / size) + 1):
+            for tx in range(math.floor(view_x / size), math.floor((view_x + view_w) / size) + 1):
+                lines = buckets.get((tx, ty))
+                if not lines:
+                    continue
+                key = (self._serial, tx, ty)
+                tile = cave_tile_cache.get(key)
+                if tile is None:
+                    tile = cave_tile_cache.put(key, self._bake_cave_tile(tx, ty, lines))
+                screen.blit(tile, (tx * size - ox, ty * size + shift_y - oy), area)
+
+    def _ceiling_polygon(self):
+        """Closed polygon of the rock mass hanging above the cave"""
+        # Ceiling points are the "bottom edge" of the ceiling mass.
+        # FIX: Use 50px buffer above the highest point as the flat roof
+        min_y = min([p[1] for p in self.ceiling_points])
+        roof_y = min_y - 50
+
+        # TL -> TR -> Points(R->L) -> Close
+        c_tl = (self.x, roof_y)
+        c_tr = (self.x + self.width, roof_y)
+        return [c_tl, c_tr] + list(reversed(self.ceiling_points))
+
+    def _draw_ceiling(self, target, ink_color, fill_color, apply_pt):
+        # Render Ceiling (Rock mass, similar to platform sketch)
+        ceil_poly_pts = [apply_pt(p) for p in self._ceiling_polygon()]
+        pygame.draw.polygon(target, fill_color, ceil_poly_pts)
+        pygame.draw.polygon(target, ink_color, ceil_poly_pts, 3)
+
+    def _draw_crystals(self, target, is_white_mode, apply_pt):
+        # Draw Floor Spikes (Dynamic Colors)
+        for crystal in self.crystals:
+             pts = [apply_pt(p) for p in crystal['points']]
+
+             # Logic: If White Mode -> Black Spikes (Contrast)
+             #        If Black Mode -> White Spikes (Contrast)
+             if is_white_mode:
+                 # Black Fill, White Outline for visibility against grey elements
+                 pygame.draw.polygon(target, (0, 0, 0), pts)
+                 pygame.draw.polygon(target, (255, 255, 255), pts, 1)
+             else:
+                 # Black Mode / Dark Cave -> White Spikes
+                 pygame.draw.polygon(target, (255, 255, 255), pts)
+                 pygame.draw.polygon(target, (0, 0, 0), pts, 2)
+
+    def draw(self, screen, is_white_mode, camera=None, offset=(0,0)):
+        # SKETCH STYLE DRAWING
+
+        # For Sketch style:
+        # If NOT active, stick to invisible for clarity.
+        if not self.is_active(is_white_mode):
+            return
+
+        ox, oy = offset
+        if camera:
+            ox, oy = -camera.camera.x, -camera.camera.y
+
+        # Static visuals are baked once per palette, drawing is just blits
+        palette_key = self._palette(is_white_mode)[0]
+        cached = self._sprite_cache.get(palette_key)
+        if cached is None:
+            cached = self._bake_layers(is_white_mode)
+            self._sprite_cache[palette_key] = cached
+
+        layers, baked_shift_y = cached
+        shift_y = self._visual_shift_y - baked_shift_y
+        for i, (sprite, wx, wy) in enumerate(layers):
+            screen.blit(sprite, (wx - ox, wy + shift_y - oy))
+            if i == 0 and self.is_mystical and self.cave_bg_lines:
+                # Cave hatching sits between the island and the ceiling
+                self._draw_cave_tiles(screen, ox, oy)
 
 class Spike:
     def __init__(self, x, y, width=30, height=30, is_white=True, is_neutral=False, is_mystical=False):
@@ -1175,6 +1317,9 @@ class Spike:
         self.is_neutral = is_neutral
         self.is_mystical = is_mystical
         
+        # Baked sprite per mode (see draw)
+        self._sprite_cache = {}
+        
         # Generate shape
         self.points = []
         if self.is_mystical:
@@ -1220,41 +1365,111 @@ class Spike:
         
     def get_rect(self):
         return pygame.Rect(self.x + 5, self.y + 10, self.width - 10, self.height - 10)
-        
-    def draw(self, screen, is_white_mode, camera=None, offset=(0,0), scale=1.0):
-        # Similar visibility rules to Platforms
-        should_be_active = self.is_neutral or (self.is_white and is_white_mode) or (not self.is_white and not is_white_mode)
-        
-        if not should_be_active:
-            return
-            
-        draw_pts = self.points
-        if camera:
-            draw_pts = [camera.apply_point(p[0], p[1]) for p in self.points]
-        else:
-            ox, oy = offset
-            draw_pts = [(p[0] - ox, p[1] - oy) for p in self.points]
-            
+    
+    def get_visual_rect(self):
+        """Bounds of the drawn shape (outline included)"""
+        xs = [p[0] for p in self.points]
+        ys = [p[1] for p in self.points]
+        min_x, min_y = math.floor(min(xs)) - 2, math.floor(min(ys)) - 2
+        max_x, max_y = math.ceil(max(xs)) + 2, math.ceil(max(ys)) + 2
+        return pygame.Rect(min_x, min_y, max_x - min_x, max_y - min_y)
+
+    def is_active(self, is_white_mode):
+        """Similar visibility rules to Platforms"""
+        return self.is_neutral or (self.is_white and is_white_mode) or (not self.is_white and not is_white_mode)
+
+    def _bake(self, is_white_mode):
+        """Renders the spike once into a display-format sprite"""
+        bounds = self.get_visual_rect()
+        sprite = make_sprite_surface(bounds.width, bounds.height)
+        # Integer translation keeps rasterization identical to immediate mode
+        draw_pts = [(p[0] - bounds.x, p[1] - bounds.y) for p in self.points]
+
         # Color Logic
         if self.is_mystical:
             # Crystal Style: High Contrast
             # If White Mode (Peace) -> Black Spikes
             # If Black Mode (Tension) -> White Spikes
             if is_white_mode:
-                pygame.draw.polygon(screen, (0, 0, 0), draw_pts) # Black fill
-                pygame.draw.polygon(screen, (255, 255, 255), draw_pts, 1) # White outline
+                pygame.draw.polygon(sprite, (0, 0, 0), draw_pts) # Black fill
+                pygame.draw.polygon(sprite, (255, 255, 255), draw_pts, 1) # White outline
             else:
-                pygame.draw.polygon(screen, (255, 255, 255), draw_pts) # White fill
-                pygame.draw.polygon(screen, (0, 0, 0), draw_pts, 2) # Black outline
+                pygame.draw.polygon(sprite, (255, 255, 255), draw_pts) # White fill
+                pygame.draw.polygon(sprite, (0, 0, 0), draw_pts, 2) # Black outline
         else:
             # Standard Spikes - Final Fix (White on Black, Black on White)
             # if is_white_mode (Light BG) -> Black Spikes
             # if not is_white_mode (Dark BG) -> White Spikes
             color = (20, 20, 20) if is_white_mode else (230, 230, 230)
-            pygame.draw.polygon(screen, color, draw_pts)
+            pygame.draw.polygon(sprite, color, draw_pts)
+        return (sprite, bounds.x, bounds.y)
+
+    def draw(self, screen, is_white_mode, camera=None, offset=(0,0), scale=1.0):
+        if not self.is_active(is_white_mode):
+            return
+
+        ox, oy = offset
+        if camera:
+            ox, oy = -camera.camera.x, -camera.camera.y
+
+        cached = self._sprite_cache.get(is_white_mode)
+        if cached is None:
+            cached = self._bake(is_white_mode)
+            self._sprite_cache[is_white_mode] = cached
+
+        sprite, wx, wy = cached
+        screen.blit(sprite, (wx - ox, wy - oy))
+
+def _projectile_frame(visual_type, color, step):
+    """Pre-rendered projectile look for a wobble phase (ORB) or rotation step (SHURIKEN), centered on its anchor"""
+    key = (visual_type, color, step)
+    frame = _projectile_frames.get(key)
+    if frame is None:
+        radius = 5
+        if visual_type == "SHURIKEN":
+            # Star shape, 4-fold symmetric so a quarter turn covers every rotation
+            rotation = step * (math.pi / 2) / SHURIKEN_ROTATION_STEPS
+            num_spikes = 4
+            inner_r = radius * 0.4
+            outer_r = radius * 2.5 # Make them largeish
+            anchor = math.ceil(outer_r) + 1
+            points = []
+            for i in range(num_spikes * 2):
+                angle = (i / (num_spikes * 2)) * 2 * math.pi + rotation
+                r = outer_r if i % 2 == 0 else inner_r
+                points.append((anchor + math.cos(angle) * r, anchor + math.sin(angle) * r))
+            frame = make_sprite_surface(anchor * 2 + 1, anchor * 2 + 1)
+            pygame.draw.polygon(frame, color, points)
+            pygame.draw.polygon(frame, WHITE, points, 1) # Outline for visibility
+        else:
+            # Wobbling blob, the wobble repeats every 2*pi of timer
+            timer = step * 2 * math.pi / PROJECTILE_WOBBLE_PHASES
+            anchor = radius + 6
+            num_points = 20
+            points = []
+            for i in range(num_points):
+                angle = (i / num_points) * 2 * math.pi
+                
+                # Wobble logic
+                wobble = math.sin(angle * 5 + timer) * 3
+                wobble += math.cos(angle * 3 - timer * 2) * 2
+                
+                r = radius + wobble
+                points.append((anchor + math.cos(angle) * r, anchor + math.sin(angle) * r))
+            frame = make_sprite_surface(anchor * 2 + 1, anchor * 2 + 1)
+            pygame.draw.polygon(frame, color, points)
+        _projectile_frames[key] = frame
+    return frame
 
 class Projectile:
+    __slots__ = ('x', 'y', 'start_x', 'start_y', 'vx', 'vy', 'radius', 'is_white_source', 'is_player_shot',
+                 'visual_type', 'rotation', 'color', 'marked_for_deletion', 'timer', 'max_distance', 'slot')
+
     def __init__(self, x, y, vx, vy, is_white_source=True, is_player_shot=True, visual_type="ORB"):
+        self.reset(x, y, vx, vy, is_white_source, is_player_shot, visual_type)
+
+    def reset(self, x, y, vx, vy, is_white_source=True, is_player_shot=True, visual_type="ORB"):
+        """(Re)initializes the projectile, pooled ones are recycled through here"""
         self.x = x
         self.y = y
         self.start_x = x  # Track starting position
@@ -1279,14 +1494,14 @@ class Projectile:
         
         # Max travel distance (prevents sniping from across the map)
         self.max_distance = 400  # Pixels
-        
-        # Dynamic shape seed
-        self.seed = random.random() * 100
+        self.slot = -1 # Index in its ProjectilePool
     
     def update(self, offset=(0,0)):
         self.x += self.vx
         self.y += self.vy
         self.timer += 0.2
+        if self.visual_type == "SHURIKEN":
+            self.rotation += 0.5 # Spin speed (per tick, drawing only reads it)
         
         # Check distance traveled
         dx = self.x - self.start_x
@@ -1306,148 +1521,95 @@ class Projectile:
     def get_rect(self):
         return pygame.Rect(self.x - self.radius, self.y - self.radius, self.radius * 2, self.radius * 2)
 
-    def draw(self, screen, camera=None, offset=(0,0), scale=1.0):
-        # Generate points in WORLD SPACE first, then apply camera/offset
-        num_points = 20
-        points = []
-        
-        # Center in World Space
-        cx, cy = self.x, self.y
-        
-        for i in range(num_points):
-            angle = (i / num_points) * 2 * math.pi
-            
-            # Wobble logic
-            wobble = math.sin(angle * 5 + self.timer) * 3
-            wobble += math.cos(angle * 3 - self.timer * 2) * 2
-            
-            r = self.radius + wobble
-            
-            px = cx + math.cos(angle) * r
-            py = cy + math.sin(angle) * r
-            points.append((px, py))
-            
+    def stamp(self, camera=None, offset=(0,0)):
+        """(frame, screen position) of the baked look for this frame, for batching into blits"""
         if self.visual_type == "SHURIKEN":
             # Draw Spinning Shuriken (Star)
-            self.rotation += 0.5 # Spin speed
-            
-            # Star shape
-            star_pts = []
-            num_spikes = 4
-            inner_r = self.radius * 0.4
-            outer_r = self.radius * 2.5 # Make them largeish
-            
-            for i in range(num_spikes * 2):
-                angle = (i / (num_spikes * 2)) * 2 * math.pi + self.rotation
-                r = outer_r if i % 2 == 0 else inner_r
-                
-                px = cx + math.cos(angle) * r
-                py = cy + math.sin(angle) * r
-                star_pts.append((px, py))
-            
-            # Apply transformation
-            if camera:
-                star_pts = [camera.apply_point(p[0], p[1]) for p in star_pts]
-            else:
-                ox, oy = offset
-                star_pts = [(p[0] - ox, p[1] - oy) for p in star_pts]
-            
-            pygame.draw.polygon(screen, self.color, star_pts)
-            pygame.draw.polygon(screen, WHITE, star_pts, 1) # Outline for visibility
-            
+            step = int(round(self.rotation / (math.pi / 2) * SHURIKEN_ROTATION_STEPS)) % SHURIKEN_ROTATION_STEPS
         else:
-            # Default ORB drawing
-            # Apply transformation ONLY ONCE
-            if camera:
-                points = [camera.apply_point(p[0], p[1]) for p in points]
-            else:
-                ox, oy = offset
-                points = [(p[0] - ox, p[1] - oy) for p in points]
-                
-            pygame.draw.polygon(screen, self.color, points)
+            step = int(round(self.timer / (2 * math.pi) * PROJECTILE_WOBBLE_PHASES)) % PROJECTILE_WOBBLE_PHASES
+        frame = _projectile_frame(self.visual_type, self.color, step)
         
-        # Trail/Tail particles?
-        # Maybe complex for now, let's stick to the blob.
+        # Center in World Space, then apply camera/offset
+        if camera:
+            cx, cy = camera.apply_point(self.x, self.y)
+        else:
+            cx, cy = self.x - offset[0], self.y - offset[1]
+        anchor = frame.get_width() // 2
+        return frame, (round(cx) - anchor, round(cy) - anchor)
+
+    def draw(self, screen, camera=None, offset=(0,0), scale=1.0):
+        screen.blit(*self.stamp(camera, offset))
+
+class ProjectilePool:
+    """Fixed-capacity set of live projectiles: objects are recycled and removal is an O(1) swap-remove"""
+    def __init__(self, capacity=PROJECTILE_CAPACITY):
+        self.capacity = capacity
+        self.active = []
+        self.free = [Projectile(0, 0, 0, 0) for _ in range(capacity)]
+
+    def spawn(self, x, y, vx, vy, is_white_source=True, is_player_shot=True, visual_type="ORB"):
+        """Activates a recycled projectile, or returns None when the pool is exhausted"""
+        if not self.free:
+            return None
+        proj = self.free.pop()
+        proj.reset(x, y, vx, vy, is_white_source, is_player_shot, visual_type)
+        proj.slot = len(self.active)
+        self.active.append(proj)
+        return proj
+
+    def release(self, proj):
+        """Removes proj by moving the last projectile into its slot"""
+        active = self.active
+        last = active.pop()
+        if last is not proj:
+            active[proj.slot] = last
+            last.slot = proj.slot
+        proj.slot = -1
+        self.free.append(proj)
+
+    def clear(self):
+        for proj in self.active:
+            proj.slot = -1
+        self.free.extend(self.active)
+        self.active = []
+
+    def __iter__(self):
+        # Back to front, so releasing the current projectile never skips one
+        return reversed(self.active)
+
+    def __len__(self):
+        return len(self.active)
 
 class SplatBlast:
-    def __init__(self, x, y, color):
+    """Ink splash on impact, an emitter of droplets into a ParticleSystem (the world's)"""
+    def __init__(self, x, y, color, particles):
         self.x = x
         self.y = y
         self.color = color
-        self.particles = []
         self.timer = 0
         self.lifetime = 30 # Longer lifetime for fluid feel
         
-        # 1. Main Splash Burst (Large blobs)
-        for _ in range(15):
-            angle = random.uniform(0, 2 * math.pi)
-            speed = random.uniform(2, 12)
-            vx = math.cos(angle) * speed
-            vy = math.sin(angle) * speed
-            size = random.uniform(4, 10)
-            self.particles.append({
-                'x': 0, 
-                'y': 0, 
-                'vx': vx, 
-                'vy': vy, 
-                'size': size,
-                'decay': 0.9, # Slow decay
-                'drag': 0.85  # Fast drag (fluid stopping)
-            })
-            
+        # 1. Main Splash Burst (Large blobs): slow decay, fast drag (fluid stopping)
+        self._burst(particles, 15, 2, 12, 4, 10, decay=0.9, drag=0.85)
         # 2. High Velocity Droplets (Tiny, fast)
-        for _ in range(20):
-            angle = random.uniform(0, 2 * math.pi)
-            speed = random.uniform(10, 20)
-            vx = math.cos(angle) * speed
-            vy = math.sin(angle) * speed
-            size = random.uniform(2, 4)
-            self.particles.append({
-                'x': 0, 
-                'y': 0, 
-                'vx': vx, 
-                'vy': vy, 
-                'size': size,
-                'decay': 0.95, 
-                'drag': 0.9
-            })
+        self._burst(particles, 20, 10, 20, 2, 4, decay=0.95, drag=0.9)
+        
+    def _burst(self, particles, count, min_speed, max_speed, min_size, max_size, decay, drag):
+        angle = np.random.uniform(0, 2 * math.pi, count)
+        speed = np.random.uniform(min_speed, max_speed, count)
+        # Gravity? Maybe slight gravity for "drip"
+        particles.emit(count, DISC, self.color, ttl=self.lifetime, x=self.x, y=self.y,
+                       vx=np.cos(angle) * speed, vy=np.sin(angle) * speed, drag=drag, gravity=0.5,
+                       size=np.random.uniform(min_size, max_size, count), decay=decay)
             
     def update(self):
+        # Droplets are advanced by particles.update() with everything else
         self.timer += 1
-        
-        for p in self.particles:
-            p['x'] += p['vx']
-            p['y'] += p['vy']
-            
-            # Physics
-            p['vx'] *= p['drag']
-            p['vy'] *= p['drag']
-            
-            # Gravity? Maybe slight gravity for "drip"
-            p['vy'] += 0.5
-            
-            # Shrink
-            p['size'] *= p['decay']
             
     def draw(self, screen, camera=None, offset=(0,0), scale=1.0):
-        ox, oy = offset
-        for p in self.particles:
-            if p['size'] < 1:
-                continue
-            
-            # World Space P
-            wx = self.x + p['x']
-            wy = self.y + p['y']
-            
-            if camera:
-                draw_x, draw_y = camera.apply_point(wx, wy)
-            else:
-                draw_x = wx - ox
-                draw_y = wy - oy
-            
-            # Draw circle or maybe a small polygon for jaggedness?
-            # Circle is "fluid" enough
-            pygame.draw.circle(screen, self.color, (int(draw_x), int(draw_y)), int(p['size']))
+        # Droplets are stamped in one batch by particles.draw()
+        pass
 
 class SlashWave:
     def __init__(self, x, y, angle):
@@ -1504,7 +1666,7 @@ class SlashWave:
             noise = math.sin(t * freq + self.timer * 0.5) * amp
             
             # Apply secondary jitter?
-            jitter = (random.random() - 0.5) * 3
+            jitter = (draw_random.random() - 0.5) * 3
             
             current_r = radius + noise + jitter
             
@@ -1541,35 +1703,24 @@ class BlackHole:
         self.pulse_timer = 0.0
         self.active = True
         
-        # Create wavy sphere lines - horizontal latitude lines that flow
-        self.sphere_lines = []
+        # Wavy sphere lines - horizontal latitude rings that flow, one array entry per dot
         num_latitudes = 24  # Number of horizontal rings (increased for density)
         dots_per_line = 80  # Dots per ring (increased for density)
         
-        for lat in range(num_latitudes):
-            lat_angle = (lat / num_latitudes) * math.pi  # 0 to PI (top to bottom)
-            ring_radius = math.sin(lat_angle) * self.radius  # Varies with latitude
-            y_offset = math.cos(lat_angle) * self.radius * 0.6  # Y position for 3D effect
-            
-            line_dots = []
-            for dot in range(dots_per_line):
-                dot_angle = (dot / dots_per_line) * math.pi * 2
-                # Add wave offset that varies per latitude for flowing effect
-                wave_offset = random.uniform(0, math.pi * 2)
-                wave_amplitude = random.uniform(3, 8)
-                line_dots.append({
-                    'base_angle': dot_angle,
-                    'wave_offset': wave_offset,
-                    'wave_amp': wave_amplitude,
-                    'size': random.randint(1, 3)
-                })
-            
-            self.sphere_lines.append({
-                'ring_radius': ring_radius,
-                'y_offset': y_offset,
-                'dots': line_dots,
-                'flow_speed': random.uniform(0.3, 0.8)
-            })
+        lat_angle = np.arange(num_latitudes) / num_latitudes * math.pi  # 0 to PI (top to bottom)
+        ring_radius = np.sin(lat_angle) * self.radius  # Varies with latitude
+        y_offset = np.cos(lat_angle) * self.radius * 0.6  # Y position for 3D effect
+        flow_speed = np.array([random.uniform(0.3, 0.8) for _ in range(num_latitudes)])
+        
+        shape = (num_latitudes, dots_per_line)
+        self.dot_ring_radius = np.repeat(ring_radius, dots_per_line)
+        self.dot_y_offset = np.repeat(y_offset, dots_per_line)
+        self.dot_flow_speed = np.repeat(flow_speed, dots_per_line)
+        self.dot_base_angle = np.tile(np.arange(dots_per_line) / dots_per_line * math.pi * 2, num_latitudes)
+        # Wave offset that varies per dot for the flowing effect
+        self.dot_wave_offset = np.random.uniform(0, math.pi * 2, shape).ravel()
+        self.dot_wave_amp = np.random.uniform(3, 8, shape).ravel()
+        self.dot_size = np.random.randint(1, 4, shape).ravel()
         
     def get_rect(self):
         return pygame.Rect(self.x - self.radius//2, self.y - self.radius//2, self.radius, self.radius)
@@ -1597,42 +1748,38 @@ class BlackHole:
         # Pulsing effect
         pulse = 0.9 + 0.1 * math.sin(self.pulse_timer * 3)
         
-        # Dot color based on mode
+        # Core color based on mode (the dots' come with their stamps, see DotStamps)
         if is_white_mode:
-            dot_color = (30, 30, 40)  # Dark dots on light background
             core_color = (10, 10, 15)
         else:
-            dot_color = (220, 220, 230)  # Light dots on dark background
             core_color = (5, 5, 10)
         
-        # Draw wavy sphere lines
-        for line in self.sphere_lines:
-            ring_r = line['ring_radius'] * pulse
-            y_off = line['y_offset'] * pulse
-            
-            for dot_data in line['dots']:
-                # Calculate angle with rotation and wave
-                wave = math.sin(self.pulse_timer * line['flow_speed'] * 5 + dot_data['wave_offset']) * dot_data['wave_amp']
-                current_angle = dot_data['base_angle'] + self.rotation
-                
-                # 3D projection - dots move along the latitude ring
-                dot_x = screen_x + int(math.cos(current_angle) * ring_r)
-                dot_y = screen_y + int(y_off + math.sin(current_angle * 3 + self.pulse_timer * 2) * wave)
-                
-                # Only draw dots on the "front" half of the sphere (simple depth check)
-                depth = math.sin(current_angle)
-                if depth > -0.3:  # Show front-ish dots
-                    # Size varies with depth for 3D effect
-                    size = max(1, int(dot_data['size'] * (0.5 + depth * 0.5)))
-                    # Alpha/brightness varies with depth
-                    if is_white_mode:
-                        brightness = max(20, int(40 * (0.3 + depth * 0.7)))
-                        color = (brightness, brightness, brightness + 10)
-                    else:
-                        brightness = max(150, int(255 * (0.5 + depth * 0.5)))
-                        color = (brightness, brightness, min(255, brightness + 20))
-                    
-                    pygame.draw.circle(screen, color, (dot_x, dot_y), size)
+        # Draw wavy sphere lines, all dots in one vectorized pass
+        ring_r = self.dot_ring_radius * pulse
+        y_off = self.dot_y_offset * pulse
+        wave = np.sin(self.pulse_timer * self.dot_flow_speed * 5 + self.dot_wave_offset) * self.dot_wave_amp
+        current_angle = self.dot_base_angle + self.rotation
+        
+        # Only draw dots on the "front" half of the sphere (simple depth check)
+        depth = np.sin(current_angle)
+        front = depth > -0.3  # Show front-ish dots
+        current_angle = current_angle[front]
+        depth = depth[front]
+        
+        # 3D projection - dots move along the latitude ring
+        dot_x = screen_x + (np.cos(current_angle) * ring_r[front]).astype(np.int32)
+        dot_y = screen_y + (y_off[front] + np.sin(current_angle * 3 + self.pulse_timer * 2) * wave[front]).astype(np.int32)
+        
+        # Size varies with depth for 3D effect
+        size = np.maximum(1, (self.dot_size[front] * (0.5 + depth * 0.5)).astype(np.int32))
+        # Alpha/brightness varies with depth
+        if is_white_mode:
+            brightness = np.maximum(20, (40 * (0.3 + depth * 0.7)).astype(np.int32))
+        else:
+            brightness = np.maximum(150, (255 * (0.5 + depth * 0.5)).astype(np.int32))
+        
+        # Rasterize by stamping pre-rendered dots, each anchored on its center
+        _portal_dots[is_white_mode].draw(screen, dot_x, dot_y, size, brightness)
         
         # Draw dark center core
         core_radius = int(self.radius * 0.3 * pulse)
@@ -1647,8 +1794,8 @@ class BlackHole:
 
 
 class Shard:
-    """A triangular shard from the player's shattered body"""
-    def __init__(self, x, y, color, speed_mult=1.0):
+    """A triangular shard from the player's shattered body, emitted into a ParticleSystem (the world's)"""
+    def __init__(self, x, y, color, particles, speed_mult=1.0):
         self.x = x
         self.y = y
         self.color = color
@@ -1656,70 +1803,19 @@ class Shard:
         # Random velocity (explode outwards)
         angle = random.uniform(0, 6.28)
         speed = random.uniform(2, 8) * speed_mult
-        self.vx = math.cos(angle) * speed
-        self.vy = math.sin(angle) * speed - random.uniform(2, 5) # Initial upward pop
+        vx = math.cos(angle) * speed
+        vy = math.sin(angle) * speed - random.uniform(2, 5) # Initial upward pop
         
-        self.gravity = 0.5
-        
-        # Triangle shape offsets
-        size = random.randint(5, 12)
-        self.points = [
-            (random.uniform(-size, size), random.uniform(-size, size)),
-            (random.uniform(-size, size), random.uniform(-size, size)),
-            (random.uniform(-size, size), random.uniform(-size, size))
-        ]
-        
-        self.angle = 0
-        self.rot_speed = random.uniform(-0.2, 0.2)
-        
-        self.alpha = 255
-        self.fade_speed = random.uniform(2, 5)
+        # Rotates and fades until the pool drops it
+        particles.emit(1, SHARD, color, x=x, y=y, vx=vx, vy=vy, gravity=0.5,
+                       shape=random.randrange(SHARD_SHAPES), spin=random.uniform(-0.2, 0.2),
+                       alpha=255, fade=random.uniform(2, 5))
 
     def update(self):
-        self.x += self.vx
-        self.y += self.vy
-        self.vy += self.gravity
-        self.angle += self.rot_speed
-        
-        self.alpha -= self.fade_speed
-        if self.alpha < 0: self.alpha = 0
+        # Advanced by particles.update()
+        pass
 
     def draw(self, screen, camera=None, offset=(0,0)):
-        if self.alpha <= 0: return
-
-        ox, oy = offset
-        if camera:
-            cx, cy = camera.apply_point(self.x, self.y)
-        else:
-            cx, cy = self.x - ox, self.y - oy
-
-        # Rotate points
-        rotated_pts = []
-        cos_a = math.cos(self.angle)
-        sin_a = math.sin(self.angle)
-        
-        for px, py in self.points:
-            # Rotate
-            rx = px * cos_a - py * sin_a
-            ry = px * sin_a + py * cos_a
-            # Translate
-            rotated_pts.append((cx + rx, cy + ry))
-            
-        # Draw with alpha manually since direct polygon alpha is tricky
-        # Just drawing solid for now as per previous plan, maybe implement temp surface if fading looks bad
-        # Re-using the temp surface approach from previous attempt logic
-        
-        min_x = min([p[0] for p in rotated_pts])
-        max_x = max([p[0] for p in rotated_pts])
-        min_y = min([p[1] for p in rotated_pts])
-        max_y = max([p[1] for p in rotated_pts])
-        w = int(max_x - min_x) + 2
-        h = int(max_y - min_y) + 2
-        
-        if w > 0 and h > 0:
-            s = pygame.Surface((w, h), pygame.SRCALPHA)
-            surf_pts = [(p[0] - min_x, p[1] - min_y) for p in rotated_pts]
-            color_with_alpha = (*self.color, int(self.alpha))
-            pygame.draw.polygon(s, color_with_alpha, surf_pts)
-            screen.blit(s, (min_x, min_y))
+        # Stamped in one batch by particles.draw()
+        pass
 
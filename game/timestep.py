@@ -0,0 +1,65 @@
+from .settings import *
+
+class FixedTimestep:
+    """Accumulator for a fixed simulation rate: frames add their real time, whole ticks are taken out"""
+    def __init__(self, rate=SIM_TICK_RATE, max_steps=SIM_MAX_CATCHUP):
+        self.step = 1.0 / rate
+        self.max_steps = max_steps
+        self.accumulator = 0.0
+
+    def advance(self, dt):
+        """Adds a frame's time, returns how many ticks to run now"""
+        self.accumulator += dt
+        steps = int(self.accumulator / self.step)
+        if steps > self.max_steps:
+            # Spiral of death guard: past the cap the backlog is dropped (the game slows down
+            # instead of spending ever longer frames catching up)
+            steps = self.max_steps
+            self.accumulator %= self.step
+        else:
+            self.accumulator -= steps * self.step
+        return steps
+
+    @property
+    def alpha(self):
+        """How far into the next tick this frame is (0.0 to 1.0), for interpolated drawing"""
+        return min(1.0, self.accumulator / self.step)
+
+    def reset(self):
+        self.accumulator = 0.0
+
+class Interpolator:
+    """Draws moving objects part way between where they were before the last tick and where they are now"""
+    def __init__(self, max_jump=SIM_MAX_INTERP_JUMP):
+        self.max_jump = max_jump
+        self.previous = [] # (object, attribute, value before the tick)
+        self.current = [] # (object, attribute, value after the tick) while blended
+
+    def clear(self):
+        self.previous = []
+
+    def snapshot(self, objects, attrs=('x', 'y')):
+        """Remembers attrs of objects, call right before the tick moves them"""
+        self.previous.extend((obj, attr, getattr(obj, attr)) for obj in objects for attr in attrs)
+
+    def blend(self, alpha):
+        """Moves the remembered objects alpha of the way through the last tick (undo with restore)"""
+        self.current = []
+        for obj, attr, before in self.previous:
+            now = getattr(obj, attr)
+            # Teleports (respawns, reused pool slots) are drawn where they landed
+            if now == before or abs(now - before) > self.max_jump:
+                continue
+            self.current.append((obj, attr, now))
+            setattr(obj, attr, before + (now - before) * alpha)
+
+    def restore(self):
+        for obj, attr, now in self.current:
+            setattr(obj, attr, now)
+        self.current = []
+
+def lerp(before, now, alpha, max_jump=SIM_MAX_INTERP_JUMP):
+    """Blends a single value the way Interpolator does"""
+    if abs(now - before) > max_jump:
+        return now
+    return before + (now - before) * alpha
@@ -0,0 +1,122 @@
+"""Developer tools, kept out of the game package's imports:
+
+    python -m game.tools soak [--render]         Bot plays every level headless, ticks timed
+    python -m game.tools postfx                  draw_distortion against TensionPostFX
+    python -m game.tools present                 flip against the SDL renderer backend
+    python -m game.tools replay FILE [--render]  Plays a recording (see replay.py) back and times it
+"""
+import pygame
+import sys
+import time
+from .settings import *
+from .world import GameWorld, Inputs, HeldKeys, NEXT_LEVEL
+from .utils import draw_distortion
+from .postfx import TensionPostFX
+from .present import TextureDisplay, Window, scale_canvas
+from .replay import play as play_replay
+
+def soak(ticks=3600, render=False):
+    """Plays every level headless with a scripted bot (run right, jump, swap, shoot) and times the ticks"""
+    pygame.init()
+    pygame.display.set_mode((1, 1), pygame.HIDDEN)
+    surface = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT))
+    for level in NEXT_LEVEL:
+        world = GameWorld(level)
+        deaths = 0
+        respawns = 0
+        start = time.perf_counter()
+        for tick in range(ticks):
+            keys = {pygame.K_d}
+            if tick % 45 < 10:
+                keys.add(pygame.K_SPACE)
+            inputs = Inputs(HeldKeys(keys), (SCREEN_WIDTH, SCREEN_HEIGHT // 2),
+                            swap=tick % 240 == 0, click=tick % 20 == 0)
+            if "respawn" in world.step(inputs):
+                respawns += 1
+            if world.game_over:
+                deaths += 1
+                world.load(world.level)
+            elif world.next_level:
+                world.load(world.level)
+            if render:
+                world.render(surface)
+        elapsed = time.perf_counter() - start
+        print(f"{level}: {ticks / elapsed:.0f} ticks/s ({elapsed / ticks * 1000:.2f}ms), {deaths} deaths, {respawns} void respawns")
+    pygame.quit()
+
+def benchmark_postfx():
+    """Times the legacy draw_distortion against TensionPostFX at a few canvas sizes"""
+    pygame.init()
+    pygame.display.set_mode((1, 1), pygame.HIDDEN)
+    fx = TensionPostFX(seed=0)
+    frames = 300
+    for size in [(1280, 720), (1920, 1080), (3840, 2160)]:
+        surface = pygame.Surface(size).convert()
+        for intensity in (0.3, 1.0):
+            results = []
+            for name, fn in (("legacy", draw_distortion), ("postfx", fx.apply)):
+                fn(surface, intensity) # Warm up caches
+                start = time.perf_counter()
+                for _ in range(frames):
+                    fn(surface, intensity)
+                results.append(f"{name} {(time.perf_counter() - start) / frames * 1000:.2f}ms")
+            print(f"{size[0]}x{size[1]} @ {intensity:.1f}: " + ", ".join(results))
+    pygame.quit()
+
+def benchmark_present():
+    """Times presenting a base (1280x720) and a native canvas with display.flip and with the SDL renderer"""
+    pygame.init()
+    frames = 60
+    texture_display = TextureDisplay() if Window is not None else None
+    for size in [(1280, 720), (1920, 1080), (3840, 2160)]:
+        screen = pygame.display.set_mode(size)
+        def flip_present(canvas):
+            scale_canvas(screen, canvas)
+            pygame.display.flip()
+        paths = [("flip", flip_present)]
+        if texture_display:
+            texture_display.set_mode(size, False)
+            renderer = "software" if texture_display.software else "accelerated"
+            paths.append((f"texture ({renderer})", texture_display.present))
+        for name, present in paths:
+            results = []
+            for canvas_size in [(SCREEN_WIDTH, SCREEN_HEIGHT), size]:
+                canvas = pygame.Surface(canvas_size)
+                canvas.fill((245, 245, 245))
+                present(canvas) # Warm up textures
+                start = time.perf_counter()
+                for _ in range(frames):
+                    present(canvas)
+                results.append(f"{canvas_size[0]}x{canvas_size[1]} canvas {(time.perf_counter() - start) / frames * 1000:.2f}ms")
+            print(f"{size[0]}x{size[1]} {name}: " + ", ".join(results))
+    pygame.quit()
+
+def replay(args):
+    """Plays a recording back and times it (one file per run, so every replay starts from cold caches)"""
+    paths = [arg for arg in args if not arg.startswith("--")]
+    if len(paths) != 1:
+        print("usage: python -m game.tools replay FILE [--render]")
+        return
+    pygame.init()
+    pygame.display.set_mode((1, 1), pygame.HIDDEN)
+    render = "--render" in args
+    ticks, sim_time, render_time, digest = play_replay(paths[0], render)
+    line = f"{paths[0]}: {ticks} ticks, sim {sim_time / max(1, ticks) * 1000:.3f}ms/tick"
+    if render:
+        line += f", render {render_time / max(1, ticks) * 1000:.3f}ms/frame, frames {digest:08x}"
+    print(line)
+    pygame.quit()
+
+COMMANDS = {
+    "soak": lambda args: soak(render="--render" in args),
+    "postfx": lambda args: benchmark_postfx(),
+    "present": lambda args: benchmark_present(),
+    "replay": replay,
+}
+
+if __name__ == "__main__":
+    command = COMMANDS.get(sys.argv[1] if len(sys.argv) > 1 else None)
+    if command is None:
+        print(__doc__)
+    else:
+        command(sys.argv[2:])
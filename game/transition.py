@@ -0,0 +1,94 @@
+import pygame
+import math
+import numpy as np
+
+class MaskTransition:
+    """Circular mask-swap wipe: the new state grows out of a circle over the last shown frame"""
+    def __init__(self):
+        self.active = False
+        self.old_frame = None # Persistent copy of the frame shown when the swap started
+        self.center = (0, 0)
+        self.radius = 0
+        self.speed = 0
+        self.max_radius = 0
+        self.spans = [] # Blits of the old frame for the current radius (see _spans)
+        self.spans_key = None
+        self.under = None # What the HUD covered on the last frame (see cover)
+        self.under_areas = []
+
+    def start(self, last_frame, center, speed):
+        """Begins a wipe from center, keeping a copy of last_frame as the old image"""
+        size = last_frame.get_size()
+        if self.old_frame is None or self.old_frame.get_size() != size:
+            self.old_frame = pygame.Surface(size, 0, last_frame) # Same pixel format, plain copies
+        self.old_frame.blit(last_frame, (0, 0))
+        if self.under is not None and self.under.get_size() == size:
+            # HUD-free old image, the new HUD is drawn over the wipe
+            self.old_frame.blits([(self.under, rect.topleft, rect) for rect in self.under_areas], doreturn=False)
+
+        self.center = (int(center[0]), int(center[1]))
+        self.radius = 0
+        self.spans_key = None
+        self.speed = speed
+        # Done once the circle covers the farthest corner
+        w, h = size
+        cx, cy = self.center
+        self.max_radius = max(math.hypot(x - cx, y - cy) for x in (0, w) for y in (0, h)) + 1
+        self.active = True
+
+    def update(self):
+        self.radius += self.speed
+        if self.radius > self.max_radius:
+            self.active = False
+
+    def cover(self, canvas, areas):
+        """Keeps what overlays drawn over the world (HUD, debug line) are about to cover on canvas,
+        so a wipe started next frame takes them off the old image"""
+        size = canvas.get_size()
+        if self.under is None or self.under.get_size() != size:
+            self.under = pygame.Surface(size, 0, canvas)
+        self.under.blits([(canvas, rect.topleft, rect) for rect in areas], doreturn=False)
+        self.under_areas = areas
+
+    def _spans(self, w, h):
+        """Old frame areas outside the circle: bands above and below it, then each run of rows it
+        crosses (rows with the same chord merged into one rect) left and right of the chord"""
+        old = self.old_frame
+        cx, cy = self.center
+        r = self.radius
+
+        top = max(0, min(h, int(math.ceil(cy - r))))
+        bottom = max(0, min(h, int(math.floor(cy + r)) + 1))
+        spans = []
+        if top > 0:
+            spans.append((old, (0, 0), (0, 0, w, top)))
+        if bottom < h:
+            spans.append((old, (0, bottom), (0, bottom, w, h - bottom)))
+        if bottom <= top:
+            return spans
+
+        dy = np.arange(top, bottom) + 0.5 - cy
+        half = np.sqrt(np.maximum(0.0, r * r - dy * dy))
+        # Truncated towards zero like int(), then clipped to the canvas
+        left = np.clip((cx - half + 0.5).astype(np.int64), 0, w)
+        right = np.clip((cx + half + 0.5).astype(np.int64), 0, w)
+        breaks = np.flatnonzero((np.diff(left) != 0) | (np.diff(right) != 0)) + 1
+        starts = [0] + breaks.tolist()
+        ends = breaks.tolist() + [len(left)]
+        for start, end, l, rt in zip(starts, ends, left[starts].tolist(), right[starts].tolist()):
+            y = top + start
+            rows = end - start
+            if l > 0:
+                spans.append((old, (0, y), (0, y, l, rows)))
+            if rt < w:
+                spans.append((old, (rt, y), (rt, y, w - rt, rows)))
+        return spans
+
+    def draw(self, canvas):
+        """Paints the old frame outside the circle over canvas (which holds the new state)"""
+        key = (self.radius, canvas.get_size())
+        if key != self.spans_key:
+            # Frames between two ticks share a radius
+            self.spans = self._spans(*canvas.get_size())
+            self.spans_key = key
+        canvas.blits(self.spans, doreturn=False)
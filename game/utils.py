@@ -1,7 +1,11 @@
 import pygame
-import random
+import bisect
+from operator import attrgetter, methodcaller
+import numpy as np
 from .settings import *
-from .enemy import ShadowSelf
+from .chunks import ChunkRenderer
+from .fonts import render_text
+from .cache import draw_random
 
 class Camera:
     def __init__(self, width, height):
@@ -38,8 +42,104 @@ class Camera:
         # Simple lerp
         self.camera = pygame.Rect(x, y, self.width, self.height)
 
+class SpatialIndex:
+    """X-sorted interval list of level objects for fast viewport / collision queries (rect_of picks the rect)"""
+    def __init__(self, objects, rect_of=methodcaller('get_visual_rect')):
+        self.rect_of = rect_of
+        # Entries keep the list order so overlapping objects draw (and collide) as before
+        entries = []
+        for order, obj in enumerate(objects):
+            bounds = rect_of(obj)
+            entries.append((bounds.left, bounds.right, order, obj))
+        entries.sort(key=lambda e: e[0])
+        
+        self.entries = entries
+        self.lefts = [e[0] for e in entries]
+        self.max_width = max([e[1] - e[0] for e in entries], default=0)
+        
+    def query(self, rect):
+        """Returns objects overlapping rect, in their original order"""
+        # Anything starting further left than this can't reach the rect
+        lo = bisect.bisect_left(self.lefts, rect.left - self.max_width)
+        hi = bisect.bisect_right(self.lefts, rect.right)
+        
+        hits = []
+        rect_of = self.rect_of
+        for i in range(lo, hi):
+            left, right, order, obj = self.entries[i]
+            # X extents are static, Y is checked live (sliders move vertically)
+            if right > rect.left and rect_of(obj).colliderect(rect):
+                hits.append((order, obj))
+        hits.sort(key=lambda h: h[0])
+        return [obj for _, obj in hits]
+
+class HitboxIndex:
+    """Hit rects of many small hazards (spikes, crystals) as x-sorted NumPy arrays: a test is a
+    bisect into a small window followed by one vectorized overlap check, with pygame's
+    colliderect semantics (zero-sized rects never hit, negative sizes are normalized)"""
+    def __init__(self, boxes):
+        # boxes: (left, top, width, height, is_white, is_neutral, owner); a box moves with
+        # its owner platform's slide (owner=None for static boxes)
+        boxes = [b for b in boxes if b[2] and b[3]]
+        boxes.sort(key=lambda b: min(b[0], b[0] + b[2]))
+        self.owners = list({id(b[6]): b[6] for b in boxes if b[6] is not None}.values())
+        owner_slot = {id(o): i for i, o in enumerate(self.owners)}
+
+        self.left = np.array([min(b[0], b[0] + b[2]) for b in boxes], dtype=np.int64)
+        self.right = np.array([max(b[0], b[0] + b[2]) for b in boxes], dtype=np.int64)
+        # Tops stay floats, pygame truncates them only after the owner's shift is added
+        self.top = np.array([b[1] - (b[6]._visual_shift_y if b[6] is not None else 0) for b in boxes], dtype=float)
+        self.height = np.array([b[3] for b in boxes], dtype=np.int64)
+        self.is_white = np.array([b[4] for b in boxes], dtype=bool)
+        self.is_neutral = np.array([b[5] for b in boxes], dtype=bool)
+        self.owner = np.array([owner_slot[id(b[6])] if b[6] is not None else -1 for b in boxes], dtype=np.int64)
+        self.moving = any(o.is_slider for o in self.owners)
+        self.max_width = int((self.right - self.left).max()) if boxes else 0
+
+    def hits(self, rect, is_white=None):
+        """True if rect overlaps any box (with is_white given, only boxes that mode collides with)"""
+        if not rect.width or not rect.height or not len(self.left):
+            return False
+        x0, x1 = sorted((rect.left, rect.left + rect.width))
+        y0, y1 = sorted((rect.top, rect.top + rect.height))
+        lo = np.searchsorted(self.left, x0 - self.max_width, side='right')
+        hi = np.searchsorted(self.left, x1, side='left')
+        if lo >= hi:
+            return False
+
+        window = slice(lo, hi)
+        top = self.top[window]
+        if self.moving:
+            shifts = np.array([o._visual_shift_y for o in self.owners] + [0], dtype=float)
+            top = top + shifts[self.owner[window]]
+        top = np.trunc(top).astype(np.int64)
+        bottom = top + self.height[window]
+        hit = ((self.right[window] > x0) & (np.minimum(top, bottom) < y1) & (np.maximum(top, bottom) > y0))
+        if is_white is not None:
+            hit &= self.is_neutral[window] | (self.is_white[window] == is_white)
+        return bool(hit.any())
+
+class LevelIndex:
+    """Spatial indexes and chunk cache over a level's static objects (built in reset_game)"""
+    def __init__(self, platforms, spikes):
+        self.platforms = SpatialIndex(platforms)
+        self.spikes = SpatialIndex(spikes)
+        # Collision broadphase (live platform rects), sliders are the only platforms that move
+        self.solids = SpatialIndex(platforms, attrgetter('rect'))
+        self.sliders = [p for p in platforms if p.is_slider]
+        # Mystical cave ceilings, indexed by their hit line
+        ceilings = [p for p in platforms if p.is_mystical and hasattr(p, 'ceiling_hit_y')]
+        self.ceilings = SpatialIndex(ceilings, lambda p: pygame.Rect(p.x, p.ceiling_hit_y, p.width, 1))
+        # Hazard hitboxes: spike rects and the mystical platforms' floor crystals
+        self.spikes_hit = HitboxIndex([(*s.get_rect(), s.is_white, s.is_neutral, None) for s in spikes])
+        self.crystals_hit = HitboxIndex([box for p in platforms if p.is_mystical for box in p.crystal_hitboxes()])
+        self.chunks = ChunkRenderer(self)
+
+# Per-frame draw counters (filled by draw_game)
+render_stats = {'drawn': 0, 'culled': 0, 'chunks': 0}
+
 # Helper function to draw the game state
-def draw_game(surface, is_white_mode, player, platforms, projectiles=None, effects=None, background=None, spikes=None, camera=None, enemies=None, offset=(0,0), portal=None, scale=1.0, doors=None):
+def draw_game(surface, is_white_mode, player, platforms, projectiles=None, effects=None, background=None, spikes=None, camera=None, enemies=None, offset=(0,0), portal=None, scale=1.0, doors=None, level_index=None, tick_alpha=1.0, particles=None):
     # Background (Inverted: White Mode = White BG)
     bg_color = CREAM if is_white_mode else BLACK_MATTE
     surface.fill(bg_color)
@@ -53,128 +153,102 @@ def draw_game(surface, is_white_mode, player, platforms, projectiles=None, effec
     if is_white_mode and background:
         background.draw(surface, scale=scale)
     
-    # Draw platforms
-    for platform in platforms:
-        # We need a way to pass camera to platform.draw OR we manually apply camera here.
-        # Platform logic for drawing is complex (polygons).
-        # Best to pass camera to platform.draw or calculate offset points.
-        # Let's update Platform.draw to accept camera, or offset the context?
-        # Easier: Pass camera to draw()
-        platform.draw(surface, is_white_mode, camera=camera, offset=offset)
+    # Visible world area (padded so edges never pop in)
+    if camera:
+        view_x, view_y = -camera.camera.x, -camera.camera.y
+    else:
+        view_x, view_y = offset
+    view = pygame.Rect(view_x, view_y, surface.get_width(), surface.get_height())
+    view.inflate_ip(CULL_PADDING * 2, CULL_PADDING * 2)
+    
+    drawn = 0
+    total = 0
+    
+    def in_view(x, y, margin):
+        return view.left - margin < x < view.right + margin and view.top - margin < y < view.bottom + margin
+    
+    chunks = 0
+    
+    # Draw platforms (Static ones are streamed as chunks, sliders drawn live)
+    if level_index:
+        visible_platforms = level_index.platforms.query(view)
+        chunks += level_index.chunks.draw(surface, 'platforms', is_white_mode, view_x, view_y)
+        for platform in visible_platforms:
+            if platform.is_slider:
+                platform.draw(surface, is_white_mode, camera=camera, offset=offset)
+    else:
+        visible_platforms = platforms
+        for platform in visible_platforms:
+            platform.draw(surface, is_white_mode, camera=camera, offset=offset)
+    drawn += len(visible_platforms)
+    total += len(platforms)
 
     # Draw doors
     if doors:
         for door in doors:
-            door.draw(surface, is_white_mode, camera=camera, offset=offset)
+            total += 1
+            if in_view(door.x, door.y, 200):
+                door.draw(surface, is_white_mode, camera=camera, offset=offset)
+                drawn += 1
 
     # Draw enemies
     if enemies:
         for enemy in enemies:
-            enemy.draw(surface, is_white_mode, camera=camera, offset=offset)
+            total += 1
+            # Boss hat and flames reach well outside the hitbox
+            if view.colliderect(enemy.get_rect().inflate(200, 200)):
+                enemy.draw(surface, is_white_mode, camera=camera, offset=offset)
+                drawn += 1
      
     # Draw portal (blackhole)
     if portal:
-        portal.draw(surface, is_white_mode, camera=camera, offset=offset)
+        total += 1
+        if in_view(portal.x, portal.y, portal.radius * 2):
+            portal.draw(surface, is_white_mode, camera=camera, offset=offset)
+            drawn += 1
 
     # Draw spikes
     if spikes:
-        for spike in spikes:
-            spike.draw(surface, is_white_mode, camera=camera, offset=offset)
+        if level_index:
+            visible_spikes = level_index.spikes.query(view)
+            chunks += level_index.chunks.draw(surface, 'spikes', is_white_mode, view_x, view_y)
+        else:
+            visible_spikes = spikes
+            for spike in visible_spikes:
+                spike.draw(surface, is_white_mode, camera=camera, offset=offset)
+        drawn += len(visible_spikes)
+        total += len(spikes)
             
-    # Draw projectiles
+    # Draw projectiles (baked frames, one batch)
     if projectiles:
+        stamps = []
         for proj in projectiles:
-            # Projectile draw is simple polygon/blob.
-            # We can just hacking pass offset?
-            # Or add draw(camera)
-            proj.draw(surface, camera=camera, offset=offset)
+            total += 1
+            # Shurikens are drawn at 2.5x the hit radius
+            if in_view(proj.x, proj.y, 40):
+                stamps.append(proj.stamp(camera=camera, offset=offset))
+        surface.blits(stamps, doreturn=False)
+        drawn += len(stamps)
             
     # Draw effects
     if effects:
         for eff in effects:
-            eff.draw(surface, camera=camera, offset=offset)
-    
-    # Draw player
-    player.draw(surface, camera=camera, offset=offset)
-
-    
-    # Draw UI (Fixed on screen, NO OFFSET) - Top Right
-    font_size = int(24 * scale)
-    base_font = pygame.font.Font(None, font_size)
-    text_color = BLACK if is_white_mode else WHITE
-    
-    sw = surface.get_width()
-    sh = surface.get_height()
-    
-    # UI CONFIG
-    # UI CONFIG
-    bar_width = 400
-    bar_height = 25
-    margin = 20
-    
-    # 1. PLAYER HEALTH (Top Center)
-    p_x = sw // 2 - bar_width // 2
-    p_y = 40
+            total += 1
+            # Splat droplets can fly ~200px from their origin
+            if in_view(eff.x, eff.y, 250):
+                eff.draw(surface, camera=camera, offset=offset)
+                drawn += 1
     
-    # Label "VITALS" (Black Text now for contrast if white bg, or White if black bg? Let's use adaptive or simple Black)
-    # User said "full black bar". This implies the FILL is black.
-    # Background should probably be White or Grey to show the empty space.
+    # Pooled splat droplets and shards, one batch
+    if particles is not None:
+        drawn += particles.draw(surface, (view_x, view_y), tick_alpha)
     
-    label_font = pygame.font.Font(None, 24)
-    # INVERTED COLORS for UI
-    # White Mode (Light BG) -> Black UI
-    # Black Mode (Dark BG) -> White UI
+    render_stats['drawn'] = drawn
+    render_stats['culled'] = total - drawn
+    render_stats['chunks'] = chunks
     
-    ui_main_color = (0, 0, 0) if is_white_mode else (255, 255, 255)
-    ui_bg_color = (230, 230, 230) if is_white_mode else (30, 30, 30)
-    
-    label = label_font.render("VITALS", True, ui_main_color)
-    label_rect = label.get_rect(midbottom=(sw // 2, p_y - 5))
-    surface.blit(label, label_rect)
-    
-    # Bar Container (Empty part)
-    pygame.draw.rect(surface, ui_bg_color, (p_x, p_y, bar_width, bar_height))
-    
-    # Bar Fill (Solid Color) - Shrinks
-    p_pct = max(0, player.health / player.max_health)
-    fill_width = int(bar_width * p_pct)
-    pygame.draw.rect(surface, ui_main_color, (p_x, p_y, fill_width, bar_height))
-    
-    # Border
-    pygame.draw.rect(surface, ui_main_color, (p_x, p_y, bar_width, bar_height), 2)
-
-    # 2. BOSS HEALTH (Top Right)
-    boss = None
-    if enemies:
-        for e in enemies:
-            if isinstance(e, ShadowSelf) and not e.marked_for_deletion and e.health > 0:
-                boss = e
-                break
-    
-    if boss:
-        b_x = sw - bar_width - margin
-        b_y = margin
-        
-        # Label "PROJECTION"
-        b_label = label_font.render("SHADOW", True, (150, 150, 150))
-        b_rect = b_label.get_rect(topright=(sw - margin, b_y - 15))
-        surface.blit(b_label, b_rect)
-        
-        # Bar Background
-        pygame.draw.rect(surface, (20, 20, 20), (b_x, b_y, bar_width, bar_height))
-        # Bar Fill (Grey)
-        b_pct = max(0, boss.health / 200.0)
-        pygame.draw.rect(surface, (180, 180, 180), (b_x, b_y, int(bar_width * b_pct), bar_height))
-        # Border
-        pygame.draw.rect(surface, (255, 255, 255), (b_x, b_y, bar_width, bar_height), 1)
-
-    # Mode Info (Bottom Left)
-    # Tiny, inconspicuous
-    mode_font = pygame.font.Font(None, 18)
-    mode_str = "PEACE" if is_white_mode else "CHAOS"
-    mode_text = mode_font.render(f"STATUS: {mode_str}", True, (100, 100, 100))
-    surface.blit(mode_text, (margin, sh - margin - 10))
-
+    # Draw player
+    player.draw(surface, camera=camera, offset=offset)
 
 
 def draw_distortion(surface, intensity):
@@ -187,13 +261,13 @@ def draw_distortion(surface, intensity):
     
     for _ in range(num_glitches):
         # Random narrow rectangles
-        rect_w = random.randint(5, 50)
-        rect_h = random.randint(1, 5)
-        rect_x = random.randint(0, width)
-        rect_y = random.randint(0, height)
+        rect_w = draw_random.randint(5, 50)
+        rect_h = draw_random.randint(1, 5)
+        rect_x = draw_random.randint(0, width)
+        rect_y = draw_random.randint(0, height)
         
         # Color: Either dark or light interference
-        color = BLACK if random.random() > 0.5 else WHITE
+        color = BLACK if draw_random.random() > 0.5 else WHITE
         
         pygame.draw.rect(surface, color, (rect_x, rect_y, rect_w, rect_h))
         
@@ -207,57 +281,50 @@ def draw_distortion(surface, intensity):
 
 class CrumbleEffect:
     def __init__(self, surface):
-        """Initializes the crumble effect by chopping the surface into blocks"""
-        self.particles = []
+        """Initializes the crumble effect by chopping a frozen copy of the surface into blocks"""
+        # Blocks are blitted straight out of one copy (area rects), nothing is cut up front
+        self.source = surface.copy()
         width, height = surface.get_size()
-        block_size = 20 # 20x20 pixels
+        # 20x20 pixels at 1280 wide, scaled so the block count doesn't grow with the resolution
+        block_size = max(20, 20 * width // SCREEN_WIDTH)
+        
+        # One array entry per block, in row-major order
+        grid_y, grid_x = np.mgrid[0:height:block_size, 0:width:block_size]
+        grid_x = grid_x.ravel()
+        grid_y = grid_y.ravel()
+        # Clamp block size to surface bounds
+        self.areas = [pygame.Rect(x, y, min(block_size, width - x), min(block_size, height - y))
+                      for x, y in zip(grid_x.tolist(), grid_y.tolist())]
         
-        for y in range(0, height, block_size):
-            for x in range(0, width, block_size):
-                # Clamp block size to surface bounds
-                actual_w = min(block_size, width - x)
-                actual_h = min(block_size, height - y)
-                
-                if actual_w <= 0 or actual_h <= 0:
-                    continue
-                
-                # Capture block
-                rect = pygame.Rect(x, y, actual_w, actual_h)
-                block_surf = surface.subsurface(rect).copy()
-                
-                # Random velocity
-                vel_x = random.uniform(-2, 2)
-                vel_y = random.uniform(-1, 2) # Initial slight pop up
-                
-                self.particles.append({
-                    'sys': block_surf,
-                    'x': float(x),
-                    'y': float(y),
-                    'vx': vel_x,
-                    'vy': vel_y
-                })
+        self.x = grid_x.astype(float)
+        self.y = grid_y.astype(float)
+        # Random velocity
+        self.vx = np.random.uniform(-2, 2, self.x.shape)
+        self.vy = np.random.uniform(-1, 2, self.x.shape) # Initial slight pop up
         
         self.gravity = 0.5
+        self.height = height
+        
+        # Texts on top, laid out once
+        self.text = render_text("SANITY LOST", 100, (80, 80, 80))
+        self.text_rect = self.text.get_rect(center=(width//2, height//2))
+        self.hint = render_text("Press R to Restart", 40, (150, 150, 150))
+        self.hint_rect = self.hint.get_rect(center=(width//2, height//2 + 80))
         
     def update(self):
-        for p in self.particles:
-            p['x'] += p['vx']
-            p['y'] += p['vy']
-            p['vy'] += self.gravity # Apply gravity
+        self.x += self.vx
+        self.y += self.vy
+        self.vy += self.gravity # Apply gravity
 
     def draw(self, surface):
         surface.fill(CREAM) # Clear background to White (Peace default)
-        for p in self.particles:
-            surface.blit(p['sys'], (int(p['x']), int(p['y'])))
-            
-        # Draw Text on top
-        width, height = surface.get_size()
-        font = pygame.font.Font(None, 100)
-        text = font.render("SANITY LOST", True, (80, 80, 80))
-        text_rect = text.get_rect(center=(width//2, height//2))
-        surface.blit(text, text_rect)
         
-        hint_font = pygame.font.Font(None, 40)
-        hint = hint_font.render("Press R to Restart", True, (150, 150, 150))
-        hint_rect = hint.get_rect(center=(width//2, height//2 + 80))
-        surface.blit(hint, hint_rect)
+        # Blocks only fall, so the ones below the bottom edge are gone for good
+        visible = np.flatnonzero(self.y < self.height)
+        areas = self.areas
+        positions = zip(self.x[visible].astype(int).tolist(), self.y[visible].astype(int).tolist())
+        surface.blits([(self.source, pos, areas[i]) for i, pos in zip(visible.tolist(), positions)], doreturn=False)
+        
+        # Draw Text on top
+        surface.blit(self.text, self.text_rect)
+        surface.blit(self.hint, self.hint_rect)
@@ -0,0 +1,888 @@
+import random
+import numpy as np
+from .settings import *
+from .sprites import Player, Platform, ProjectilePool, SplatBlast, Spike, SlashWave, BlackHole
+from .utils import draw_game, draw_distortion, LevelIndex
+from .postfx import TensionPostFX
+from .particles import ParticleSystem
+from .background import ParallaxBackground
+from .enemy import MirrorRonin, ShadowSelf
+from .timestep import Interpolator, lerp
+from .cache import draw_random
+
+# Where each level's portal leads
+NEXT_LEVEL = {
+    "TUTORIAL": "LEVEL_1",
+    "LEVEL_1": "LEVEL_2",
+    "LEVEL_2": "LEVEL_3",
+    "LEVEL_3": "LEVEL_4",
+    "LEVEL_4": "ENDING",
+}
+
+def build_level(level):
+    """Creates the player, platforms, spikes, enemies, portal and doors of a level"""
+    # Create player (starts as WHITE character)
+    player = Player(100, 100)
+
+    # Fixed Level Layout (Based on Reference Image approximation)
+    # Sequence of platforms going Right and Up
+    
+    map_height = 2000
+    base_y = map_height - 200
+    
+    # Define level data based on current level
+    if level == "TUTORIAL":
+        # Basic Tutorial Layout (Restored)
+        platforms_data = [
+            # ========== SECTION 1: BASICS (Learning to move) ==========
+            # Starting area - large, safe
+            {'x': 50, 'y': base_y, 'w': 400, 'type': 'neutral'},
+            # Easy first jump (small gap, same height)
+            {'x': 500, 'y': base_y-100, 'w': 290, 'type': 'neutral'},
+            # Second easy jump
+            {'x': 890, 'y': base_y-180, 'w': 150, 'type': 'neutral'},
+            # Gentle rise (short gap, slight height)
+            {'x': 1200, 'y': base_y-50, 'w': 500, 'type': 'neutral'},
+            
+            # ========== SECTION 2: INTRODUCE WHITE PLATFORMS ==========
+            # Safe landing before white intro
+            {'x': 1800, 'y': base_y-120, 'w': 350, 'type': 'neutral'},
+            # First white platform (easy jump)
+            {'x': 2200, 'y': base_y-80, 'w': 250, 'type': 'white'},
+            # Second white platform (practice)
+            {'x': 2550, 'y': base_y-20, 'w': 250, 'type': 'white'},
+            # Back to neutral for breathing room
+            {'x': 2900, 'y': base_y-50, 'w': 400, 'type': 'neutral'},
+            
+            # ========== SECTION 3: INTRODUCE BLACK PLATFORMS ==========
+            # Black platform intro
+            {'x': 3400, 'y': base_y-100, 'w': 150, 'type': 'black'},
+            # Second black platform
+            {'x': 3650, 'y': base_y-130, 'w': 150, 'type': 'black'},
+            # Neutral rest area
+            {'x': 3900, 'y': base_y-50, 'w': 450, 'type': 'neutral'},
+            
+            # ========== SECTION 4: MIXED PLATFORMING ==========
+            # Alternating white and black
+            {'x': 4420, 'y': base_y-150, 'w': 80, 'type': 'white'},
+            {'x': 4150, 'y': base_y-280, 'w': 200, 'type': 'black'},
+            {'x': 4450, 'y': base_y-400, 'w': 250, 'type': 'white'},
+            # Large neutral landing
+            {'x': 4800, 'y': base_y-100, 'w': 600, 'type': 'neutral'},
+            
+            # ========== SECTION 5: MODERATE CHALLENGE ==========
+            # Rising platforms with gaps
+            {'x': 5500, 'y': base_y-200, 'w': 150, 'type': 'neutral'},
+            {'x': 5750, 'y': base_y-280, 'w': 150, 'type': 'white'},
+            {'x': 6000, 'y': base_y-360, 'w': 150, 'type': 'black'},
+            {'x': 6250, 'y': base_y-440, 'w': 150, 'type': 'neutral'},
+            # Descending back down
+            {'x': 6500, 'y': base_y-350, 'w': 150, 'type': 'white'},
+            {'x': 6750, 'y': base_y-260, 'w': 150, 'type': 'black'},
+            {'x': 7000, 'y': base_y-170, 'w': 200, 'type': 'neutral'},
+            
+            # ========== SECTION 6: LONGER JUMPS ==========
+            # Bigger gaps requiring commitment
+            {'x': 7400, 'y': base_y-150, 'w': 250, 'type': 'neutral'},
+            {'x': 7700, 'y': base_y-200, 'w': 220, 'type': 'white'},
+            {'x': 8000, 'y': base_y-250, 'w': 200, 'type': 'black'},
+            {'x': 8300, 'y': base_y-200, 'w': 350, 'type': 'neutral'},
+            
+            # ========== SECTION 7: FINAL APPROACH ==========
+            # Staircase up to the portal
+            {'x': 8750, 'y': base_y-250, 'w': 250, 'type': 'white'},
+            {'x': 9050, 'y': base_y-320, 'w': 250, 'type': 'black'},
+            {'x': 9350, 'y': base_y-390, 'w': 250, 'type': 'white'},
+            {'x': 9650, 'y': base_y-460, 'w': 250, 'type': 'black'},
+            
+            # ========== PORTAL AREA ==========
+            # Final safe zone with portal
+            {'x': 9950, 'y': base_y-460, 'w': 700, 'type': 'neutral'},
+        ]
+    elif level == "LEVEL_1":
+        # Level 1 and Level 2 - The original harder level (TODO: add unique LEVEL_2 layout)
+        platforms_data = [
+            {'x': 50, 'y': base_y, 'w': 500, 'type': 'neutral'},
+            {'x': 700, 'y': base_y-100, 'w': 100, 'type': 'white'},
+            {'x': 900, 'y': base_y-200, 'w': 100, 'type': 'black'},
+            {'x': 1100, 'y': base_y-290, 'w': 1000, 'type': 'neutral'},
+            {'x': 2200, 'y': base_y-400, 'w': 200, 'type': 'white'},
+            {'x': 2400, 'y': base_y-500, 'w': 200, 'type': 'black'},
+            {'x': 2600, 'y': base_y-290, 'w': 200, 'type': 'black'},
+            {'x': 2900, 'y': base_y-200, 'w': 1500, 'type': 'neutral'},
+            {'x': 4500, 'y': base_y-300, 'w': 150, 'type': 'black'},
+            {'x': 4700, 'y': base_y-400, 'w': 150, 'type': 'neutral'},
+            {'x': 4450, 'y': base_y-500, 'w': 150, 'type': 'black'},
+            {'x': 4350, 'y': base_y-600, 'w': 150, 'type': 'white'},
+            {'x': 4550, 'y': base_y-700, 'w': 150, 'type': 'black'},
+            {'x': 4800, 'y': base_y-650, 'w': 120, 'type': 'black'},
+            {'x': 5100, 'y': base_y-600, 'w': 200, 'type': 'neutral'},
+            {'x': 5400, 'y': base_y-700, 'w': 50, 'type': 'black'},
+            {'x': 5600, 'y': base_y-800, 'w': 50, 'type': 'black'},
+            {'x': 5800, 'y': base_y-900, 'w': 50, 'type': 'black'},
+            {'x': 6000, 'y': base_y-1000, 'w': 100, 'type': 'white'},
+            {'x': 6200, 'y': base_y-700, 'w': 50, 'type': 'black'},
+            {'x': 6500, 'y': base_y-400, 'w': 50, 'type': 'black'},
+            {'x': 6700, 'y': base_y-200, 'w': 300, 'type': 'neutral'},
+            {'x': 7150, 'y': base_y-300, 'w': 200, 'type': 'white'},
+            {'x': 7400, 'y': base_y-400, 'w': 200, 'type': 'white'},
+            {'x': 7700, 'y': base_y-200, 'w': 1000, 'type': 'neutral'},
+        ]
+    elif level == "INNER_SANCTUM":  # THE INNER SANCTUM - Final Boss Level (Strategic/Puzzle-focused)
+        platforms_data = [
+            # ========== SECTION 1: THE AWAKENING (0-2500px) ==========
+            # Introduce the concept - think before you jump
+            {'x': 50, 'y': base_y, 'w': 400, 'type': 'neutral'},
+            # First puzzle: White platform leads to black, must toggle mid-air or before
+            {'x': 550, 'y': base_y-100, 'w': 200, 'type': 'white'},
+            {'x': 850, 'y': base_y-100, 'w': 200, 'type': 'black'},  # Same height - must toggle!
+            {'x': 1150, 'y': base_y-50, 'w': 300, 'type': 'neutral'},
+            # Rising with alternation - plan your mode
+            {'x': 1550, 'y': base_y-150, 'w': 180, 'type': 'black'},
+            {'x': 1830, 'y': base_y-250, 'w': 180, 'type': 'white'},
+            {'x': 2100, 'y': base_y-150, 'w': 250, 'type': 'neutral'},
+            
+            # ========== SECTION 2: THE DESCENT CHOICE (2500-5000px) ==========
+            # Two paths visible - only one correct based on mode
+            {'x': 2450, 'y': base_y-250, 'w': 150, 'type': 'white'},
+            {'x': 2700, 'y': base_y-350, 'w': 150, 'type': 'black'},
+            # Upper route (black) vs lower route (white) - converge later
+            {'x': 3000, 'y': base_y-250, 'w': 200, 'type': 'white'},  # Lower path
+            {'x': 2950, 'y': base_y-500, 'w': 200, 'type': 'black'},  # Upper path
+            # Convergence
+            {'x': 3300, 'y': base_y-350, 'w': 300, 'type': 'neutral'},
+            # Triple mode puzzle - must switch twice
+            {'x': 3700, 'y': base_y-400, 'w': 180, 'type': 'white'},
+            {'x': 3980, 'y': base_y-450, 'w': 180, 'type': 'black'},
+            {'x': 4260, 'y': base_y-400, 'w': 180, 'type': 'white'},
+            {'x': 4540, 'y': base_y-300, 'w': 300, 'type': 'neutral'},
+            
+            # ========== SECTION 3: THE TOWER OF DUALITY (5000-8000px) ==========
+            # Vertical climb with strategic mode switching
+            {'x': 4940, 'y': base_y-400, 'w': 150, 'type': 'black'},
+            {'x': 5180, 'y': base_y-550, 'w': 150, 'type': 'white'},
+            {'x': 5420, 'y': base_y-700, 'w': 150, 'type': 'black'},
+            {'x': 5660, 'y': base_y-850, 'w': 200, 'type': 'neutral'},  # Rest point
+            # Horizontal gauntlet at height - think about timing
+            {'x': 5960, 'y': base_y-900, 'w': 200, 'type': 'black'},
+            {'x': 6260, 'y': base_y-900, 'w': 200, 'type': 'white'},
+            {'x': 6560, 'y': base_y-900, 'w': 200, 'type': 'black'},
+            # Descent requires opposite mode thinking
+            {'x': 6860, 'y': base_y-750, 'w': 180, 'type': 'white'},
+            {'x': 7140, 'y': base_y-600, 'w': 180, 'type': 'black'},
+            {'x': 7420, 'y': base_y-450, 'w': 180, 'type': 'white'},
+            {'x': 7700, 'y': base_y-300, 'w': 300, 'type': 'neutral'},
+            
+            # ========== SECTION 4: THE MAZE OF MINDS (8000-11000px) ==========
+            # Multiple platforms visible - only correct sequence works
+            {'x': 8100, 'y': base_y-350, 'w': 150, 'type': 'black'},
+            {'x': 8350, 'y': base_y-450, 'w': 150, 'type': 'black'},
+            {'x': 8300, 'y': base_y-250, 'w': 120, 'type': 'white'},  # Trap - leads nowhere!
+            {'x': 8600, 'y': base_y-550, 'w': 200, 'type': 'neutral'},
+            # Staircase illusion - must go up then down
+            {'x': 8900, 'y': base_y-650, 'w': 200, 'type': 'white'},
+            {'x': 9200, 'y': base_y-800, 'w': 150, 'type': 'black'},
+            {'x': 9450, 'y': base_y-650, 'w': 150, 'type': 'white'},  # Drop back down
+            {'x': 9700, 'y': base_y-500, 'w': 200, 'type': 'neutral'},
+            # The zigzag of fate - few but meaningful
+            {'x': 10000, 'y': base_y-600, 'w': 180, 'type': 'black'},
+            {'x': 10280, 'y': base_y-450, 'w': 180, 'type': 'white'},
+            {'x': 10560, 'y': base_y-350, 'w': 250, 'type': 'neutral'},
+            
+            # ========== SECTION 5: THE FINAL TRIAL (11000-14000px) ==========
+            # Long jumps with mode commitment - no going back
+            {'x': 10910, 'y': base_y-450, 'w': 200, 'type': 'white'},
+            {'x': 11250, 'y': base_y-550, 'w': 200, 'type': 'black'},
+            {'x': 11590, 'y': base_y-450, 'w': 200, 'type': 'white'},
+            {'x': 11930, 'y': base_y-350, 'w': 300, 'type': 'neutral'},
+            # Rising finale - each jump is a decision
+            {'x': 12350, 'y': base_y-500, 'w': 180, 'type': 'black'},
+            {'x': 12650, 'y': base_y-650, 'w': 180, 'type': 'white'},
+            {'x': 12950, 'y': base_y-800, 'w': 180, 'type': 'black'},
+            {'x': 13250, 'y': base_y-950, 'w': 200, 'type': 'neutral'},
+            # Last precision challenge - but still strategic (100px platforms)
+            {'x': 13580, 'y': base_y-1050, 'w': 100, 'type': 'white'},
+            {'x': 13800, 'y': base_y-1150, 'w': 100, 'type': 'black'},
+            {'x': 14020, 'y': base_y-1050, 'w': 100, 'type': 'white'},
+            
+            # ========== VICTORY: THE INNER SANCTUM ==========
+            {'x': 14250, 'y': base_y-1000, 'w': 700, 'type': 'neutral'},
+        ]
+    elif level == "LEVEL_2":
+        platforms_data = [
+            {'x': 50, 'y': base_y, 'w': 400, 'type': 'neutral'},
+            {'x': 600, 'y': base_y-100, 'w': 200, 'type': 'white'},
+            {'x': 900, 'y': base_y-200, 'w': 200, 'type': 'black'},
+            {'x': 1200, 'y': base_y-300, 'w': 50, 'type': 'neutral'}, 
+
+            #White side
+            {'x': 1400, 'y': base_y-400, 'w': 50, 'type': 'white'},
+            {'x': 1600, 'y': base_y-500, 'w': 50, 'type': 'white'},
+            {'x': 1800, 'y': base_y-600, 'w': 50, 'type': 'white'},
+            {'x': 2000, 'y': base_y-600, 'w': 200, 'type': 'white', 'is_slider': True}, # glider 
+            {'x': 2300, 'y': base_y-1600, 'w': 200, 'type': 'neutral'},
+            {'x': 2500, 'y': base_y-1200, 'w': 2800, 'type': 'neutral', 'has_spikes': True}, # upper platform (Added Spikes)
+
+            {'x': 2600, 'y': base_y-1500, 'w': 200, 'type': 'white'},
+            {'x': 2900, 'y': base_y-1400, 'w': 200, 'type': 'white'},
+            {'x': 3200, 'y': base_y-1300, 'w': 500, 'type': 'neutral'},
+            {'x': 3700, 'y': base_y-1400, 'w': 50, 'type': 'black'},
+            {'x': 3800, 'y': base_y-1430, 'w': 500, 'type': 'neutral'},
+            {'x': 3750, 'y': base_y-1550, 'w': 50, 'type': 'white'},
+            {'x': 3200, 'y': base_y-1600, 'w': 500, 'type': 'neutral'},
+            {'x': 3800, 'y': base_y-1700, 'w': 50, 'type': 'black'},
+            {'x': 4000, 'y': base_y-1800, 'w': 500, 'type': 'neutral'},
+            {'x': 4500, 'y': base_y-1900, 'w': 200, 'type': 'white'},
+            {'x': 4750, 'y': base_y-1750, 'w': 50, 'type': 'white'},
+            {'x': 4800, 'y': base_y-1600, 'w': 500, 'type': 'neutral'},
+            {'x': 5300, 'y': base_y-1700, 'w': 50, 'type': 'black'},
+            {'x': 5400, 'y': base_y-1800, 'w': 50, 'type': 'white'},
+            {'x': 5500, 'y': base_y-1550, 'w': 100, 'type': 'white'},
+            {'x': 5200, 'y': base_y-1430, 'w': 300, 'type': 'neutral', 'has_spikes': True}, # spiky platform 1
+            {'x': 4500, 'y': base_y-1300, 'w': 1050, 'type': 'neutral'},
+            {'x': 5640, 'y': base_y-1400, 'w': 200, 'type': 'neutral', 'has_spikes': True}, # spiky platform 2
+            {'x': 5680, 'y': base_y-1100, 'w': 100, 'type': 'white'},
+            {'x': 5900, 'y': base_y-900, 'w': 100, 'type': 'white'}, 
+            {'x': 6100, 'y': base_y-700, 'w': 100, 'type': 'white'}, 
+
+            #Black side
+            {'x': 1400, 'y': base_y-200, 'w': 50, 'type': 'black'},
+            {'x': 1650, 'y': base_y-0, 'w': 50, 'type': 'black'},
+            {'x': 1900, 'y': base_y+100, 'w': 50, 'type': 'black'},
+            {'x': 2150, 'y': base_y+200, 'w': 50, 'type': 'black'},
+            {'x': 2400, 'y': base_y+300, 'w': 50, 'type': 'black'},
+            {'x': 2600, 'y': base_y+300, 'w': 2800, 'type': 'neutral', 'is_mystical': True}, # mystical floor
+
+            # Mystical floor maze
+            {'x': 2800, 'y': base_y+300-100, 'w': 200, 'type': 'black'},
+            {'x': 3100, 'y': base_y+300-200, 'w': 200, 'type': 'black'},
+            {'x': 3400, 'y': base_y+300-300, 'w': 150, 'type': 'white'},
+            {'x': 3250, 'y': base_y+300-400, 'w': 150, 'type': 'black'},
+            {'x': 2950, 'y': base_y+300-500, 'w': 150, 'type': 'white'},
+            {'x': 3250, 'y': base_y+300-600, 'w': 120, 'type': 'black'},
+            {'x': 3450, 'y': base_y+300-700, 'w': 200, 'type': 'white'},
+            {'x': 3920, 'y': base_y+300-300, 'w': 150, 'type': 'neutral'},
+            {'x': 4200, 'y': base_y+300-400, 'w': 150, 'type': 'neutral'},
+            {'x': 4400, 'y': base_y+300-200, 'w': 150, 'type': 'black'},
+            {'x': 4600, 'y': base_y+300-300, 'w': 50, 'type': 'neutral'},
+            {'x': 4720, 'y': base_y+300-400, 'w': 50, 'type': 'black'},
+            {'x': 4500, 'y': base_y+300-450, 'w': 200, 'type': 'white'},
+
+            {'x': 4100, 'y': base_y+300-500, 'w': 250, 'type': 'white'},
+            {'x': 4420, 'y': base_y+300-600, 'w': 150, 'type': 'black'},
+            {'x': 4600, 'y': base_y+300-700, 'w': 20, 'type': 'neutral'},
+            {'x': 4700, 'y': base_y+300-800, 'w': 150, 'type': 'white'},
+            {'x': 4900, 'y': base_y+300-650, 'w': 80, 'type': 'black'},
+            {'x': 5100, 'y': base_y+300-400, 'w': 80, 'type': 'white'},
+            {'x': 5300, 'y': base_y+300-250, 'w': 80, 'type': 'black'},
+            {'x': 5500, 'y': base_y+300-250, 'w': 400, 'type': 'neutral'},
+            {'x': 5900, 'y': base_y+300-250, 'w': 200, 'type': 'neutral', 'is_slider': True, 'slider_range': 450}, # glider 2 
+            {'x': 6100, 'y': base_y+300-700, 'w': 1000, 'type': 'neutral'} # end with an enemy gurading the portal
+        ]
+    elif level == "LEVEL_3":
+        platforms_data = [
+            {'x': 50, 'y': base_y, 'w': 400, 'type': 'neutral'},
+            {'x': 600, 'y': base_y-100, 'w': 200, 'type': 'neutral'},
+            {'x': 900, 'y': base_y-200, 'w': 200, 'type': 'white'},
+            {'x': 1300, 'y': base_y-100, 'w': 200, 'type': 'neutral'},
+            {'x': 1600, 'y': base_y-200, 'w': 100, 'type': 'black'},
+            {'x': 1700, 'y': base_y-350, 'w': 100, 'type': 'white'},
+            {'x': 1700, 'y': base_y-50, 'w': 100, 'type': 'white'},
+            {'x': 1900, 'y': base_y-150, 'w': 100, 'type': 'black'},
+            {'x': 2100, 'y': base_y-200, 'w': 100, 'type': 'neutral'}, 
+            {'x': 1950, 'y': base_y-310, 'w': 100, 'type': 'white'}, 
+            {'x': 1340, 'y': base_y-400, 'w': 200, 'type': 'neutral'}, 
+            {'x': 1700, 'y': base_y-500, 'w': 300, 'type': 'black'}, 
+            {'x': 2100, 'y': base_y-600, 'w': 300, 'type': 'neutral'}, 
+        
+        ]
+    elif level == "LEVEL_4":
+        # "change every platforms... width 50 and x coordinate 50 too [spaced by 50] and y = base_y"
+        # Creating a long row of small neutral blocks
+        platforms_data = [{'x': 50 + i*50, 'y': base_y+400, 'w': 50, 'type': 'neutral'} for i in range(50)]
+    elif level == "ENDING":
+        platforms_data = [] # Empty for ending screen
+    else:
+        # Fallback to LEVEL_1 layout
+        platforms_data = [
+            {'x': 50, 'y': base_y, 'w': 500, 'type': 'neutral'},
+            {'x': 700, 'y': base_y-100, 'w': 100, 'type': 'white'},
+            {'x': 7700, 'y': base_y-200, 'w': 1000, 'type': 'neutral'},
+        ]
+    
+    platforms = []
+    spikes = []
+    doors = []
+    
+    # Player Start
+    player.x = 150
+    player.y = base_y - 100
+    
+    for p_data in platforms_data:
+        is_white = (p_data['type'] == 'white')
+        is_neutral = (p_data['type'] == 'neutral')
+        # If black, both are false
+        if p_data['type'] == 'black':
+            is_white = False
+            is_neutral = False
+            
+        is_slider = p_data.get('is_slider', False)
+        is_mystical = p_data.get('is_mystical', False)
+        is_pillar = p_data.get('is_pillar', False)
+        plat = Platform(p_data['x'], p_data['y'], p_data['w'], 30, is_white=is_white, is_neutral=is_neutral, is_slider=is_slider, is_mystical=is_mystical, slider_range=p_data.get('slider_range', 1000), is_pillar=is_pillar)
+        platforms.append(plat)
+        
+        # Spike Generation
+        if p_data.get('has_spikes', False):
+            # Generate spikes along the top
+            spike_w = 30
+            spike_h = 30
+            num_spikes = p_data['w'] // spike_w
+            start_x = p_data['x']
+            
+            for i in range(num_spikes):
+                s_x = start_x + i * spike_w
+                s_y = p_data['y'] - spike_h
+                spike = Spike(s_x, s_y, spike_w, spike_h, is_white=is_white, is_neutral=is_neutral, is_mystical=is_mystical)
+                spikes.append(spike)
+        
+    # Portal for levels with transitions
+    portal = None
+    if level in ["TUTORIAL", "LEVEL_1", "LEVEL_2", "LEVEL_3", "LEVEL_4"]:
+        # Find the furthest platform
+        furthest_plat = max(platforms_data, key=lambda p: p['x'] + p['w'])
+        portal_x = furthest_plat['x'] + furthest_plat['w'] - 80  # Near end of last platform
+        portal_y = furthest_plat['y'] - 60  # Above platform
+        portal = BlackHole(portal_x, portal_y)
+    
+    # Spawn Enemies
+    enemies = []
+    if level == "TUTORIAL":
+        # Spawn MirrorRonin guarding the portal at end of Tutorial
+        # Platform: {'x': 9950, 'y': base_y-460, 'w': 700}
+        enemy_x = 9950 + 350 # Center of platform
+        enemy_y = base_y - 460 - 60
+        enemies = [MirrorRonin(enemy_x, enemy_y)]
+    elif level == "LEVEL_1":
+        # Spawn enemy on the last platform
+        last_plat = platforms_data[-1]
+        enemy_x = last_plat['x'] + last_plat['w'] // 2 - 25
+        enemy_y = last_plat['y'] - 60
+        
+        # Spawn enemy on the big middle platform (index 7)
+        middle_plat = platforms_data[7]
+        middle_enemy_x = middle_plat['x'] + middle_plat['w'] // 2 - 25
+        middle_enemy_y = middle_plat['y'] - 60
+        
+        enemies = [MirrorRonin(enemy_x, enemy_y), MirrorRonin(middle_enemy_x, middle_enemy_y)]
+    elif level == "INNER_SANCTUM":
+        # Strategic enemy placement - guards at decision points
+        enemies = [
+            MirrorRonin(3300 + 150, base_y - 350 - 60),  # At convergence point
+            MirrorRonin(5660 + 100, base_y - 850 - 60),  # Tower rest point
+            MirrorRonin(9700 + 100, base_y - 500 - 60),  # Maze exit
+            MirrorRonin(14250 + 350, base_y - 1000 - 60),  # Final boss at sanctum
+        ]
+    elif level == "LEVEL_2":
+        # Spawn enemy guarding the portal (last platform)
+        last_plat = platforms_data[-1]
+        enemy_x = last_plat['x'] + last_plat['w'] // 2 - 25
+        enemy_y = last_plat['y'] - 60
+        enemies = [MirrorRonin(enemy_x, enemy_y)]
+    elif level == "LEVEL_3":
+         # Spawn enemies on final stretch
+        last_plat = platforms_data[-1]
+        enemy_x = last_plat['x'] + last_plat['w'] // 2
+        enemy_y = last_plat['y'] - 60
+        # enemies = [MirrorRonin(enemy_x, enemy_y)] # Disabled for construction
+        enemies = []
+    elif level == "LEVEL_4":
+        last_plat = platforms_data[-1]
+        # Spawn Boss safely on the tiled floor (Range 50-2550)
+        # Spawn at x=2000 to give player space but be on screen/near
+        boss_x = 2000
+        boss_y = base_y + 400 - 200 # base_y+400 is platform Y, -200 is boss height
+        enemies = [ShadowSelf(boss_x, boss_y)]
+    return player, platforms, spikes, enemies, portal, doors
+
+class HeldKeys(frozenset):
+    """Held key codes, indexed like pygame.key.get_pressed() (for scripted and replayed input)"""
+    def __getitem__(self, key):
+        return key in self
+
+class Inputs:
+    """What the player does during one tick: held keys, the mouse on the canvas and this tick's presses"""
+    def __init__(self, keys=HeldKeys(), mouse_pos=(0, 0), swap=False, shoot=False, click=False):
+        self.keys = keys # Indexed by key code (pygame.key.get_pressed() or HeldKeys)
+        self.mouse_pos = mouse_pos # Canvas pixels
+        self.swap = swap # Mask swap (E / Shift)
+        self.shoot = shoot # Shoot key (X)
+        self.click = click # Left click: shoot in peace mode, melee in tension mode
+
+class GameWorld:
+    """The state of a level being played (player, enemies, projectiles, tension, camera) and its update,
+    one fixed tick per step(). Needs no window or event queue, so it also runs headless
+    (SDL_VIDEODRIVER=dummy) for soak tests, profiling and bots.
+
+    step() returns what happened for the front end to react to (sounds, wipes, level changes):
+    "swap", "shoot", "melee", "jump", "step", "heartbeat", "hurt", "death", "respawn",
+    "level_complete" (portal, next_level is set) and "door" (next_level is set).
+
+    With a seed, loading and stepping draw from the world's own random streams instead of the
+    global ones, so the game plays out the same for the same inputs whatever else (drawing,
+    menus) uses random in between; that's what makes replays (see replay.py) possible"""
+    def __init__(self, level="TUTORIAL", view_size=(SCREEN_WIDTH, SCREEN_HEIGHT), aim_sensitivity=1.0, seed=None):
+        self.view_size = view_size # Canvas size, the camera keeps the player centered in it
+        self.aim_sensitivity = aim_sensitivity
+        self.seed = seed
+        # Swapped with the global random / np.random states around loads and ticks (see _swap_random)
+        self.random_states = None
+        if seed is not None:
+            self.random_states = (random.Random(seed).getstate(), np.random.RandomState(seed).get_state())
+        self.recorder = None # ReplayRecorder taking down every load and tick
+        self.background = ParallaxBackground()
+        self.interpolator = Interpolator()
+        # Pools of this world's shots and splat droplets, emptied on every load
+        self.projectiles = ProjectilePool()
+        self.particles = ParticleSystem()
+        self.distort = TensionPostFX().apply if POSTFX else draw_distortion
+        self.ticks = 0
+        self.events = []
+
+        # Audio pacing (kept across restarts, like the sounds they time)
+        self.heartbeat_timer = 0.0
+        self.step_timer = 0.0
+        self.load(level)
+
+    def _swap_random(self):
+        """Trades the global random streams for the world's own (seeded worlds only), call in pairs"""
+        if self.random_states is not None:
+            outside = (random.getstate(), np.random.get_state())
+            random.setstate(self.random_states[0])
+            np.random.set_state(self.random_states[1])
+            self.random_states = outside
+
+    def load(self, level):
+        """Starts level from scratch (level changes and restarts)"""
+        if self.recorder is not None:
+            self.recorder.record_load(level)
+        self._swap_random()
+        try:
+            self._load(level)
+        finally:
+            self._swap_random()
+
+    def _load(self, level):
+        self.level = level
+        self.player, self.platforms, self.spikes, self.enemies, self.portal, self.doors = build_level(level)
+        self.level_index = LevelIndex(self.platforms, self.spikes)
+        self.projectiles.clear()
+        self.effects = []
+        self.particles.clear()
+
+        # Tension Mechanics State
+        self.tension = 0.0
+        self.overload_timer = 0.0
+        self.forced_black_mode_timer = 0.0 # Rage lock: no swapping back while it runs
+        self.drain_status = "N/A"
+        self.active_ronins = 0
+        self.game_over = False
+
+        # Camera State
+        self.scroll_x = 0
+        self.scroll_y = 0
+        self.prev_scroll_x = 0
+        self.prev_scroll_y = 0
+        self.camera_offset = (0, 0)
+        self.interpolator.clear()
+
+        # Blackhole Suction Animation State
+        self.suction_active = False
+        self.suction_timer = 0.0
+        self.suction_duration = 2.0 # 2 seconds of suction animation
+        self.suction_scale = 1.0 # Player shrinks during suction
+        self.suction_rotation = 0.0 # Player spins into blackhole
+        self.next_level = None # Set once the level is left (portal or door)
+
+    @property
+    def intensity(self):
+        """Tension as 0.0 to 1.0 (distortion and shake strength)"""
+        return min(1.0, self.tension / 12.0)
+
+    def die(self):
+        if not self.game_over:
+            self.game_over = True
+            self.events.append("death")
+
+    def swap_mask(self, forced=False):
+        """Flips the player's mask; a requested swap is refused while the rage lock runs"""
+        if not forced and self.forced_black_mode_timer > 0:
+            return False
+        self.player.swap_mask()
+        if forced:
+            self.forced_black_mode_timer = 5.0
+            self.tension = 8.0
+        elif self.player.is_white:
+            # Sanity Reset: If switching to White (Calm), ensure tension is below the
+            # Forced Trigger (8.0), otherwise it will instantly swap back next tick
+            self.tension = min(self.tension, 7.0)
+        self.events.append("swap")
+        return True
+
+    def step(self, inputs):
+        """Advances the world one tick (1 / SIM_TICK_RATE seconds) with inputs, returns the events raised"""
+        if self.recorder is not None:
+            inputs = self.recorder.record_tick(self, inputs)
+        self._swap_random()
+        try:
+            return self._step(inputs)
+        finally:
+            self._swap_random()
+
+    def _step(self, inputs):
+        self.events = []
+        if self.game_over or self.next_level:
+            return self.events
+        self.ticks += 1
+        dt = 1.0 / SIM_TICK_RATE
+        player = self.player
+        level_index = self.level_index
+
+        # Where things were before this tick, for interpolated drawing
+        self.interpolator.clear()
+        self.interpolator.snapshot([player])
+        self.interpolator.snapshot(self.enemies)
+        self.interpolator.snapshot(self.projectiles)
+        self.interpolator.snapshot(level_index.sliders, ('_visual_shift_y',)) # Sliders draw from their baked shift
+        self.prev_scroll_x, self.prev_scroll_y = self.scroll_x, self.scroll_y
+
+        # Rage lock runs out
+        if self.forced_black_mode_timer > 0:
+            self.forced_black_mode_timer = max(0.0, self.forced_black_mode_timer - dt)
+
+        # This tick's presses
+        if inputs.swap:
+            self.swap_mask()
+        if inputs.shoot:
+            if player.shoot(self.projectiles): # Already live in the projectile pool
+                self.events.append("shoot")
+        if inputs.click:
+            if player.is_white:
+                # Peace Mode: Shoot
+                if player.shoot(self.projectiles):
+                    self.events.append("shoot")
+            else:
+                # Tension Mode: Melee
+                new_effects = player.melee_attack()
+                if new_effects:
+                    self.effects.extend(new_effects)
+                    self.events.append("melee")
+
+        # Update Background Parallax
+        self.background.update(player.vel_x)
+
+        # Update Platforms (Sliders) and move player with them
+        for plat in level_index.sliders:
+            is_on_top = (player.current_platform == plat)
+            platform_dy = plat.update(is_on_top)
+
+            # If player is on this slider platform, move them with it
+            if is_on_top and platform_dy != 0:
+                player.y += platform_dy
+
+        # Tension Logic based on state
+        self.active_ronins = 0
+        if not player.is_white: # Mask Off (Black/Tension)
+            self.tension += dt
+            self.drain_status = "BUILDING (Black Mode)"
+        else: # Mask On (White/Peace)
+            if self.active_ronins > 0:
+                self.tension += dt * 0.4 * self.active_ronins
+                if self.tension > 8.0:
+                    self.tension = 8.0
+                self.drain_status = "BUILDING (Enemy)"
+            else:
+                drain_rate = 5.0
+                self.tension -= dt * drain_rate
+                self.drain_status = f"DRAINING (Rate {drain_rate})"
+
+        # Clamp tension
+        self.tension = max(0.0, min(self.tension, 12.0))
+
+        # --- Dynamic Heartbeat ---
+        if not player.is_white:
+            # Range: Tension 0.0 -> ~1.2s, Tension 12.0 -> ~0.25s (Fast Panic)
+            heartbeat_interval = 1.2 - (self.intensity * 0.95)
+            self.heartbeat_timer -= dt
+            if self.heartbeat_timer <= 0:
+                self.events.append("heartbeat")
+                self.heartbeat_timer = heartbeat_interval
+        else:
+            # Reset timer so it starts immediately when switching to dark mode
+            self.heartbeat_timer = 0.0
+
+        # Forced Switch Logic (Trigger at 8.0 Tension)
+        if player.is_white and self.tension >= 8.0:
+            self.swap_mask(forced=True)
+
+        # Overload Logic
+        if self.tension >= 12.0 and not player.is_white:
+            self.overload_timer += dt
+            if self.overload_timer > 3.0:
+                self.die()
+        else:
+            self.overload_timer = 0.0
+
+        # Camera Logic - Update scroll
+        view_w, view_h = self.view_size
+        target_scroll_x = player.x - view_w / 2 + player.width / 2
+        self.scroll_x += (target_scroll_x - self.scroll_x) * 0.1
+
+        target_scroll_y = player.y - view_h / 2 + player.height / 2
+        self.scroll_y += (target_scroll_y - self.scroll_y) * 0.1
+
+        if self.scroll_x < 0:
+            self.scroll_x = 0
+        # Negative scroll_y is allowed for high platforms
+
+        self.camera_offset = camera_offset = (int(self.scroll_x), int(self.scroll_y))
+
+        # Check spike collision (Standard Spikes)
+        if level_index.spikes_hit.hits(player.get_rect().inflate(-10, -10)):
+            self.die()
+
+        # Check Mystical Platform Spikes (same smaller hit box as Platform.check_spike_collision)
+        elif level_index.crystals_hit.hits(player.get_rect().inflate(-15, -10)):
+            self.die()
+
+        # Update player
+        player.update(level_index.solids, offset=camera_offset, mouse_pos=inputs.mouse_pos,
+                      aim_sensitivity=self.aim_sensitivity, keys=inputs.keys)
+
+        # Check Player Death
+        if player.health <= 0:
+            self.die()
+
+        # --- Movement Audio ---
+        if player.just_jumped:
+            self.events.append("jump")
+
+        # Footsteps
+        if player.on_ground and abs(player.vel_x) > 0.5:
+            self.step_timer -= dt
+            if self.step_timer <= 0:
+                self.step_timer = 0.5 # Slower steps (0.5s)
+                self.events.append("step")
+        else:
+            # Small delay so steps start soon after walking resumes, without a "landing step"
+            self.step_timer = 0.05
+
+        # --- CEILING COLLISION (Mystical Platforms) ---
+        for plat in level_index.ceilings.query(player.get_rect().inflate(2, 2)):
+            # Horizontal check
+            if player.x + player.width > plat.x and player.x < plat.x + plat.width:
+                # Vertical check (Head is above the ceiling line, Feet are below)
+                if player.y < plat.ceiling_hit_y and (player.y + player.height) > plat.ceiling_hit_y:
+                    player.y = plat.ceiling_hit_y
+                    if player.vel_y < 0:
+                        player.vel_y = 0 # Head bonk
+
+        # Check for void death - instant respawn
+        if player.fell_into_void:
+            self._load(self.level)
+            self.events.append("respawn")
+            return self.events
+
+        # Portal Update and Collision
+        portal = self.portal
+        if portal and not self.suction_active:
+            portal.update(dt)
+
+            # Only open once all enemies are defeated
+            if len(self.enemies) == 0 and portal.check_collision(player.get_rect()):
+                # Start blackhole suction animation
+                self.suction_active = True
+                self.suction_timer = 0.0
+                self.suction_scale = 1.0
+                self.suction_rotation = 0.0
+
+        # Blackhole Suction Animation Logic
+        if self.suction_active:
+            self.suction_timer += dt
+
+            # Progress from 0 to 1
+            progress = self.suction_timer / self.suction_duration
+
+            # Player shrinks and spins
+            self.suction_scale = max(0.0, 1.0 - progress)
+            self.suction_rotation += dt * 15 # Spin faster and faster
+
+            # Move player towards portal center
+            if portal:
+                pull_strength = 200 * dt * (1 + progress) # Accelerating pull
+                dx = portal.x - (player.x + player.width / 2)
+                dy = portal.y - (player.y + player.height / 2)
+                dist = max(1, (dx*dx + dy*dy)**0.5)
+                player.x += (dx / dist) * pull_strength
+                player.y += (dy / dist) * pull_strength
+
+            # End suction, the front end moves on to next_level
+            if self.suction_timer >= self.suction_duration:
+                self.suction_active = False
+                self.next_level = NEXT_LEVEL.get(self.level, "LEVEL_1")
+                self.events.append("level_complete")
+                return self.events
+
+        # Doors
+        for door in self.doors:
+            door.update(dt)
+            if door.check_collision(player.get_rect()):
+                self.next_level = door.target_level
+                self.events.append("door")
+                return self.events
+
+        # Projectile Logic
+        projectiles = self.projectiles
+        effects = self.effects
+        for proj in projectiles:
+            proj.update(offset=camera_offset)
+            if proj.marked_for_deletion:
+                projectiles.release(proj)
+                continue
+
+            proj_rect = proj.get_rect()
+            hit = False
+
+            for platform in level_index.solids.query(proj_rect):
+                if player.is_neutral_collision(platform):
+                    hit = True
+                    impact_x = proj.x - proj.vx
+                    impact_y = proj.y - proj.vy
+                    effects.append(SplatBlast(impact_x, impact_y, proj.color, self.particles))
+                    break
+
+            if hit:
+                projectiles.release(proj)
+                continue
+
+            if not proj.is_player_shot:
+                if proj.get_rect().colliderect(player.get_rect()):
+                    projectiles.release(proj)
+                    effects.append(SplatBlast(proj.x, proj.y, proj.color, self.particles))
+                    # Only increase tension in white mode (peace)
+                    # In black mode (tension), just take damage/knockback
+                    if player.is_white:
+                        self.tension += 3.0
+
+                    # Player takes damage from enemy projectiles
+                    player.take_damage(10)
+                    self.events.append("hurt")
+                    if player.health <= 0:
+                        self.die()
+
+                    player.shake_intensity = 15.0
+                    dx = player.x - proj.x
+                    if dx == 0: dx = 1
+                    direction = dx / abs(dx)
+                    player.vel_x = direction * 8
+                    player.vel_y = -4
+                    continue
+
+        # Effects Logic (pooled particles first, emitters only keep their timers)
+        self.particles.update()
+        for eff in effects[:]:
+            eff.update()
+            if eff.timer > eff.lifetime:
+                effects.remove(eff)
+
+        # Spike Logic (only spikes this mode collides with)
+        if level_index.spikes_hit.hits(player.get_rect(), player.is_white):
+            self.die()
+
+        # Enemy Logic
+        for enemy in self.enemies[:]:
+            enemy.update(player, level_index.solids, projectiles, offset=camera_offset)
+            if enemy.marked_for_deletion:
+                self.enemies.remove(enemy)
+                continue
+
+            enemy_rect = enemy.get_rect()
+            for proj in projectiles:
+                if proj.get_rect().colliderect(enemy_rect):
+                    if player.is_white and proj.is_player_shot:
+                        # Standardize damage
+                        if hasattr(enemy, 'take_damage'):
+                            dmg = 10
+                            if isinstance(enemy, ShadowSelf):
+                                dmg = 4 # Reduced from 10 to make boss tankier
+                            enemy.take_damage(dmg)
+                        else:
+                            # Fallback for old enemies
+                            enemy.take_damage("projectile")
+
+                        projectiles.release(proj)
+                        effects.append(SplatBlast(proj.x, proj.y, proj.color, self.particles))
+
+            if not player.is_white:
+                for eff in effects:
+                    if isinstance(eff, SlashWave):
+                        if eff.check_collision(enemy.get_rect()):
+                            enemy.take_damage("melee")
+                            effects.append(SplatBlast(enemy.x, enemy.y, WHITE, self.particles))
+
+                            if enemy.health <= 0:
+                                print("ENEMY KILLED! Healing Tension.")
+                                enemy.marked_for_deletion = True
+                                enemy.is_dead = True # Ensure flag is set
+                                self.tension = max(0.0, self.tension - 5.0)
+                            break
+
+            if enemy.get_rect().colliderect(player.get_rect()):
+                self.tension += 2.0
+                dx = player.x - enemy.x
+                if dx == 0: dx = 1
+                direction = dx / abs(dx)
+                player.vel_x = direction * 10
+                player.vel_y = -5
+                player.shake_intensity = 10.0
+                enemy.vel_x = -direction * 10
+
+        # Fall Death Check: Map is ~2000px high, so 3000 is a safe kill plane
+        if player.y > 3000:
+            self.die()
+
+        return self.events
+
+    def render(self, surface, tick_alpha=1.0, shake=True):
+        """Draws the world into surface (the canvas) tick_alpha of the way from the previous tick
+        to the current one, with screen shake (unless shake is False) and the tension distortion"""
+        player = self.player
+        scale_factor = surface.get_width() / SCREEN_WIDTH
+        offset_x = int(lerp(self.prev_scroll_x, self.scroll_x, tick_alpha))
+        offset_y = int(lerp(self.prev_scroll_y, self.scroll_y, tick_alpha))
+
+        if shake:
+            shake_amp = 20 * self.intensity * scale_factor
+            if self.overload_timer > 0:
+                shake_amp += self.overload_timer * 10 * scale_factor
+            shake_amp += player.shake_intensity * scale_factor
+
+            if shake_amp > 0:
+                offset_x += int((draw_random.random() - 0.5) * 2 * shake_amp)
+                offset_y += int((draw_random.random() - 0.5) * 2 * shake_amp)
+
+        self.interpolator.blend(tick_alpha)
+        draw_game(surface, player.is_white, player,
+                  platforms=self.platforms,
+                  projectiles=self.projectiles,
+                  particles=self.particles,
+                  effects=self.effects,
+                  background=self.background,
+                  spikes=self.spikes,
+                  enemies=self.enemies,
+                  offset=(offset_x, offset_y),
+                  portal=self.portal,
+                  level_index=self.level_index,
+                  tick_alpha=tick_alpha)
+        self.interpolator.restore()
+        self.distort(surface, self.intensity)
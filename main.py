@@ -4,7 +4,8 @@ import traceback
 from game.settings import SCREEN_WIDTH, SCREEN_HEIGHT
 from game import run as run_game
 from game.menu import MainMenu
-from game.settings_manager import load_settings, save_settings
+from game.settings_manager import load_settings
+from game.present import set_mode, set_icon, flip
 
 def main():
     pygame.init()
@@ -15,12 +16,13 @@ def main():
     
     # Apply Initial Video Settings
     # Use Native Fullscreen (Manual scaling in core/menu)
+    backend = settings.get("present_backend", "flip")
     if settings["fullscreen"]:
         flags = pygame.FULLSCREEN
-        screen = pygame.display.set_mode((0, 0), flags)
+        screen = set_mode((0, 0), flags, backend)
     else:
         flags = 0
-        screen = pygame.display.set_mode((SCREEN_WIDTH, SCREEN_HEIGHT), flags)
+        screen = set_mode((SCREEN_WIDTH, SCREEN_HEIGHT), flags, backend)
         
     pygame.display.set_caption("MonoMask")
     
@@ -29,16 +31,15 @@ def main():
     icon_path = os.path.join(os.path.dirname(__file__), "assets", "logo.jpeg")
     if os.path.exists(icon_path):
         icon = pygame.image.load(icon_path)
-        pygame.display.set_icon(icon)
+        set_icon(icon)
     
     clock = pygame.time.Clock()
     
     # State: MENU, GAME
     state = "MENU"
     
-    # Menu Canvas (Fixed size, scaled to screen)
-    menu_canvas = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT))
-    menu = MainMenu(menu_canvas, settings)
+    # Menu draws natively at the screen resolution
+    menu = MainMenu(screen, settings)
     
     running = True
     while running:
@@ -62,33 +63,25 @@ def main():
                 elif action == "quit":
                     running = False
                 elif action == "toggle_fullscreen":
-                    # Simple Toggle Implementation
-                    is_full = screen.get_flags() & pygame.FULLSCREEN
-                    
-                    if not is_full:
+                    # Simple Toggle Implementation (settings already hold the new state)
+                    if settings["fullscreen"]:
                         # Add Fullscreen flag (Native)
-                        screen = pygame.display.set_mode((0, 0), pygame.FULLSCREEN)
+                        screen = set_mode((0, 0), pygame.FULLSCREEN, backend)
                     else:
                         # Return to Windowed
-                        screen = pygame.display.set_mode((SCREEN_WIDTH, SCREEN_HEIGHT), 0)
+                        screen = set_mode((SCREEN_WIDTH, SCREEN_HEIGHT), 0, backend)
                     
-                    # Menu always draws to canvas, no update needed
+                    # Re-layout (and re-cache the static layers) for the new resolution
+                    menu.resize(screen)
             
             # Update Menu Animation (dt from 60 FPS cap)
             dt = clock.get_time() / 1000.0  # Convert ms to seconds
             menu.update(dt)
             
-            # Draw Menu to Canvas
+            # Draw Menu straight to the screen
             menu.draw()
             
-            # Scale Canvas to Screen
-            target_size = screen.get_size()
-            if target_size != (SCREEN_WIDTH, SCREEN_HEIGHT):
-                pygame.transform.smoothscale(menu_canvas, target_size, screen)
-            else:
-                screen.blit(menu_canvas, (0, 0))
-            
-            pygame.display.flip()
+            flip()
             
             # Cap menu FPS
             clock.tick(60)
@@ -110,12 +103,12 @@ def main():
                 
                 # Resync screen mode with settings (game might have toggled fullscreen)
                 if settings["fullscreen"]:
-                    screen = pygame.display.set_mode((0, 0), pygame.FULLSCREEN)
+                    screen = set_mode((0, 0), pygame.FULLSCREEN, backend)
                 else:
-                    screen = pygame.display.set_mode((SCREEN_WIDTH, SCREEN_HEIGHT), 0)
+                    screen = set_mode((SCREEN_WIDTH, SCREEN_HEIGHT), 0, backend)
                 
-                # Reinit menu with canvas (not screen)
-                menu = MainMenu(menu_canvas, settings) 
+                # Reinit menu for the (possibly new) screen
+                menu = MainMenu(screen, settings)
             elif result == "quit":
                 running = False
                 
@@ -0,0 +1,118 @@
+"""HitboxIndex (LevelIndex.spikes_hit / crystals_hit) against the per-frame checks it replaced:
+a colliderect loop over every spike and Platform.check_spike_collision on every platform"""
+import os
+import random
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+
+import pygame
+import pytest
+
+from game.sprites import Platform, Player, Spike
+from game.utils import HitboxIndex, LevelIndex
+from game.world import NEXT_LEVEL, build_level
+
+SAMPLES = 2000
+
+def random_rect(rng, bounds):
+    """Player sized rect somewhere in bounds, now and then zero or negative sized"""
+    x = rng.uniform(bounds.left - 100, bounds.right + 100)
+    y = rng.uniform(bounds.top - 100, bounds.bottom + 100)
+    w, h = rng.choice([(40, 60), (30, 50), (rng.randint(-60, 60), rng.randint(-60, 60)), (0, 60), (40, 0)])
+    return pygame.Rect(x, y, w, h)
+
+def level_bounds(platforms, spikes):
+    rects = [p.get_rect() for p in platforms] + [s.get_rect() for s in spikes]
+    return rects[0].unionall(rects[1:])
+
+def old_spike_hit(spikes, rect, player=None):
+    """core.run before the index: optionally only spikes the player's mode collides with"""
+    for spike in spikes:
+        if player is not None and not player.is_neutral_collision(spike):
+            continue
+        if spike.get_rect().colliderect(rect):
+            return True
+    return False
+
+def old_crystal_hit(platforms, rect):
+    return any(p.check_spike_collision(rect) for p in platforms)
+
+@pytest.fixture(scope="module", autouse=True)
+def pygame_init():
+    pygame.init()
+    yield
+    pygame.quit()
+
+@pytest.mark.parametrize("level", list(NEXT_LEVEL))
+def test_level_spikes(level):
+    random.seed(1)
+    _, platforms, spikes, _, _, _ = build_level(level)
+    index = LevelIndex(platforms, spikes)
+    player = Player(0, 0)
+    rng = random.Random(level)
+    bounds = level_bounds(platforms, spikes)
+    for _ in range(SAMPLES):
+        rect = random_rect(rng, bounds)
+        assert index.spikes_hit.hits(rect) == old_spike_hit(spikes, rect), rect
+        player.is_white = rng.random() < 0.5
+        assert index.spikes_hit.hits(rect, player.is_white) == old_spike_hit(spikes, rect, player), rect
+
+@pytest.mark.parametrize("level", list(NEXT_LEVEL))
+def test_level_crystals_with_moving_sliders(level):
+    random.seed(2)
+    _, platforms, spikes, _, _, _ = build_level(level)
+    index = LevelIndex(platforms, spikes)
+    rng = random.Random(level)
+    bounds = level_bounds(platforms, spikes)
+    for i in range(SAMPLES):
+        if i % 50 == 0:
+            # Sliders ride up for a while, then sink back
+            for slider in index.sliders:
+                slider.update(i % 400 < 200)
+        rect = random_rect(rng, bounds)
+        assert index.crystals_hit.hits(rect.inflate(-15, -10)) == old_crystal_hit(platforms, rect), rect
+
+def test_mystical_slider():
+    random.seed(3)
+    # Crystals grow from x=3000 on; a fractional speed leaves the crystal tops between pixels
+    slider = Platform(3500, 800.5, 600, 80, is_slider=True, is_mystical=True, slider_range=300)
+    slider.slide_speed = 2.75
+    still = Platform(4300, 800, 400, 80, is_white=False, is_mystical=True)
+    platforms = [slider, still]
+    index = LevelIndex(platforms, [])
+    assert slider.crystals and still.crystals and index.crystals_hit.moving
+    rng = random.Random(3)
+    bounds = pygame.Rect(3400, 400, 1400, 600)
+    for step in range(240):
+        slider.update(step < 150) # Up most of the way, then partly back down
+        for _ in range(40):
+            rect = random_rect(rng, bounds)
+            assert index.crystals_hit.hits(rect.inflate(-15, -10)) == old_crystal_hit(platforms, rect), (step, rect)
+
+def test_raw_boxes():
+    """Zero and negative sizes, fractional tops and mode masking on hand made boxes"""
+    rng = random.Random(4)
+    boxes = []
+    for _ in range(300):
+        boxes.append((rng.randint(0, 2000), rng.uniform(0, 1000), rng.randint(-40, 40), rng.randint(-40, 40),
+                      rng.random() < 0.5, rng.random() < 0.2, None))
+    boxes += [(100, 100.5, 0, 30, True, True, None), (200, 100, 30, 0, True, True, None)]
+    index = HitboxIndex(boxes)
+    bounds = pygame.Rect(0, 0, 2000, 1000)
+    for _ in range(SAMPLES * 2):
+        rect = random_rect(rng, bounds)
+        is_white = rng.choice([None, True, False])
+        expected = any(pygame.Rect(left, top, w, h).colliderect(rect) for left, top, w, h, white, neutral, _ in boxes
+                       if is_white is None or neutral or white == is_white)
+        assert index.hits(rect, is_white) == expected, (rect, is_white)
+
+def test_mode_masked_spikes():
+    spikes = [Spike(100, 100, is_white=True), Spike(200, 100, is_white=False), Spike(300, 100, is_neutral=True)]
+    index = LevelIndex([Platform(0, 200, 400, 50)], spikes)
+    white = pygame.Rect(110, 110, 20, 20)
+    black = pygame.Rect(210, 110, 20, 20)
+    neutral = pygame.Rect(310, 110, 20, 20)
+    assert index.spikes_hit.hits(white, True) and not index.spikes_hit.hits(white, False)
+    assert index.spikes_hit.hits(black, False) and not index.spikes_hit.hits(black, True)
+    assert index.spikes_hit.hits(neutral, True) and index.spikes_hit.hits(neutral, False)